@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Generic, List, Optional, TypeVar
 
+from core.__seedwork.domain.converters import DictConverter
 from core.__seedwork.domain.repositories import SearchResult
 
 Filter = TypeVar('Filter')
@@ -14,15 +15,23 @@ class SearchInput(Generic[Filter]):
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+    with_total: Optional[str] = None
 
 
 @dataclass(frozen=True, slots=True)
 class PaginationOutput(Generic[Item]):
     items: List[Item]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int
+    last_page: Optional[int]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    has_next: Optional[bool] = None
+    with_total: str = 'exact'
+
+    to_dict = DictConverter()
 
 
 Output = TypeVar('Output', bound=PaginationOutput)
@@ -42,5 +51,9 @@ class PaginationOutputMapper:
             total=result.total,
             current_page=result.current_page,
             per_page=result.per_page,
-            last_page=result.last_page
+            last_page=result.last_page,
+            next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
+            has_next=result.has_next,
+            with_total=result.with_total
         )
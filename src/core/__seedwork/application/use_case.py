@@ -10,3 +10,6 @@ class UseCase(Generic[Input, Output], ABC):  # pylint: disable=too-few-public-me
     @abstractmethod
     def execute(self, input_param: Input) -> Output:
         raise NotImplementedError()
+
+    async def execute_async(self, input_param: Input) -> Output:
+        raise NotImplementedError()
\ No newline at end of file
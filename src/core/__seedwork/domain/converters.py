@@ -0,0 +1,39 @@
+from dataclasses import fields
+from types import MethodType
+from typing import Any, Callable, Dict, Iterable, Optional
+
+ToDict = Callable[[Any], Dict[str, Any]]
+
+
+class DictConverter:
+    # a to_dict generated for each dataclass from its fields, the first time the
+    # class uses it, which builds the flat dict directly: unlike dataclasses.asdict
+    # the values are neither copied nor converted recursively.
+    # The dataclass decorator builds slotted classes after __init_subclass__ has
+    # run, so the fields are only known on first use, not at class creation
+
+    exclude: frozenset
+    extra: Dict[str, str]
+    _converters: Dict[type, ToDict]
+
+    def __init__(self, exclude: Iterable[str] = (), extra: Optional[Dict[str, str]] = None) -> None:
+        self.exclude = frozenset(exclude)
+        # keys added after the fields, mapped to the expression of their value on self
+        self.extra = extra or {}
+        self._converters = {}
+
+    def __get__(self, instance: Any, owner: type) -> ToDict:
+        try:
+            converter = self._converters[owner]
+        except KeyError:
+            converter = self._converters[owner] = self.generate(owner)
+        return converter if instance is None else MethodType(converter, instance)
+
+    def generate(self, cls: type) -> ToDict:
+        items = [f'{entry.name!r}: self.{entry.name}' for entry in fields(cls) if entry.name not in self.exclude]
+        items += [f'{key!r}: {expression}' for key, expression in self.extra.items()]
+        namespace: Dict[str, Any] = {}
+        exec(f'def to_dict(self):\n    return {{{", ".join(items)}}}\n', {}, namespace)  # pylint: disable=exec-used
+        converter = namespace['to_dict']
+        converter.__qualname__ = f'{cls.__qualname__}.to_dict'
+        return converter
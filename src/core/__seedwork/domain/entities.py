@@ -1,9 +1,24 @@
 from abc import ABC
-from dataclasses import Field, asdict, dataclass, field
+from dataclasses import MISSING, Field, dataclass, field
+import logging
+import random
 from typing import Any
 
+from core.__seedwork.domain.converters import DictConverter
+from core.__seedwork.domain.exceptions import EntityValidationException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
+logger = logging.getLogger(__name__)
+
+# share of restored entities that are validated anyway, to catch corrupt data:
+# below 1 failures are logged and the entity is still returned, at 1 they raise
+_restore_validation_rate = 0.0
+
+
+def set_restore_validation_rate(rate: float) -> None:
+    global _restore_validation_rate  # pylint: disable=global-statement
+    _restore_validation_rate = rate
+
 
 @dataclass(frozen=True, slots=True)
 class Entity(ABC):
@@ -17,11 +32,33 @@ class Entity(ABC):
         object.__setattr__(self, name, value)
         return self
 
-    def to_dict(self):
-        entity_dict = asdict(self)
-        entity_dict.pop("unique_entity_id")
-        entity_dict["id"] = self.id
-        return entity_dict
+    @classmethod
+    def restore(cls, **props: Any):
+        # builds an entity from persisted props, which were validated when they
+        # were saved, without running __post_init__ and its validation
+        if _restore_validation_rate and random.random() < _restore_validation_rate:
+            try:
+                return cls(**props)
+            except EntityValidationException as exception:
+                if _restore_validation_rate >= 1:
+                    raise
+                logger.warning(
+                    'Restored %s %s is not valid: %s', cls.__name__, props.get('unique_entity_id'), exception.error
+                )
+        entity = object.__new__(cls)
+        for name, entity_field in cls.__dataclass_fields__.items():  # pylint: disable=no-member
+            if name in props:
+                value = props[name]
+            elif entity_field.default is not MISSING:
+                value = entity_field.default
+            elif entity_field.default_factory is not MISSING:
+                value = entity_field.default_factory()
+            else:
+                raise TypeError(f"{cls.__name__}.restore() missing argument: '{name}'")
+            object.__setattr__(entity, name, value)
+        return entity
+
+    to_dict = DictConverter(exclude=("unique_entity_id",), extra={"id": "self.unique_entity_id.id"})
 
     @classmethod
     def get_field(cls, entity_field: str) -> Field:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 if TYPE_CHECKING:
     from core.__seedwork.domain.validators import ErrorFields
@@ -30,3 +30,11 @@ class LoadEntityException(Exception):
 
 class NotFoundException(Exception):
     pass
+
+
+class EntitiesNotFoundException(NotFoundException):
+    entity_ids: List[str]
+
+    def __init__(self, entity_ids: List[str]) -> None:
+        self.entity_ids = entity_ids
+        super().__init__('Entities not found using ids ' + ', '.join(f"'{entity_id}'" for entity_id in entity_ids))
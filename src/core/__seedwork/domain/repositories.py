@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
+import base64
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict
+import copy
 from dataclasses import dataclass, field
+import heapq
+import json
 import math
-from typing import Any, Generic, List, TypeVar, Optional
+from operator import itemgetter, neg
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, Generic, Iterator, List, Set, Tuple, TypeVar, Optional
 
+from core.__seedwork.domain.converters import DictConverter
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.__seedwork.domain.entities import Entity
-from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.exceptions import EntitiesNotFoundException, NotFoundException, ValidationException
 
 T = TypeVar('T', bound=Entity)
 
@@ -19,6 +29,15 @@ class RepositoryInterface(Generic[T], ABC):
     def bulk_insert(self, entities: List[T]) -> None:
         raise NotImplementedError()
 
+    def bulk_upsert(self, entities: List[T]) -> None:
+        raise NotImplementedError()
+
+    def bulk_update(self, entities: List[T]) -> None:
+        raise NotImplementedError()
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def find_by_id(self, entity_id: str | UniqueEntityId) -> T:
         raise NotImplementedError()
@@ -27,6 +46,9 @@ class RepositoryInterface(Generic[T], ABC):
     def find_all(self) -> List[T]:
         raise NotImplementedError()
 
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[T]:
+        raise NotImplementedError()
+
     @abstractmethod
     def update(self, entity: T) -> None:
         raise NotImplementedError()
@@ -35,6 +57,26 @@ class RepositoryInterface(Generic[T], ABC):
     def delete(self, entity_id: str | UniqueEntityId) -> None:
         raise NotImplementedError()
 
+    # the async methods default to the blocking ones, which is right for
+    # repositories that never wait on I/O; the others override them
+    async def ainsert(self, entity: T) -> None:
+        self.insert(entity)
+
+    async def abulk_insert(self, entities: List[T]) -> None:
+        self.bulk_insert(entities)
+
+    async def afind_by_id(self, entity_id: str | UniqueEntityId) -> T:
+        return self.find_by_id(entity_id)
+
+    async def afind_all(self) -> List[T]:
+        return self.find_all()
+
+    async def aupdate(self, entity: T) -> None:
+        self.update(entity)
+
+    async def adelete(self, entity_id: str | UniqueEntityId) -> None:
+        self.delete(entity_id)
+
 
 Input = TypeVar('Input')
 Output = TypeVar('Output')
@@ -48,9 +90,15 @@ class SearchableRepositoryInterface(Generic[T, Input, Output], RepositoryInterfa
     def search(self, input_params: Input) -> Output:
         raise NotImplementedError()
 
+    async def asearch(self, input_params: Input) -> Output:
+        return self.search(input_params)
+
 
 Filter = TypeVar('Filter', str, Any)
 
+# how the total of a search is found: counted, counted and cached for a while, or not at all
+TOTAL_MODES = ('exact', 'cached', 'none')
+
 
 @dataclass(slots=True, kw_only=True)
 class SearchParams(Generic[Filter]):
@@ -59,6 +107,8 @@ class SearchParams(Generic[Filter]):
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    cursor: Optional[str] = None
+    with_total: Optional[str] = 'exact'
 
     def __post_init__(self):
         self._normalize_page()
@@ -66,6 +116,8 @@ class SearchParams(Generic[Filter]):
         self._normalize_sort()
         self._normalize_sort_dir()
         self._normalize_filter()
+        self._normalize_cursor()
+        self._normalize_with_total()
 
     def _normalize_page(self):
         page = self._convert_to_int(self.page)
@@ -93,6 +145,13 @@ class SearchParams(Generic[Filter]):
     def _normalize_filter(self):
         self.filter = None if self.filter == '' or self.filter is None else str(self.filter)
 
+    def _normalize_cursor(self):
+        self.cursor = None if self.cursor == '' or self.cursor is None else str(self.cursor)
+
+    def _normalize_with_total(self):
+        with_total = None if self.with_total is None else str(self.with_total).lower()
+        self.with_total = with_total if with_total in TOTAL_MODES else self._get_dataclass_field('with_total').default
+
     def _convert_to_int(self, value: Any, default: int = 0) -> int:  # pylint: disable=no-self-use
         try:
             return int(value)
@@ -106,39 +165,109 @@ class SearchParams(Generic[Filter]):
 @dataclass(slots=True, kw_only=True, frozen=True)
 class SearchResult(Generic[T, Filter]):     # pylint: disable=too-many-instance-attributes
     items: List[T] = field(default_factory=lambda: [])
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int = field(init=False)
+    last_page: Optional[int] = field(init=False)
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
     filter: Optional[Filter] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    # without a total, the repository tells whether there is a next page
+    has_next: Optional[bool] = None
+    with_total: str = 'exact'
 
     def __post_init__(self):
-        object.__setattr__(self, 'last_page', math.ceil(self.total / self.per_page))
-
-    def to_dict(self):
-        return {
-            'items': self.items,
-            'total': self.total,
-            'current_page': self.current_page,
-            'per_page': self.per_page,
-            'last_page': self.last_page,
-            'sort': self.sort,
-            'sort_dir': self.sort_dir,
-            'filter': self.filter
-        }
+        last_page = None if self.total is None else math.ceil(self.total / self.per_page)
+        object.__setattr__(self, 'last_page', last_page)
+        if self.has_next is None and last_page is not None:
+            object.__setattr__(self, 'has_next', self.current_page < last_page)
+
+    to_dict = DictConverter()
+
+
+@dataclass(slots=True, frozen=True)
+class SearchCursor:
+    # an opaque position in a listing ordered by (sort, id): the page starts
+    # right after (is_before=False) or ends right before (is_before=True) the entity
+    # with this sort value and id
+    sort: str
+    sort_dir: str
+    value: Any
+    id: str  # pylint: disable=invalid-name
+    is_before: bool = False
+
+    @staticmethod
+    def from_entity(entity: Entity, sort: str, sort_dir: str, is_before: bool = False) -> 'SearchCursor':
+        return SearchCursor(sort, sort_dir, getattr(entity, sort), entity.id, is_before)
+
+    def encode(self) -> str:
+        data = [self.sort, self.sort_dir, self.value, self.id, self.is_before]
+        return base64.urlsafe_b64encode(json.dumps(data, default=str).encode()).decode()
+
+    @staticmethod
+    def decode(cursor: str) -> 'SearchCursor':
+        try:
+            sort, sort_dir, value, entity_id, is_before = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError) as exception:
+            raise ValidationException(f"Invalid cursor '{cursor}'") from exception
+        return SearchCursor(sort, sort_dir, value, entity_id, bool(is_before))
 
 
 @dataclass(slots=True)
 class InMemoryRepository(RepositoryInterface[T], ABC):
-    items: List[T] = field(default_factory=lambda: [])
+    # entities are kept under a monotonic key, so key order is insertion order;
+    # _index maps an id to the key of its first occurrence and _shadowed keeps
+    # the keys of repeated ids (the same entity inserted more than once)
+    _entries: Dict[int, T] = field(default_factory=dict, init=False, repr=False)
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _shadowed: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+    _next_key: int = field(default=0, init=False, repr=False)
+    # bulk inserted entities go first, under keys counting down from _first_key;
+    # they are added at the end of _entries, which is put back in key order on the next read
+    _first_key: int = field(default=0, init=False, repr=False)
+    _is_ordered: bool = field(default=True, init=False, repr=False)
+    # bumped on every write, so readers can tell whether derived data is stale
+    _version: int = field(default=0, init=False, repr=False)
+
+    @property
+    def items(self) -> List[T]:
+        return list(self._get_entries().values())
+
+    @items.setter
+    def items(self, entities: List[T]) -> None:
+        self._entries = {}
+        self._index = {}
+        self._shadowed = {}
+        self._first_key = self._next_key
+        self._is_ordered = True
+        self._version += 1
+        self._on_clear()
+        # built in one pass instead of an _add each, the keys count up from _next_key
+        keys = range(self._next_key, self._next_key + len(entities))
+        self._next_key = keys.stop
+        self._entries = dict(zip(keys, entities))
+        ids = [entity.id for entity in entities]
+        # reversed, so that the first occurrence of a repeated id is the one kept
+        self._index = dict(zip(reversed(ids), reversed(keys)))
+        if len(self._index) < len(ids):
+            for key, entity_id in zip(keys, ids):
+                if self._index[entity_id] != key:
+                    self._shadowed.setdefault(entity_id, []).append(key)
+        self._on_add_many(list(zip(keys, entities)))
 
     def insert(self, entity: T) -> None:
-        self.items.append(entity)
+        self._add(entity)
 
     def bulk_insert(self, entities: List[T]) -> None:
-        self.items = entities + self.items
+        if self._entries and entities:
+            self._is_ordered = False
+        self._first_key -= len(entities)
+        items = list(enumerate(entities, self._first_key))
+        for key, entity in items:
+            self._store(key, entity)
+        self._on_add_many(items)
 
     def find_by_id(self, entity_id: str | UniqueEntityId) -> T:
         id_str = str(entity_id)
@@ -147,35 +276,333 @@ class InMemoryRepository(RepositoryInterface[T], ABC):
     def find_all(self) -> List[T]:
         return self.items
 
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[T]:  # pylint: disable=unused-argument
+        # the entities are in memory already, only their references are copied
+        # so that writes made while iterating do not break the iteration
+        return iter(self.items)
+
     def update(self, entity: T) -> None:
-        entity_found = self._get(entity.id)
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        self._replace(self._get_key(entity.id), entity)
+
+    def bulk_update(self, entities: List[T]) -> None:
+        # every id is checked before anything changes, so a failed batch is not half applied
+        missing_ids = [entity.id for entity in entities if entity.id not in self._index]
+        if missing_ids:
+            raise EntitiesNotFoundException(missing_ids)
+        for entity in entities:
+            self._replace(self._index[entity.id], entity)
 
     def delete(self, entity_id: str | UniqueEntityId) -> None:
-        entity_found = self._get(str(entity_id))
-        self.items.remove(entity_found)
+        id_str = str(entity_id)
+        self._remove(id_str, self._get_key(id_str))
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        # an id repeated in the batch needs as many stored occurrences
+        id_counts = Counter(map(str, entity_ids))
+        missing_ids = [
+            id_str for id_str, count in id_counts.items()
+            if (id_str in self._index) + len(self._shadowed.get(id_str, ())) < count
+        ]
+        if missing_ids:
+            raise EntitiesNotFoundException(missing_ids)
+        for id_str in map(str, entity_ids):
+            self._remove(id_str, self._index[id_str])
+
+    def _add(self, entity: T) -> None:
+        key = self._next_key
+        self._next_key += 1
+        self._put(key, entity)
+
+    def _put(self, key: int, entity: T) -> None:
+        self._store(key, entity)
+        self._on_add(key, entity)
+
+    def _store(self, key: int, entity: T) -> None:
+        self._version += 1
+        self._entries[key] = entity
+        entity_id = entity.id
+        first_key = self._index.get(entity_id)
+        if first_key is None:
+            self._index[entity_id] = key
+        elif key < first_key:
+            self._index[entity_id] = key
+            insort(self._shadowed.setdefault(entity_id, []), first_key)
+        else:
+            insort(self._shadowed.setdefault(entity_id, []), key)
+
+    def _replace(self, key: int, entity: T) -> None:
+        self._version += 1
+        self._on_remove(key, self._entries[key])
+        self._entries[key] = entity
+        self._on_add(key, entity)
+
+    def _remove(self, entity_id: str, key: int) -> None:
+        self._version += 1
+        self._on_remove(key, self._entries.pop(key))
+        shadowed = self._shadowed.get(entity_id)
+        if shadowed:
+            self._index[entity_id] = shadowed.pop(0)
+            if not shadowed:
+                del self._shadowed[entity_id]
+        else:
+            del self._index[entity_id]
+
+    def _get_entries(self) -> Dict[int, T]:
+        if not self._is_ordered:
+            self._entries = dict(sorted(self._entries.items(), key=itemgetter(0)))
+            self._is_ordered = True
+        return self._entries
 
     def _get(self, entity_id: str) -> T:
-        entity = next(filter(lambda item: item.id == entity_id, self.items), None)
-        if not entity:
+        return self._entries[self._get_key(entity_id)]
+
+    def _get_key(self, entity_id: str) -> int:
+        key = self._index.get(entity_id)
+        if key is None:
             raise NotFoundException(f"Entity not found using id '{entity_id}'")
-        return entity
+        return key
+
+    def clone(self) -> 'InMemoryRepository[T]':
+        repository = copy.copy(self)
+        repository._entries = dict(self._entries)
+        repository._index = dict(self._index)
+        repository._shadowed = {entity_id: list(keys) for entity_id, keys in self._shadowed.items()}
+        return repository
+
+    # hooks for subclasses keeping their own indexes in sync with the entries
+    def _on_add(self, key: int, entity: T) -> None:
+        pass
+
+    def _on_add_many(self, items: List[Tuple[int, T]]) -> None:
+        for key, entity in items:
+            self._on_add(key, entity)
+
+    def _on_remove(self, key: int, entity: T) -> None:
+        pass
 
+    def _on_clear(self) -> None:
+        pass
+
+
+@dataclass(slots=True)
+class SortedIndex:
+    field_name: str
+    entries: List[Tuple[Any, int]] = field(default_factory=lambda: [])
+    values: Dict[int, Any] = field(default_factory=dict)
+
+    @staticmethod
+    def build(field_name: str, entities: Dict[int, Entity]) -> 'SortedIndex':
+        index = SortedIndex(field_name)
+        index.values = {key: getattr(entity, field_name) for key, entity in entities.items()}
+        index.entries = sorted((value, key) for key, value in index.values.items())
+        return index
+
+    def copy(self) -> 'SortedIndex':
+        return SortedIndex(self.field_name, list(self.entries), dict(self.values))
+
+    def add(self, key: int, entity: Entity) -> None:
+        value = getattr(entity, self.field_name)
+        self.values[key] = value
+        insort(self.entries, (value, key))
+
+    def add_many(self, items: List[Tuple[int, Entity]]) -> None:
+        # one sort, which merges the sorted entries with the new ones, instead of an insort each
+        for key, entity in items:
+            value = getattr(entity, self.field_name)
+            self.values[key] = value
+            self.entries.append((value, key))
+        self.entries.sort()
+
+    def remove(self, key: int) -> None:
+        # the stored value is used because entities may have been changed in place before update()
+        value = self.values.pop(key)
+        del self.entries[bisect_left(self.entries, (value, key))]
+
+    def slice(self, start: int, stop: int, reverse: bool = False) -> List[int]:
+        entries = self.entries
+        if not reverse:
+            return [key for _, key in entries[start:stop]]
+
+        size = len(entries)
+        low, high = max(size - stop, 0), size - start
+        if low >= high:
+            return []
+        # sorted(reverse=True) keeps equal values in insertion order, so the
+        # window is widened to whole runs of equal values before reversing
+        low = bisect_left(entries, (entries[low][0],), 0, low)
+        high = bisect_right(entries, (entries[high - 1][0], math.inf), high)
+        keys = []
+        end = high
+        while end > low:
+            begin = bisect_left(entries, (entries[end - 1][0],), low, end)
+            keys.extend(key for _, key in entries[begin:end])
+            end = begin
+        offset = start - (size - high)
+        return keys[offset:offset + stop - start]
+
+
+@dataclass(slots=True)
+class NGramIndex:
+    size: int = 3
+    texts: Dict[int, str] = field(default_factory=dict)
+    postings: Dict[str, Set[int]] = field(default_factory=dict)
+    # the grams whose key sets belong to this index; the others are shared with
+    # the index it was copied from and are copied the first time they change
+    _owned: Set[str] = field(default_factory=set, repr=False)
+
+    def copy(self) -> 'NGramIndex':
+        # both indexes give up the shared sets, so neither changes the other's
+        self._owned = set()
+        return NGramIndex(self.size, dict(self.texts), dict(self.postings))
+
+    def add(self, key: int, text: str) -> None:
+        text = text.lower()
+        self.texts[key] = text
+        for gram in self._grams(text):
+            self._own(gram).add(key)
+
+    def remove(self, key: int) -> None:
+        for gram in self._grams(self.texts.pop(key)):
+            keys = self._own(gram)
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+                self._owned.discard(gram)
+
+    def clear(self) -> None:
+        self.texts = {}
+        self.postings = {}
+        self._owned = set()
+
+    def search(self, term: str) -> Set[int]:
+        term = term.lower()
+        grams = self._grams(term)
+        if not grams:
+            return {key for key, text in self.texts.items() if term in text}
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return {key for key in candidates if term in self.texts[key]}
+
+    def _grams(self, text: str) -> Set[str]:
+        return {text[i:i + self.size] for i in range(len(text) - self.size + 1)}
+
+    def _own(self, gram: str) -> Set[int]:
+        if gram in self._owned:
+            return self.postings[gram]
+        self._owned.add(gram)
+        keys = self.postings[gram] = set(self.postings.get(gram, ()))
+        return keys
+
+
+@dataclass(slots=True)
+class TotalCache:
+    # totals of searches kept for ttl seconds; writes through the repository clear
+    # it, writes made by other processes are seen once the ttl runs out
+    ttl: float = 30.0
+    max_size: int = 1024
+    _totals: Dict[Any, Tuple[int, float]] = field(default_factory=dict, repr=False)
 
+    def get(self, key: Any) -> Optional[int]:
+        entry = self._totals.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def put(self, key: Any, total: int) -> None:
+        if len(self._totals) >= self.max_size:
+            self._totals.clear()
+        self._totals[key] = (total, time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        self._totals.clear()
+
+
+@dataclass(slots=True)
+class SearchCache:
+    max_size: int = 128
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    version: int = 0
+    _results: OrderedDict = field(default_factory=OrderedDict, repr=False)
+    # readers sharing a snapshot share its cache, see CopyOnWriteRepository
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def get(self, key: Tuple, version: int) -> SearchResult | None:
+        with self._lock:
+            if version != self.version:
+                self._results.clear()
+                self.version = version
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Tuple, version: int, result: SearchResult) -> None:
+        with self._lock:
+            if self.max_size <= 0 or version != self.version:
+                return
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+@dataclass(slots=True)
 class InMemorySearchableRepository(
     Generic[T, Filter],
     InMemoryRepository[T],
     SearchableRepositoryInterface[T, SearchParams[Filter], SearchResult[T, Filter]],
     ABC
 ):
+    default_sort: ClassVar[Optional[str]] = None
+    default_sort_dir: ClassVar[Optional[str]] = None
+    # a bounded heap selection replaces the full sort when the requested window
+    # (page * per_page) is at most this fraction of the filtered entities
+    top_k_max_ratio: ClassVar[float] = 0.01
+    _sorted_indexes: Dict[str, SortedIndex] = field(default_factory=dict, init=False, repr=False)
+    search_cache: SearchCache = field(default_factory=SearchCache, init=False, repr=False)
+
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[T, Filter]:
-        filtered_items = self._apply_filter(self.items, input_params.filter)
-        sorted_items = self._apply_sort(filtered_items, input_params.sort, input_params.sort_dir)
-        paginated_items = self._apply_paginate(sorted_items, input_params.page, input_params.per_page)
+        cache_key = (
+            input_params.page, input_params.per_page, input_params.sort, input_params.sort_dir, input_params.filter
+        )
+        result = self.search_cache.get(cache_key, self._version)
+        if result is None:
+            result = self._search(input_params)
+            self.search_cache.put(cache_key, self._version, result)
+        return result
+
+    def _search(self, input_params: SearchParams[Filter]) -> SearchResult[T, Filter]:
+        sort, sort_dir = (input_params.sort, input_params.sort_dir) \
+            if input_params.sort \
+            else (self.default_sort, self.default_sort_dir)
+
+        is_sortable = bool(sort) and sort in self.sortable_fields
+        filtered_keys = self._find_filtered_keys(input_params.filter) if input_params.filter else None
+        if filtered_keys is not None:
+            paginated_items, total = self._search_keys(
+                filtered_keys, input_params, sort if is_sortable else None, sort_dir == 'desc'
+            )
+        elif is_sortable:
+            paginated_items, total = self._search_sorted(input_params, sort, sort_dir == 'desc')
+        else:
+            filtered_items = self._apply_filter(self.items, input_params.filter)
+            sorted_items = self._apply_sort(filtered_items, sort, sort_dir)
+            paginated_items = self._apply_paginate(sorted_items, input_params.page, input_params.per_page)
+            total = len(filtered_items)
+
         return SearchResult(
             items=paginated_items,
-            total=len(filtered_items),
+            total=total,
             current_page=input_params.page,
             per_page=input_params.per_page,
             sort=input_params.sort,
@@ -183,11 +610,91 @@ class InMemorySearchableRepository(
             filter=input_params.filter
         )
 
+    def _search_sorted(self, input_params: SearchParams[Filter], sort: str, is_reverse: bool) -> Tuple[List[T], int]:
+        index = self._get_sorted_index(sort)
+        total = len(self._entries)
+        if not input_params.filter:
+            start = (input_params.page - 1) * input_params.per_page
+            keys = index.slice(start, start + input_params.per_page, is_reverse)
+            return [self._entries[key] for key in keys], total
+
+        sorted_items = [self._entries[key] for key in index.slice(0, total, is_reverse)]
+        filtered_items = self._apply_filter(sorted_items, input_params.filter)
+        return self._apply_paginate(filtered_items, input_params.page, input_params.per_page), len(filtered_items)
+
+    def _search_keys(
+        self, keys: Set[int], input_params: SearchParams[Filter], sort: str | None, is_reverse: bool
+    ) -> Tuple[List[T], int]:
+        limit = input_params.page * input_params.per_page
+        use_top_k = limit <= len(keys) * self.top_k_max_ratio
+        if not sort:
+            ordered_keys = heapq.nsmallest(limit, keys) if use_top_k else sorted(keys)
+        elif use_top_k:
+            values = self._get_sorted_index(sort).values
+            ordered_keys = self._select_top_keys(keys, values, limit, is_reverse)
+        else:
+            # keys are sorted first so ties keep the insertion order, as in _apply_sort
+            values = self._get_sorted_index(sort).values
+            ordered_keys = sorted(keys)
+            ordered_keys.sort(key=values.__getitem__, reverse=is_reverse)
+        paginated_keys = self._apply_paginate(ordered_keys, input_params.page, input_params.per_page)
+        return [self._entries[key] for key in paginated_keys], len(keys)
+
+    @staticmethod
+    def _select_top_keys(keys: Set[int], values: Dict[int, Any], limit: int, is_reverse: bool) -> List[int]:
+        # ties are broken by key (insertion order) in both directions, like the stable full sort
+        if is_reverse:
+            selected = heapq.nlargest(limit, zip(map(values.__getitem__, keys), map(neg, keys)))
+            return [-key for _, key in selected]
+        selected = heapq.nsmallest(limit, zip(map(values.__getitem__, keys), keys))
+        return [key for _, key in selected]
+
+    def _find_filtered_keys(self, filter_param: Filter) -> Set[int] | None:  # pylint: disable=unused-argument
+        # repositories holding an index for their filter return the matching keys,
+        # None means the filter is applied to the entities with _apply_filter
+        return None
+
+    def clone(self) -> 'InMemorySearchableRepository[T, Filter]':
+        repository = InMemoryRepository.clone(self)
+        repository._sorted_indexes = {sort: index.copy() for sort, index in self._sorted_indexes.items()}
+        repository.search_cache = SearchCache(max_size=self.search_cache.max_size)
+        return repository
+
+    def prepare_snapshot(self) -> None:
+        # builds up front what reads would otherwise build lazily, so that
+        # readers never change a snapshot published by CopyOnWriteRepository
+        self._get_entries()
+        for sort in self.sortable_fields:
+            self._get_sorted_index(sort)
+
+    def _get_sorted_index(self, sort: str) -> SortedIndex:
+        index = self._sorted_indexes.get(sort)
+        if index is None:
+            index = self._sorted_indexes[sort] = SortedIndex.build(sort, self._entries)
+        return index
+
+    def _on_add(self, key: int, entity: T) -> None:
+        for index in self._sorted_indexes.values():
+            index.add(key, entity)
+
+    def _on_add_many(self, items: List[Tuple[int, T]]) -> None:
+        for index in self._sorted_indexes.values():
+            index.add_many(items)
+
+    def _on_remove(self, key: int, entity: T) -> None:  # pylint: disable=unused-argument
+        for index in self._sorted_indexes.values():
+            index.remove(key)
+
+    def _on_clear(self) -> None:
+        self._sorted_indexes = {}
+
     @abstractmethod
     def _apply_filter(self, items: List[T], filter_param: Filter | None) -> List[T]:
         raise NotImplementedError()
 
     def _apply_sort(self, items: List[T], sort: str | None,  sort_dir: str | None) -> List[T]:
+        if not sort:
+            sort, sort_dir = self.default_sort, self.default_sort_dir
         if sort and sort in self.sortable_fields:
             is_reverse = sort_dir == 'desc'
             return sorted(items, key=lambda item: getattr(item, sort), reverse=is_reverse)
@@ -197,3 +704,74 @@ class InMemorySearchableRepository(
         start = (page - 1) * per_page
         limit = start + per_page
         return items[slice(start, limit)]
+
+
+class CopyOnWriteRepository(SearchableRepositoryInterface[T, Input, Output], ABC):
+    # the wrapped repository is treated as an immutable snapshot: readers use
+    # whatever snapshot is published without locking, while writers (one at a
+    # time) apply their change to a clone and publish it by swapping the reference.
+    # A write copies the entries and the indexes, so it costs O(n): meant for
+    # read-mostly data shared between threads
+
+    _snapshot: InMemorySearchableRepository
+    _write_lock: threading.Lock
+
+    def __init__(self, repository: InMemorySearchableRepository) -> None:
+        repository.prepare_snapshot()
+        self._snapshot = repository
+        self._write_lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> InMemorySearchableRepository:
+        return self._snapshot
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self._snapshot.sortable_fields
+
+    @property
+    def items(self) -> List[T]:
+        return self._snapshot.items
+
+    @items.setter
+    def items(self, entities: List[T]) -> None:
+        self._write(lambda repository: setattr(repository, 'items', entities))
+
+    def insert(self, entity: T) -> None:
+        self._write(lambda repository: repository.insert(entity))
+
+    def bulk_insert(self, entities: List[T]) -> None:
+        self._write(lambda repository: repository.bulk_insert(entities))
+
+    def bulk_update(self, entities: List[T]) -> None:
+        self._write(lambda repository: repository.bulk_update(entities))
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        self._write(lambda repository: repository.bulk_delete(entity_ids))
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> T:
+        # a copy, since entities are changed in place before update() and the
+        # published snapshot must not change under the readers
+        return copy.copy(self._snapshot.find_by_id(entity_id))
+
+    def find_all(self) -> List[T]:
+        return self._snapshot.find_all()
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[T]:
+        return self._snapshot.iter_all(chunk_size)
+
+    def update(self, entity: T) -> None:
+        self._write(lambda repository: repository.update(entity))
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        self._write(lambda repository: repository.delete(entity_id))
+
+    def search(self, input_params: Input) -> Output:
+        return self._snapshot.search(input_params)
+
+    def _write(self, operation: Callable[[InMemorySearchableRepository], None]) -> None:
+        with self._write_lock:
+            repository = self._snapshot.clone()
+            operation(repository)
+            repository.prepare_snapshot()
+            self._snapshot = repository
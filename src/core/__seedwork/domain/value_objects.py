@@ -22,6 +22,9 @@ class ValueObject(ABC):
 class UniqueEntityId(ValueObject):
     id: str = field(default_factory=lambda: str(uuid.uuid4()))  # pylint: disable=invalid-name
 
+    def __str__(self) -> str:
+        return self.id
+
     def __post_init__(self):
         id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
         object.__setattr__(self, "id", id_value)
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Iterator, List
+from django.core.cache import BaseCache, caches
+from core.__seedwork.domain.repositories import T, Input, Output, SearchableRepositoryInterface
+from core.__seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(slots=True)
+class CacheStats:
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedRepository(SearchableRepositoryInterface[T, Input, Output]):
+    # read-through cache of find_by_id in one of the Django caches; writes go
+    # to the wrapped repository first and then drop the entries they touched.
+    # A lookup racing a write may cache the old entity, for ttl seconds at most.
+    # Only a cache shared by all the processes sees the drops of the others
+
+    _repository: SearchableRepositoryInterface[T, Input, Output]
+    key_prefix: str
+    cache_alias: str
+    ttl: int
+    stats: CacheStats
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[T, Input, Output],
+        key_prefix: str,
+        cache_alias: str = 'default',
+        ttl: int = 300
+    ) -> None:
+        self._repository = repository
+        self.key_prefix = key_prefix
+        self.cache_alias = cache_alias
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self._repository.sortable_fields
+
+    @property
+    def _cache(self) -> BaseCache:
+        # Django gives every thread its own cache instance
+        return caches[self.cache_alias]
+
+    def insert(self, entity: T) -> None:
+        self._repository.insert(entity)
+
+    def bulk_insert(self, entities: List[T]) -> None:
+        self._repository.bulk_insert(entities)
+
+    def bulk_upsert(self, entities: List[T]) -> None:
+        self._repository.bulk_upsert(entities)
+        self._cache.delete_many([self._key(entity.id) for entity in entities])
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> T:
+        key = self._key(entity_id)
+        entity = self._cache.get(key)
+        if entity is not None:
+            self.stats.hits += 1
+            return entity
+        self.stats.misses += 1
+        entity = self._repository.find_by_id(entity_id)
+        self._cache.set(key, entity, self.ttl)
+        return entity
+
+    def find_all(self) -> List[T]:
+        return self._repository.find_all()
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[T]:
+        return self._repository.iter_all(chunk_size)
+
+    def update(self, entity: T) -> None:
+        self._repository.update(entity)
+        self._cache.delete(self._key(entity.id))
+
+    def bulk_update(self, entities: List[T]) -> None:
+        self._repository.bulk_update(entities)
+        self._cache.delete_many([self._key(entity.id) for entity in entities])
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        self._repository.delete(entity_id)
+        self._cache.delete(self._key(entity_id))
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        self._repository.bulk_delete(entity_ids)
+        self._cache.delete_many([self._key(entity_id) for entity_id in entity_ids])
+
+    def search(self, input_params: Input) -> Output:
+        return self._repository.search(input_params)
+
+    async def ainsert(self, entity: T) -> None:
+        await self._repository.ainsert(entity)
+
+    async def abulk_insert(self, entities: List[T]) -> None:
+        await self._repository.abulk_insert(entities)
+
+    async def afind_by_id(self, entity_id: str | UniqueEntityId) -> T:
+        key = self._key(entity_id)
+        entity = await self._cache.aget(key)
+        if entity is not None:
+            self.stats.hits += 1
+            return entity
+        self.stats.misses += 1
+        entity = await self._repository.afind_by_id(entity_id)
+        await self._cache.aset(key, entity, self.ttl)
+        return entity
+
+    async def afind_all(self) -> List[T]:
+        return await self._repository.afind_all()
+
+    async def aupdate(self, entity: T) -> None:
+        await self._repository.aupdate(entity)
+        await self._cache.adelete(self._key(entity.id))
+
+    async def adelete(self, entity_id: str | UniqueEntityId) -> None:
+        await self._repository.adelete(entity_id)
+        await self._cache.adelete(self._key(entity_id))
+
+    async def asearch(self, input_params: Input) -> Output:
+        return await self._repository.asearch(input_params)
+
+    def _key(self, entity_id: str | UniqueEntityId) -> str:
+        return f'{self.key_prefix}:{entity_id}'
@@ -0,0 +1,68 @@
+from contextvars import ContextVar, Token
+import random
+from typing import List, Optional, Tuple
+from django.conf import settings
+
+PRIMARY_DATABASE = 'default'
+
+# set by the first write of a context started with start_context (a request,
+# a task); from then on it reads from the primary too, so it sees its own writes.
+# None outside of one, where nothing would ever clear it, so reads stay on the primary
+_has_written: ContextVar[Optional[bool]] = ContextVar('has_written', default=None)
+# set for a whole request that comes within the window after a write
+_is_pinned: ContextVar[bool] = ContextVar('is_pinned', default=False)
+
+
+def replica_databases() -> List[str]:
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def routed_app_labels() -> List[str]:
+    return getattr(settings, 'DATABASE_REPLICA_APP_LABELS', [])
+
+
+def has_written() -> bool:
+    return bool(_has_written.get())
+
+
+def start_context(is_pinned: bool = False) -> Tuple[Token, Token]:
+    return _has_written.set(False), _is_pinned.set(is_pinned)
+
+
+def end_context(tokens: Tuple[Token, Token]) -> None:
+    has_written_token, is_pinned_token = tokens
+    _has_written.reset(has_written_token)
+    _is_pinned.reset(is_pinned_token)
+
+
+class PrimaryReplicaRouter:
+    # reads of the models in settings.DATABASE_REPLICA_APP_LABELS go to one of
+    # settings.DATABASE_REPLICAS and their writes to the primary; other models
+    # (auth, sessions...) and everything without replicas use the primary
+
+    def db_for_read(self, model, **_hints) -> str | None:
+        if not self._is_routed(model):
+            return None
+        replicas = replica_databases()
+        if not replicas or _has_written.get() is not False or _is_pinned.get():
+            return PRIMARY_DATABASE
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **_hints) -> str | None:
+        if not self._is_routed(model):
+            return None
+        if _has_written.get() is False:
+            _has_written.set(True)
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **_hints) -> bool | None:
+        # replicas hold the same rows as the primary
+        databases = {PRIMARY_DATABASE, *replica_databases()}
+        if self._is_routed(obj1) and self._is_routed(obj2) \
+                and obj1._state.db in databases and obj2._state.db in databases:  # pylint: disable=protected-access
+            return True
+        return None
+
+    @staticmethod
+    def _is_routed(model) -> bool:
+        return model._meta.app_label in routed_app_labels()  # pylint: disable=protected-access
@@ -0,0 +1,110 @@
+from contextlib import ExitStack
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.decorators import sync_and_async_middleware
+from core.__seedwork.infra.django import db_routers
+from core.__seedwork.infra.django.query_budget import QueryStats, record_queries
+
+logger = logging.getLogger(__name__)
+
+# the key of a view's query_budgets, by HTTP method and whether the URL names an object
+_ACTIONS = {
+    ('get', False): 'list',
+    ('get', True): 'retrieve',
+    ('post', False): 'create',
+    ('put', True): 'update',
+    ('patch', True): 'partial_update',
+    ('delete', True): 'destroy',
+}
+
+
+@sync_and_async_middleware
+class PrimaryPinningMiddleware:
+    # read-your-writes window: a request that writes gets a cookie, and the
+    # client's requests read from the primary until it expires, giving the
+    # replicas time to catch up. The flags are context variables, which
+    # sync_to_async carries to the ORM's thread and back under ASGI
+
+    cookie_name = 'pin_primary'
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = db_routers.start_context(is_pinned=self.cookie_name in request.COOKIES)
+        try:
+            return self.pin(self.get_response(request))
+        finally:
+            db_routers.end_context(tokens)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        tokens = db_routers.start_context(is_pinned=self.cookie_name in request.COOKIES)
+        try:
+            return self.pin(await self.get_response(request))
+        finally:
+            db_routers.end_context(tokens)
+
+    def pin(self, response: HttpResponse) -> HttpResponse:
+        seconds = getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 0)
+        if db_routers.has_written() and db_routers.replica_databases() and seconds:
+            response.set_cookie(self.cookie_name, '1', max_age=seconds, httponly=True, samesite='Lax')
+        return response
+
+
+@sync_and_async_middleware
+class QueryBudgetMiddleware:
+    # counts and times the SQL of every request, reported in the X-Query-Count
+    # and Server-Timing headers with DEBUG or QUERY_COUNT_HEADERS on; views declare
+    # query_budgets per action, as in DRF viewsets (see CategoryResource), and going
+    # over them is logged
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with record_queries() as stats:
+            response = self.get_response(request)
+        return self.report(request, response, stats)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # connections belong to a thread, so the wrappers are installed on the
+        # ones of the thread that sync_to_async runs the request's queries in
+        stack = ExitStack()
+        stats = await sync_to_async(stack.enter_context)(record_queries())
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, stats)
+
+    @staticmethod
+    def report(request: HttpRequest, response: HttpResponse, stats: QueryStats) -> HttpResponse:
+        if settings.DEBUG or getattr(settings, 'QUERY_COUNT_HEADERS', False):
+            response['X-Query-Count'] = str(stats.count)
+            response['Server-Timing'] = f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries"'
+
+        budget: Optional[int] = getattr(request, 'query_budget', None)
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                '%s %s ran %d queries, over its budget of %d', request.method, request.path, stats.count, budget
+            )
+        return response
+
+    def process_view(
+        self, request: HttpRequest, view_func: Callable[..., Any], view_args: Any, view_kwargs: Any
+    ) -> None:
+        # as_view() keeps the view class in view_func.cls
+        budgets: Dict[str, int] = getattr(getattr(view_func, 'cls', None), 'query_budgets', {})
+        action = _ACTIONS.get((request.method.lower(), bool(view_args or view_kwargs)))
+        request.query_budget = budgets.get(action)
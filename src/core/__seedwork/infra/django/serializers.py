@@ -7,10 +7,14 @@ class UUIDSerializer(serializers.Serializer): # pylint: disable=abstract-method
     id = serializers.UUIDField()
 
 class PaginationSerializer(serializers.Serializer): # pylint: disable=abstract-method
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
-    last_page = serializers.IntegerField()
+    last_page = serializers.IntegerField(allow_null=True)
+    next_cursor = serializers.CharField(allow_null=True)
+    prev_cursor = serializers.CharField(allow_null=True)
+    has_next = serializers.BooleanField(allow_null=True)
+    with_total = serializers.CharField()
 
 class ResourceSerializer(serializers.Serializer): # pylint: disable=abstract-method
     
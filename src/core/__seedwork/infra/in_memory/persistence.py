@@ -0,0 +1,336 @@
+from collections import deque
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, fields
+import gc
+import io
+import mmap
+import os
+from itertools import repeat
+from pathlib import Path
+import pickle
+import struct
+import threading
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type
+import zlib
+
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.repositories import T, Input, Output, SearchableRepositoryInterface
+from core.__seedwork.domain.value_objects import UniqueEntityId
+
+INSERT = 1
+BULK_INSERT = 2
+UPDATE = 3
+DELETE = 4
+BULK_UPDATE = 5
+BULK_DELETE = 6
+
+# lsn, operation, payload size, crc32 of the payload
+_RECORD_HEADER = struct.Struct('<QBII')
+# magic, lsn of the last operation included; then, since FLIXSNP2, the size
+# of the field names of the columns, which follow NUL separated
+_SNAPSHOT_HEADER = struct.Struct('<8sQ')
+_SNAPSHOT_FIELD_NAMES_SIZE = struct.Struct('<I')
+_SNAPSHOT_MAGIC = b'FLIXSNP2'
+_SNAPSHOT_MAGIC_V1 = b'FLIXSNP1'
+
+# besides the core.* classes, the only globals that entities are made of
+_SAFE_GLOBALS = {
+    'datetime': {'date', 'datetime', 'time', 'timedelta', 'timezone'},
+    'uuid': {'UUID', 'SafeUUID'},
+}
+
+
+@contextmanager
+def _gc_paused():
+    # loading builds millions of objects that all survive, so the collector
+    # would only rescan a growing heap over and over
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    # the files hold entities only, so whoever can write to them cannot make
+    # loading them call anything else
+
+    def find_class(self, module: str, name: str) -> Any:
+        if name in _SAFE_GLOBALS.get(module, ()) or module.split('.')[0] == 'core' and '.' not in name:
+            found = super().find_class(module, name)
+            if isinstance(found, type):
+                return found
+        raise pickle.UnpicklingError(f"'{module}.{name}' is not allowed in a repository file")
+
+
+def _loads(data: bytes) -> Any:
+    return _RestrictedUnpickler(io.BytesIO(data)).load()
+
+
+@dataclass(slots=True)
+class EntityCodec:
+    # entities are stored as one list per field (ids as plain strings), which
+    # pickles and loads much faster than the entities themselves, and are
+    # rebuilt without going through __init__, as they were validated on write
+
+    entity_class: Type[Entity]
+
+    @property
+    def field_names(self) -> List[str]:
+        return [entity_field.name for entity_field in fields(self.entity_class)]
+
+    def encode(self, entities: List[Entity]) -> Tuple[Type[Entity], List[List[Any]]]:
+        columns = [[entity.id for entity in entities]]
+        for name in self.field_names[1:]:
+            columns.append([getattr(entity, name) for entity in entities])
+        return self.entity_class, columns
+
+    def decode(self, columns: List[List[Any]], names: Optional[List[str]] = None) -> List[Entity]:
+        # columns are matched to the fields by the names they were written with
+        # (by position when there are none), so fields added, removed or moved since
+        # are fine; map() keeps the per-entity loops in C, which is most of the restore time
+        new = object.__new__
+        set_attr = object.__setattr__
+        field_names = self.field_names
+        names = field_names[:len(columns)] if names is None else names
+        size = len(columns[0]) if columns else 0
+        unique_entity_ids = list(map(new, repeat(UniqueEntityId, size)))
+        deque(map(set_attr, unique_entity_ids, repeat('id'), columns[0] if columns else []), maxlen=0)
+        props = {name: column for name, column in zip(names[1:], columns[1:]) if name in field_names}
+        if len(props) < len(field_names) - 1:
+            # fields added after the snapshot was written are left to restore(),
+            # which gives them the entity class' defaults as on any other load
+            restore = self.entity_class.restore
+            keys = [field_names[0], *props]
+            return [restore(**dict(zip(keys, values))) for values in zip(unique_entity_ids, *props.values())]
+        entities = list(map(new, repeat(self.entity_class, size)))
+        deque(map(set_attr, entities, repeat(field_names[0]), unique_entity_ids), maxlen=0)
+        for name, column in props.items():
+            deque(map(set_attr, entities, repeat(name), column), maxlen=0)
+        return entities
+
+
+class OperationLog:
+    # append-only log of write operations; every record is handed to the OS
+    # right away and fsync'ed in batches of sync_every records (0 leaves it to the OS)
+
+    path: Path
+    sync_every: int
+
+    def __init__(self, path: Path, sync_every: int = 1) -> None:
+        self.path = path
+        self.sync_every = sync_every
+        self._pending = 0
+        self._file = open(path, 'ab')  # pylint: disable=consider-using-with
+
+    def append(self, lsn: int, operation: int, payload: bytes) -> None:
+        self._file.write(_RECORD_HEADER.pack(lsn, operation, len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        self._pending += 1
+        if self.sync_every and self._pending >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def truncate(self) -> None:
+        self._file.truncate(0)
+        self.sync()
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+    @staticmethod
+    def read(path: Path) -> Iterator[Tuple[int, int, bytes]]:
+        # stops at the first torn or corrupted record and cuts the log there,
+        # so new records are not appended after garbage
+        if not path.exists() or path.stat().st_size == 0:
+            return
+        valid_size = 0
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            size = len(buffer)
+            while valid_size + _RECORD_HEADER.size <= size:
+                lsn, operation, length, crc = _RECORD_HEADER.unpack_from(buffer, valid_size)
+                start = valid_size + _RECORD_HEADER.size
+                payload = buffer[start:start + length]
+                if len(payload) != length or zlib.crc32(payload) != crc:
+                    break
+                yield lsn, operation, payload
+                valid_size = start + length
+        if valid_size != size:
+            os.truncate(path, valid_size)
+
+
+class SnapshotStore:
+
+    path: Path
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def write(self, lsn: int, entities: List[Entity]) -> None:
+        entity_classes = {type(entity) for entity in entities}
+        if len(entity_classes) == 1:
+            codec = EntityCodec(entity_classes.pop())
+            field_names = '\0'.join(codec.field_names).encode()
+            payload = codec.encode(entities)
+        else:
+            field_names = b''
+            payload = (None, entities)
+        temporary_path = self.path.with_suffix('.tmp')
+        with open(temporary_path, 'wb') as file:
+            file.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, lsn))
+            file.write(_SNAPSHOT_FIELD_NAMES_SIZE.pack(len(field_names)) + field_names)
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+        directory = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    def read(self) -> Tuple[int, List[Entity]]:
+        if not self.path.exists():
+            return 0, []
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, lsn = _SNAPSHOT_HEADER.unpack_from(buffer)
+            offset = _SNAPSHOT_HEADER.size
+            if magic == _SNAPSHOT_MAGIC:
+                (size,) = _SNAPSHOT_FIELD_NAMES_SIZE.unpack_from(buffer, offset)
+                offset += _SNAPSHOT_FIELD_NAMES_SIZE.size
+                field_names = buffer[offset:offset + size].decode().split('\0') if size else None
+                offset += size
+            elif magic == _SNAPSHOT_MAGIC_V1:
+                field_names = None
+            else:
+                raise ValueError(f"'{self.path}' is not a repository snapshot")
+            buffer.seek(offset)
+            with _gc_paused():
+                entity_class, data = _RestrictedUnpickler(buffer).load()
+                entities = data if entity_class is None else EntityCodec(entity_class).decode(data, field_names)
+        return lsn, entities
+
+
+class DurableRepository(SearchableRepositoryInterface[T, Input, Output]):
+    # writes are appended to the operation log first and then applied to the
+    # wrapped in-memory repository; every snapshot_every operations the whole state is
+    # written as a snapshot and the log starts over. On start the snapshot is
+    # loaded and the log records after its lsn are replayed
+
+    _repository: SearchableRepositoryInterface[T, Input, Output]
+    snapshot_every: int
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[T, Input, Output],
+        directory: str | Path,
+        sync_every: int = 1,
+        snapshot_every: int = 100_000
+    ) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._repository = repository
+        self._snapshots = SnapshotStore(directory / 'snapshot')
+        self._write_lock = threading.Lock()
+        self._lsn = self._restore(directory / 'operations.log')
+        self._log = OperationLog(directory / 'operations.log', sync_every)
+        self._operations = 0
+        self.snapshot_every = snapshot_every
+
+    @property
+    def sortable_fields(self) -> List[str]:
+        return self._repository.sortable_fields
+
+    @property
+    def items(self) -> List[T]:
+        return self._repository.items
+
+    @items.setter
+    def items(self, entities: List[T]) -> None:
+        with self._write_lock:
+            self._repository.items = entities
+            self._lsn += 1
+            self._snapshot()
+
+    def insert(self, entity: T) -> None:
+        self._write(INSERT, entity, lambda: self._repository.insert(entity))
+
+    def bulk_insert(self, entities: List[T]) -> None:
+        self._write(BULK_INSERT, entities, lambda: self._repository.bulk_insert(entities))
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> T:
+        return self._repository.find_by_id(entity_id)
+
+    def find_all(self) -> List[T]:
+        return self._repository.find_all()
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[T]:
+        return self._repository.iter_all(chunk_size)
+
+    def update(self, entity: T) -> None:
+        self._write(UPDATE, entity, lambda: self._repository.update(entity))
+
+    def bulk_update(self, entities: List[T]) -> None:
+        self._write(BULK_UPDATE, entities, lambda: self._repository.bulk_update(entities))
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        self._write(DELETE, str(entity_id), lambda: self._repository.delete(entity_id))
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId]) -> None:
+        id_strs = [str(entity_id) for entity_id in entity_ids]
+        self._write(BULK_DELETE, id_strs, lambda: self._repository.bulk_delete(id_strs))
+
+    def search(self, input_params: Input) -> Output:
+        return self._repository.search(input_params)
+
+    def snapshot(self) -> None:
+        with self._write_lock:
+            self._snapshot()
+
+    def close(self) -> None:
+        with self._write_lock:
+            self._log.close()
+
+    def _write(self, operation: int, data: Any, apply: Callable[[], None]) -> None:
+        # a write that is applied is always in the log; one that fails once logged
+        # (an id not found) fails the same way on replay and is skipped there
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._write_lock:
+            self._lsn += 1
+            self._log.append(self._lsn, operation, payload)
+            self._operations += 1
+            apply()
+            if self.snapshot_every and self._operations >= self.snapshot_every:
+                self._snapshot()
+
+    def _snapshot(self) -> None:
+        self._snapshots.write(self._lsn, self._repository.find_all())
+        self._log.truncate()
+        self._operations = 0
+
+    def _restore(self, log_path: Path) -> int:
+        lsn, entities = self._snapshots.read()
+        with _gc_paused():
+            self._repository.items = entities
+        appliers = {
+            INSERT: self._repository.insert,
+            BULK_INSERT: self._repository.bulk_insert,
+            UPDATE: self._repository.update,
+            DELETE: self._repository.delete,
+            BULK_UPDATE: self._repository.bulk_update,
+            BULK_DELETE: self._repository.bulk_delete,
+        }
+        for record_lsn, operation, payload in OperationLog.read(log_path):
+            if record_lsn > lsn:
+                with suppress(NotFoundException):
+                    appliers[operation](_loads(payload))
+                lsn = record_lsn
+        return lsn
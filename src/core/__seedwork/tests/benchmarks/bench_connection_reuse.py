@@ -0,0 +1,64 @@
+# Usage (from ./src):
+#   python -m core.__seedwork.tests.benchmarks.bench_connection_reuse --dsn mysql://root:root@db:3306/bench
+# Runs on a temporary SQLite file unless --dsn is given; the handshake only really costs on a server database.
+# Every request is wrapped in the request_started/request_finished signals, which is where
+# Django closes connections older than CONN_MAX_AGE, so the timings include connecting.
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dsn')
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['DATABASE_DSN'] = args.dsn or f'sqlite:///{directory}/bench.sqlite3'
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+        import django  # pylint: disable=import-outside-toplevel
+        django.setup()
+        run(args.requests)
+
+
+def run(requests: int):
+    # pylint: disable=import-outside-toplevel
+    from django.core.management import call_command
+    from django.db import connection
+    from core.category.domain.entities import Category
+    from core.category.infra.django.repositories import CategoryDjangoRepository
+
+    call_command('migrate', 'category', verbosity=0)
+    repo = CategoryDjangoRepository()
+    entity = Category(name='Movie')
+    repo.insert(entity)
+
+    print(f'\n== {connection.vendor}, {requests} requests reading one category')
+    print(f'{"CONN_MAX_AGE":>14} {"mean":>10} {"p50":>10} {"p99":>10}')
+    for conn_max_age in [0, 60]:
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+        timings = sorted(request(lambda: repo.find_by_id(entity.id)) for _ in range(requests))
+        print(
+            f'{conn_max_age:>14} {statistics.mean(timings) * 1000:>7.3f} ms '
+            f'{timings[len(timings) // 2] * 1000:>7.3f} ms {timings[int(len(timings) * 0.99)] * 1000:>7.3f} ms'
+        )
+    repo.delete(entity.id)
+
+
+def request(handle) -> float:
+    from django.core import signals  # pylint: disable=import-outside-toplevel
+    start = time.perf_counter()
+    signals.request_started.send(sender=None)
+    try:
+        handle()
+    finally:
+        signals.request_finished.send(sender=None)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_copy_on_write --readers 8 --writers 2
+import argparse
+from dataclasses import dataclass
+import random
+import threading
+import time
+from typing import List
+
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.repositories import (CopyOnWriteRepository, InMemorySearchableRepository, SearchParams,
+                                                 SearchResult)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class BenchEntity(Entity):
+    name: str
+
+
+class BenchSearchableRepository(InMemorySearchableRepository[BenchEntity, str]):
+    sortable_fields: List[str] = ['name']
+
+    def _apply_filter(self, items: List[BenchEntity], filter_param: str | None) -> List[BenchEntity]:
+        if filter_param:
+            return [item for item in items if filter_param in item.name]
+        return items
+
+
+class BenchCopyOnWriteRepository(CopyOnWriteRepository[BenchEntity, SearchParams, SearchResult]):
+    pass
+
+
+def run(repo, entities: List[BenchEntity], readers: int, writers: int, seconds: float) -> dict:
+    stop = threading.Event()
+    counters = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def count(name: str, value: int):
+        with lock:
+            counters[name] += value
+
+    def read():
+        reads = errors = 0
+        while not stop.is_set():
+            try:
+                page = random.randint(1, 20)
+                repo.search(SearchParams(page=page, sort='name', sort_dir=random.choice(['asc', 'desc'])))
+                repo.find_by_id(random.choice(entities).id)
+                reads += 2
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+        count('reads', reads)
+        count('errors', errors)
+
+    def write():
+        writes = errors = 0
+        while not stop.is_set():
+            try:
+                entity = random.choice(entities)
+                repo.update(BenchEntity(unique_entity_id=entity.unique_entity_id, name=f'{random.random():.8f}'))
+                writes += 1
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+        count('writes', writes)
+        count('errors', errors)
+
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    threads += [threading.Thread(target=write) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {name: value / seconds if name != 'errors' else value for name, value in counters.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=10_000)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    entities = [BenchEntity(name=f'{random.random():.8f}') for _ in range(args.size)]
+    print(f"{'mode':>14} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    for mode in ['shared', 'copy-on-write']:
+        repo = BenchSearchableRepository()
+        repo.items = entities
+        if mode == 'copy-on-write':
+            repo = BenchCopyOnWriteRepository(repo)
+        result = run(repo, entities, args.readers, args.writers, args.seconds)
+        print(f"{mode:>14} {result['reads']:>10.0f} {result['writes']:>10.0f} {result['errors']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_django_hydration --size 10000
+# Runs on a temporary SQLite file, or on the database given by --dsn (e.g. mysql://root:root@db:3306/bench).
+# Compares building categories from model instances with building them from values_list rows,
+# and rows restored without validation with rows validated as ENTITY_RESTORE_VALIDATION_RATE=1 does.
+import argparse
+import os
+import tempfile
+import timeit
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=10_000)
+    parser.add_argument('--dsn')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['DATABASE_DSN'] = args.dsn or f'sqlite:///{directory}/bench.sqlite3'
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+        import django  # pylint: disable=import-outside-toplevel
+        django.setup()
+        run(args.size, args.repeat)
+
+
+def run(size: int, repeat: int):
+    # pylint: disable=import-outside-toplevel
+    from django.core.management import call_command
+    from django.db import connection
+    from core.__seedwork.domain.entities import set_restore_validation_rate
+    from core.category.infra.django.mappers import CategoryModelMapper
+    from core.category.infra.django.models import CategoryModel
+    from core.__seedwork.tests.benchmarks.bench_search_query_plans import populate
+
+    call_command('migrate', 'category', verbosity=0)
+    populate(CategoryModel, size)
+    query = CategoryModel.objects.order_by('-created_at', '-id')
+
+    def from_models(per_page: int):
+        return [CategoryModelMapper.to_entity(model) for model in query[:per_page]]
+
+    def from_rows(per_page: int):
+        rows = query.values_list(*CategoryModelMapper.row_fields)[:per_page]
+        return list(map(CategoryModelMapper.to_entity_from_row, rows))
+
+    def measure(hydrate, per_page: int, validation_rate: float) -> float:
+        set_restore_validation_rate(validation_rate)
+        try:
+            return min(timeit.repeat(lambda: hydrate(per_page), number=1, repeat=repeat))
+        finally:
+            set_restore_validation_rate(0.0)
+
+    print(f'\n== {connection.vendor}, {size} rows')
+    print(f'{"page size":>10} {"models":>12} {"rows":>12} {"speedup":>8} {"validated":>12} {"speedup":>8}')
+    for per_page in [15, 100, 1000]:
+        model_seconds = measure(from_models, per_page, 0.0)
+        row_seconds = measure(from_rows, per_page, 0.0)
+        validated_seconds = measure(from_rows, per_page, 1.0)
+        print(
+            f'{per_page:>10} {model_seconds * 1000:>9.2f} ms {row_seconds * 1000:>9.2f} ms '
+            f'{model_seconds / row_seconds:>7.2f}x {validated_seconds * 1000:>9.2f} ms '
+            f'{validated_seconds / row_seconds:>7.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_in_memory_repository [sizes...]
+from dataclasses import dataclass, field
+import random
+import sys
+import timeit
+from typing import List
+
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.repositories import InMemoryRepository
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+LOOKUPS = 20
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class BenchEntity(Entity):
+    name: str
+
+
+class BenchInMemoryRepository(InMemoryRepository[BenchEntity]):
+    pass
+
+
+@dataclass(slots=True)
+class LinearScanRepository:
+    # the previous list based implementation, kept here as the baseline
+    items: List[BenchEntity] = field(default_factory=lambda: [])
+
+    def find_by_id(self, entity_id: str) -> BenchEntity:
+        return self._get(entity_id)
+
+    def update(self, entity: BenchEntity) -> None:
+        entity_found = self._get(entity.id)
+        index = self.items.index(entity_found)
+        self.items[index] = entity
+
+    def delete(self, entity_id: str) -> None:
+        entity_found = self._get(entity_id)
+        self.items.remove(entity_found)
+
+    def _get(self, entity_id: str) -> BenchEntity:
+        entity = next(filter(lambda item: item.id == entity_id, self.items), None)
+        if not entity:
+            raise NotFoundException(f"Entity not found using id '{entity_id}'")
+        return entity
+
+
+def measure(repo, entities: List[BenchEntity]) -> dict:
+    sample = random.sample(entities, LOOKUPS)
+    updated = [BenchEntity(unique_entity_id=entity.unique_entity_id, name='updated') for entity in sample]
+    return {
+        'find_by_id': timeit.timeit(lambda: [repo.find_by_id(entity.id) for entity in sample], number=1),
+        'update': timeit.timeit(lambda: [repo.update(entity) for entity in updated], number=1),
+        'delete': timeit.timeit(lambda: [repo.delete(entity.id) for entity in sample], number=1),
+    }
+
+
+def main(sizes: List[int]):
+    print(f"{'size':>10} {'operation':>12} {'linear (us/op)':>16} {'indexed (us/op)':>16} {'speedup':>9}")
+    for size in sizes:
+        entities = [BenchEntity(name=f'entity {i}') for i in range(size)]
+
+        linear = LinearScanRepository(list(entities))
+        indexed = BenchInMemoryRepository()
+        indexed.items = entities
+
+        linear_times = measure(linear, entities)
+        indexed_times = measure(indexed, entities)
+        for operation, linear_time in linear_times.items():
+            indexed_time = indexed_times[operation]
+            print(
+                f'{size:>10} {operation:>12} {linear_time / LOOKUPS * 1e6:>16.2f} '
+                f'{indexed_time / LOOKUPS * 1e6:>16.2f} {linear_time / indexed_time:>8.0f}x'
+            )
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,107 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_search_query_plans --size 1000000
+# Runs on a temporary SQLite file, or on the database given by --dsn (e.g. mysql://root:root@db:3306/bench).
+# The searches are timed and explained without the indexes of CategoryModel, with them, and with the
+# full-text index of migration 0003.
+import argparse
+from datetime import datetime, timedelta, timezone
+import os
+import random
+import tempfile
+import timeit
+import uuid
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--dsn')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['DATABASE_DSN'] = args.dsn or f'sqlite:///{directory}/bench.sqlite3'
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+        import django  # pylint: disable=import-outside-toplevel
+        django.setup()
+        run(args.size, args.repeat)
+
+
+def run(size: int, repeat: int):
+    # pylint: disable=import-outside-toplevel
+    from django.core.management import call_command
+    from django.db import connection
+    from core.category.infra.django.models import CategoryModel
+    from core.category.infra.django.repositories import CategoryDjangoRepository
+
+    call_command('migrate', 'category', verbosity=0)
+    populate(CategoryModel, size)
+
+    searches = {
+        'default order': CategoryDjangoRepository.SearchParams(with_total='none'),
+        'name order, page 1000': CategoryDjangoRepository.SearchParams(page=1000, sort='name', with_total='none'),
+        # a word in a tenth of the names, and one in a single name
+        'common word filter': CategoryDjangoRepository.SearchParams(filter='drama', with_total='none'),
+        'rare word filter': CategoryDjangoRepository.SearchParams(filter=str(size // 2), with_total='none'),
+    }
+    # the columns the later migrations add are needed, so the indexes are dropped and added back instead
+    indexes = CategoryModel._meta.indexes  # pylint: disable=protected-access
+    with connection.schema_editor() as schema_editor:
+        for index in indexes:
+            schema_editor.remove_index(CategoryModel, index)
+    for has_indexes, use_fulltext in [(False, False), (True, False), (True, True)]:
+        if has_indexes and not use_fulltext:
+            with connection.schema_editor() as schema_editor:
+                for index in indexes:
+                    schema_editor.add_index(CategoryModel, index)
+        repo = CategoryDjangoRepository(use_fulltext=use_fulltext)
+        index_state = 'with' if has_indexes else 'without'
+        fulltext_state = 'on' if use_fulltext else 'off'
+        print(f'\n== {connection.vendor}, {size} rows, {index_state} indexes, fulltext {fulltext_state}')
+        for label, params in searches.items():
+            seconds = min(timeit.repeat(lambda params=params: repo.search(params), number=1, repeat=repeat))
+            print(f'{label:>24}: {seconds * 1000:9.2f} ms')
+            print(indent(explain(connection, repo, params)))
+
+
+def explain(connection, repo, params) -> str:
+    # the queries the repository runs, explained by the database
+    from django.test.utils import CaptureQueriesContext  # pylint: disable=import-outside-toplevel
+    with CaptureQueriesContext(connection) as context:
+        repo.search(params)
+    queries = [query['sql'] for query in context.captured_queries]
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    lines = []
+    with connection.cursor() as cursor:
+        for sql in queries:
+            cursor.execute(prefix + sql)
+            lines.extend(' | '.join(str(column) for column in row) for row in cursor.fetchall())
+    return '\n'.join(lines)
+
+
+def indent(text: str) -> str:
+    return '\n'.join(f'{"":>26}{line}' for line in text.splitlines())
+
+
+def populate(model, size: int, batch_size: int = 20_000):
+    words = ['action', 'comedy', 'drama', 'horror', 'documentary', 'series', 'movie', 'kids', 'anime', 'music']
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    for offset in range(0, size, batch_size):
+        created_ats = [
+            start + timedelta(seconds=random.randrange(size * 10))
+            for _ in range(offset, min(offset + batch_size, size))
+        ]
+        model.objects.bulk_create([
+            model(
+                id=uuid.uuid4(),
+                name=f'{random.choice(words).title()} {random.choice(words)} {index}',
+                description=None,
+                is_active=True,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for index, created_at in enumerate(created_ats, offset)
+        ])
+
+
+if __name__ == '__main__':
+    main()
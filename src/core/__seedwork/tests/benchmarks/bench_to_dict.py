@@ -0,0 +1,63 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_to_dict --number 20000
+# Compares dataclasses.asdict with the to_dict generated by DictConverter, and times Category().
+from dataclasses import asdict
+import argparse
+import timeit
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.number, args.repeat)
+
+
+def as_entity_dict(entity):
+    # Entity.to_dict before DictConverter
+    entity_dict = asdict(entity)
+    entity_dict.pop('unique_entity_id')
+    entity_dict['id'] = entity.id
+    return entity_dict
+
+
+def run(number: int, repeat: int):
+    # pylint: disable=import-outside-toplevel
+    from core.__seedwork.domain.repositories import SearchResult
+    from core.category.application.dto import CategoryOutputMapper
+    from core.category.application.use_cases import ListCategoriesUseCase
+    from core.category.domain.entities import Category
+
+    category = Category(name='Movie', description='Some description')
+    output = CategoryOutputMapper.without_child().to_output(category)
+    items = [category] * 15
+    result = SearchResult(items=items, total=100, current_page=1, per_page=15)
+    pagination = ListCategoriesUseCase.Output(
+        items=items, total=100, current_page=1, per_page=15, last_page=7
+    )
+    arrange = {
+        'Category': (category, as_entity_dict),
+        'SearchResult': (result, asdict),
+        'CategoryOutput': (output, asdict),
+        'PaginationOutput': (pagination, asdict),
+    }
+
+    def measure(convert) -> float:
+        return min(timeit.repeat(convert, number=number, repeat=repeat)) / number
+
+    print(f'{"class":>18} {"asdict":>12} {"generated":>12} {"speedup":>8}')
+    for label, (instance, to_dict) in arrange.items():
+        # asdict converts the 15 items of the listings too, the generated to_dict keeps them
+        asdict_seconds = measure(lambda instance=instance, to_dict=to_dict: to_dict(instance))
+        generated_seconds = measure(instance.to_dict)
+        print(
+            f'{label:>18} {asdict_seconds * 1e6:>9.2f} us {generated_seconds * 1e6:>9.2f} us '
+            f'{asdict_seconds / generated_seconds:>7.2f}x'
+        )
+
+    seconds = measure(lambda: Category(name='Movie', description='Some description'))
+    print(f'\nCategory(): {seconds * 1e6:.2f} us per entity')
+
+
+if __name__ == '__main__':
+    main()
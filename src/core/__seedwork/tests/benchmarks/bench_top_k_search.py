@@ -0,0 +1,61 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_top_k_search [sizes...]
+from dataclasses import dataclass
+import random
+import sys
+import timeit
+from typing import List, Set
+
+from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.repositories import InMemorySearchableRepository, SearchParams
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+WINDOW_RATIOS = [0.001, 0.005, 0.01, 0.02, 0.05, 0.1]
+PER_PAGE = 15
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class BenchEntity(Entity):
+    name: str
+
+
+class BenchSearchableRepository(InMemorySearchableRepository[BenchEntity, str]):
+    sortable_fields: List[str] = ['name']
+
+    def _find_filtered_keys(self, filter_param: str) -> Set[int]:
+        # every entity matches, so the candidate set is the whole collection
+        return set(self._entries)
+
+    def _apply_filter(self, items: List[BenchEntity], filter_param: str | None) -> List[BenchEntity]:
+        return items
+
+
+def make_repository(entities: List[BenchEntity], top_k_max_ratio: float) -> BenchSearchableRepository:
+    repo = BenchSearchableRepository()
+    repo.top_k_max_ratio = top_k_max_ratio
+    # every timed search repeats the same params, which the cache would answer after the first
+    repo.search_cache.max_size = 0
+    repo.items = entities
+    repo.search(SearchParams(sort='name', filter='x'))
+    return repo
+
+
+def main(sizes: List[int]):
+    print(f"{'size':>8} {'window':>8} {'full sort (ms)':>15} {'top-k (ms)':>11} {'winner':>10}")
+    for size in sizes:
+        entities = [BenchEntity(name=f'{random.random():.12f}') for _ in range(size)]
+        full_sort_repo = make_repository(entities, 0)
+        top_k_repo = make_repository(entities, 1)
+        number = max(1, 100_000 // size)
+        for ratio in WINDOW_RATIOS:
+            page = max(1, int(size * ratio) // PER_PAGE)
+            params = SearchParams(page=page, per_page=PER_PAGE, sort='name', sort_dir='desc', filter='x')
+            full_sort = timeit.timeit(lambda: full_sort_repo.search(params), number=number) / number
+            top_k = timeit.timeit(lambda: top_k_repo.search(params), number=number) / number
+            print(
+                f'{size:>8} {page * PER_PAGE:>8} {full_sort * 1e3:>15.3f} {top_k * 1e3:>11.3f} '
+                f"{'top-k' if top_k < full_sort else 'full sort':>10}"
+            )
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,55 @@
+# Usage (from ./src): python -m core.__seedwork.tests.benchmarks.bench_validators --number 2000
+# Compares the DRFValidator over a Serializer with the CompiledValidator of the same rules.
+import argparse
+from datetime import datetime
+import timeit
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=2_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.number, args.repeat)
+
+
+def run(number: int, repeat: int):
+    # pylint: disable=import-outside-toplevel
+    from rest_framework import serializers
+    from core.__seedwork.domain.validators import DRFValidator, StrictBooleanField, StrictCharField
+    from core.category.domain.entities import Category
+    from core.category.domain.validators import CategoryValidator
+
+    class CategoryRules(serializers.Serializer):  # pylint: disable=abstract-method
+        name = StrictCharField(max_length=255)
+        description = StrictCharField(required=False, allow_null=True, allow_blank=True)
+        is_active = StrictBooleanField(required=False)
+        created_at = serializers.DateTimeField(required=False)
+        updated_at = serializers.DateTimeField(required=False)
+
+    now = datetime.now()
+    arrange = {
+        'valid': Category(name='Movie', description='Some description').to_dict(),
+        'invalid': {'name': 5, 'description': 5, 'is_active': 0, 'created_at': now, 'updated_at': 'now'},
+    }
+
+    print(f'{"data":>10} {"drf":>12} {"compiled":>12} {"speedup":>8}')
+    for label, data in arrange.items():
+        drf_seconds, compiled_seconds = (
+            min(timeit.repeat(validate, number=number, repeat=repeat)) / number
+            for validate in (
+                lambda data=data: DRFValidator().validate(CategoryRules(data=data)),
+                lambda data=data: CategoryValidator().validate(data),
+            )
+        )
+        print(
+            f'{label:>10} {drf_seconds * 1e6:>9.2f} us {compiled_seconds * 1e6:>9.2f} us '
+            f'{drf_seconds / compiled_seconds:>7.2f}x'
+        )
+
+    seconds = min(timeit.repeat(lambda: Category(name='Movie', created_at=now), number=number, repeat=repeat))
+    print(f'\nCategory(): {seconds / number * 1e6:.2f} us per entity')
+
+
+if __name__ == '__main__':
+    main()
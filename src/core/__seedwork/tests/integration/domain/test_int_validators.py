@@ -1,6 +1,13 @@
+from datetime import date, datetime
 import unittest
 from rest_framework import serializers
-from core.__seedwork.domain.validators import DRFValidator, StrictBooleanField, StrictCharField
+from core.__seedwork.domain.validators import (
+    CompiledValidator,
+    DRFValidator,
+    FieldRules,
+    StrictBooleanField,
+    StrictCharField,
+)
 
 
 class StubSerializer(serializers.Serializer):   # pylint: disable=abstract-method
@@ -96,3 +103,56 @@ class TestStrictBooleanFieldUnit(unittest.TestCase):
 
         serializer = StubStrictBooleanFieldSerializer(data={'active': None})
         self.assertTrue(serializer.is_valid())
+
+
+class TestCompiledValidatorIntegration(unittest.TestCase):
+    def test_errors_match_the_drf_validator(self):
+        class StubSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+            name = StrictCharField(max_length=5)
+            description = StrictCharField(required=False, allow_null=True, allow_blank=True)
+            is_active = StrictBooleanField(required=False)
+            created_at = serializers.DateTimeField(required=False)
+
+        class StubValidator(CompiledValidator):
+            rules = {
+                'name': FieldRules.string(max_length=5),
+                'description': FieldRules.string(required=False, allow_null=True, allow_blank=True),
+                'is_active': FieldRules.boolean(required=False),
+                'created_at': FieldRules.datetime(required=False),
+            }
+
+        arrange = [
+            {},
+            {'name': None},
+            {'name': ''},
+            {'name': '   '},
+            {'name': 5},
+            {'name': True},
+            {'name': 't' * 6},
+            {'name': 'a\x00b'},
+            {'name': 't' * 5 + '\x00'},
+            {'name': ' Movie '},
+            {'name': 'Movie', 'description': None},
+            {'name': 'Movie', 'description': ''},
+            {'name': 'Movie', 'description': 5},
+            {'name': 'Movie', 'is_active': None},
+            {'name': 'Movie', 'is_active': 0},
+            {'name': 'Movie', 'is_active': 'True'},
+            {'name': 'Movie', 'is_active': False},
+            {'name': 'Movie', 'created_at': None},
+            {'name': 'Movie', 'created_at': 5},
+            {'name': 'Movie', 'created_at': ''},
+            {'name': 'Movie', 'created_at': date(2020, 1, 1)},
+            {'name': 'Movie', 'created_at': '2020-01-01T10:00:00Z'},
+            {'name': 'Movie', 'created_at': datetime(2020, 1, 1)},
+            {'name': 5, 'description': 5, 'is_active': 5, 'created_at': 5, 'other': 5},
+            [],
+        ]
+        for data in arrange:
+            with self.subTest(data=data):
+                drf_validator, validator = DRFValidator(), StubValidator()
+                is_valid = drf_validator.validate(StubSerializer(data=data))
+                self.assertEqual(validator.validate(data), is_valid)
+                self.assertEqual(validator.errors, drf_validator.errors)
+                if is_valid:
+                    self.assertEqual(validator.validated_data.keys(), drf_validator.validated_data.keys())
@@ -12,7 +12,9 @@ class TestSearchInput(unittest.TestCase):
             'per_page': Optional[int],
             'sort': Optional[str],
             'sort_dir': Optional[str],
-            'filter': Optional[Filter]
+            'filter': Optional[Filter],
+            'cursor': Optional[str],
+            'with_total': Optional[str]
         })
 
 
@@ -20,10 +22,28 @@ class TestPaginationOutput(unittest.TestCase):
     def test_fields(self):
         self.assertEqual(PaginationOutput.__annotations__, {
             'items': List[Item],
-            'total': int,
+            'total': Optional[int],
             'current_page': int,
             'per_page': int,
-            'last_page': int
+            'last_page': Optional[int],
+            'next_cursor': Optional[str],
+            'prev_cursor': Optional[str],
+            'has_next': Optional[bool],
+            'with_total': str
+        })
+
+    def test_to_dict(self):
+        output = PaginationOutput(items=['fake'], total=1, current_page=1, per_page=1, last_page=1)
+        self.assertDictEqual(output.to_dict(), {
+            'items': ['fake'],
+            'total': 1,
+            'current_page': 1,
+            'per_page': 1,
+            'last_page': 1,
+            'next_cursor': None,
+            'prev_cursor': None,
+            'has_next': None,
+            'with_total': 'exact'
         })
 
 
@@ -45,7 +65,8 @@ class TestPaginationOutputMapper(unittest.TestCase):
             per_page=1,
             sort='name',
             sort_dir='asc',
-            filter='filter fake'
+            filter='filter fake',
+            next_cursor='next fake'
         )
         output = PaginationOutputMapper.from_child(PaginationOutputChild).to_output(result.items, result=result)
         self.assertEqual(output, PaginationOutputChild(
@@ -54,4 +75,7 @@ class TestPaginationOutputMapper(unittest.TestCase):
             current_page=result.current_page,
             per_page=result.per_page,
             last_page=result.last_page,
+            next_cursor='next fake',
+            has_next=False,
+            with_total='exact',
         ))
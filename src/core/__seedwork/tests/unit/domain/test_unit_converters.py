@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from typing import ClassVar, List
+import unittest
+from unittest.mock import patch
+
+from core.__seedwork.domain.converters import DictConverter
+
+
+@dataclass(frozen=True, slots=True)
+class StubParent:
+    prop1: str
+    prop2: List[str] = field(default_factory=list)
+    hidden: str = None
+    kind: ClassVar[str] = 'stub'
+
+    to_dict = DictConverter(exclude=('hidden',), extra={'size': 'len(self.prop2)'})
+
+
+@dataclass(frozen=True, slots=True)
+class StubChild(StubParent):
+    prop3: int = 0
+
+
+class TestDictConverterUnit(unittest.TestCase):
+    def test_to_dict_from_the_fields_of_each_class(self):
+        parent = StubParent(prop1='value1', prop2=['a'], hidden='hidden')
+        self.assertEqual(list(parent.to_dict().items()), [('prop1', 'value1'), ('prop2', ['a']), ('size', 1)])
+        self.assertIs(parent.to_dict()['prop2'], parent.prop2)
+
+        child = StubChild(prop1='value1', prop3=3)
+        self.assertEqual(child.to_dict(), {'prop1': 'value1', 'prop2': [], 'prop3': 3, 'size': 0})
+        self.assertEqual(StubChild.to_dict(child), child.to_dict())
+        self.assertEqual(StubChild.to_dict.__qualname__, 'StubChild.to_dict')
+
+    def test_generate_once_per_class(self):
+        @dataclass(frozen=True, slots=True)
+        class Stub:
+            prop1: str
+            to_dict = DictConverter()
+
+        converter = Stub.__dict__['to_dict']
+        with patch.object(converter, 'generate', wraps=converter.generate) as mock_generate:
+            self.assertEqual([Stub('a').to_dict(), Stub('b').to_dict()], [{'prop1': 'a'}, {'prop1': 'b'}])
+        mock_generate.assert_called_once_with(Stub)
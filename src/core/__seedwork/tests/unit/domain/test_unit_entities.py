@@ -1,8 +1,10 @@
 from abc import ABC
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, field, is_dataclass
 import unittest
+from unittest.mock import patch
 
-from core.__seedwork.domain.entities import Entity
+from core.__seedwork.domain.entities import Entity, set_restore_validation_rate
+from core.__seedwork.domain.exceptions import EntityValidationException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 
 
@@ -12,6 +14,18 @@ class StubEntity(Entity):
     prop2: str = None
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class StubValidatedEntity(Entity):
+    prop1: str
+    prop2: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.validate()
+
+    def validate(self):
+        pass
+
+
 class TestEntityUnit(unittest.TestCase):
     def test_if_is_a_dataclass(self):
         self.assertTrue(is_dataclass(Entity))
@@ -48,3 +62,39 @@ class TestEntityUnit(unittest.TestCase):
                 "prop2": "value2",
             },
         )
+
+    def test_restore_method(self):
+        unique_entity_id = UniqueEntityId("8e65b539-6bdb-42eb-b782-1470846e9cbf")
+        with patch.object(StubValidatedEntity, "validate") as mock_validate:
+            entity = StubValidatedEntity.restore(unique_entity_id=unique_entity_id, prop1="value1")
+            mock_validate.assert_not_called()
+            self.assertEqual(entity, StubValidatedEntity(unique_entity_id=unique_entity_id, prop1="value1"))
+            self.assertIsInstance(StubValidatedEntity.restore(prop1="value1").unique_entity_id, UniqueEntityId)
+
+            with self.assertRaises(TypeError) as assert_error:
+                StubValidatedEntity.restore(prop2=[])
+            self.assertEqual(
+                assert_error.exception.args[0], "StubValidatedEntity.restore() missing argument: 'prop1'"
+            )
+
+            mock_validate.reset_mock()
+            set_restore_validation_rate(1.0)
+            self.addCleanup(set_restore_validation_rate, 0.0)
+            StubValidatedEntity.restore(prop1="value1")
+            mock_validate.assert_called_once()
+
+    def test_restore_logs_the_sampled_entities_that_are_not_valid(self):
+        self.addCleanup(set_restore_validation_rate, 0.0)
+        error = EntityValidationException({"prop1": ["some error"]})
+        with patch.object(StubValidatedEntity, "validate", side_effect=error), \
+                patch("core.__seedwork.domain.entities.random.random", return_value=0.1):
+            set_restore_validation_rate(0.5)
+            with self.assertLogs("core.__seedwork.domain.entities", "WARNING") as logs:
+                entity = StubValidatedEntity.restore(prop1="value1")
+            self.assertEqual(entity.prop1, "value1")
+            self.assertIn("StubValidatedEntity", logs.output[0])
+            self.assertIn("{'prop1': ['some error']}", logs.output[0])
+
+            set_restore_validation_rate(1.0)
+            with self.assertRaises(EntityValidationException):
+                StubValidatedEntity.restore(prop1="value1")
@@ -0,0 +1,93 @@
+from contextvars import Context
+from types import SimpleNamespace
+import unittest
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from core.__seedwork.infra.django import db_routers
+from core.__seedwork.infra.django.db_routers import PrimaryReplicaRouter
+from core.__seedwork.infra.django.middlewares import PrimaryPinningMiddleware
+
+MODEL = SimpleNamespace(_meta=SimpleNamespace(app_label='routed'))
+OTHER_MODEL = SimpleNamespace(_meta=SimpleNamespace(app_label='auth'))
+
+
+class TestPrimaryReplicaRouterUnit(unittest.TestCase):
+
+    def setUp(self):
+        replicas = override_settings(
+            DATABASE_REPLICAS=['replica_0'], DATABASE_REPLICA_PIN_SECONDS=5, DATABASE_REPLICA_APP_LABELS=['routed']
+        )
+        replicas.enable()
+        self.addCleanup(replicas.disable)
+        self.router = PrimaryReplicaRouter()
+        self.tokens = db_routers.start_context()
+        self.addCleanup(db_routers.end_context, self.tokens)
+
+    def test_reads_go_to_replicas_until_a_write(self):
+        self.assertEqual(self.router.db_for_read(MODEL), 'replica_0')
+        self.assertFalse(db_routers.has_written())
+
+        self.assertEqual(self.router.db_for_write(MODEL), 'default')
+        self.assertTrue(db_routers.has_written())
+        self.assertEqual(self.router.db_for_read(MODEL), 'default')
+
+    def test_routes_only_the_models_of_the_listed_apps(self):
+        self.assertIsNone(self.router.db_for_read(OTHER_MODEL))
+        self.assertIsNone(self.router.db_for_write(OTHER_MODEL))
+        self.assertFalse(db_routers.has_written())
+        self.assertEqual(self.router.db_for_read(MODEL), 'replica_0')
+
+    def test_writes_outside_of_a_context_do_not_pin_it_for_good(self):
+        def run():
+            self.assertEqual(self.router.db_for_read(MODEL), 'default')
+            self.router.db_for_write(MODEL)
+            self.assertFalse(db_routers.has_written())
+            tokens = db_routers.start_context()
+            self.assertEqual(self.router.db_for_read(MODEL), 'replica_0')
+            db_routers.end_context(tokens)
+
+        # a fresh context, as in a thread or a task that starts none
+        Context().run(run)
+
+    def test_reads_go_to_the_primary_when_pinned_or_without_replicas(self):
+        tokens = db_routers.start_context(is_pinned=True)
+        self.assertEqual(self.router.db_for_read(MODEL), 'default')
+        db_routers.end_context(tokens)
+        self.assertEqual(self.router.db_for_read(MODEL), 'replica_0')
+
+        with override_settings(DATABASE_REPLICAS=[]):
+            self.assertEqual(self.router.db_for_read(MODEL), 'default')
+
+    def test_middleware_sets_the_pin_cookie_after_a_write(self):
+        def write(_request):
+            self.router.db_for_write(MODEL)
+            return HttpResponse()
+
+        def read(_request):
+            return HttpResponse(self.router.db_for_read(MODEL))
+
+        request = RequestFactory().get('/')
+        response = PrimaryPinningMiddleware(write)(request)
+        self.assertEqual(response.cookies[PrimaryPinningMiddleware.cookie_name]['max-age'], 5)
+        self.assertFalse(db_routers.has_written())
+
+        response = PrimaryPinningMiddleware(read)(request)
+        self.assertEqual(response.content, b'replica_0')
+        self.assertNotIn(PrimaryPinningMiddleware.cookie_name, response.cookies)
+
+        request.COOKIES[PrimaryPinningMiddleware.cookie_name] = '1'
+        response = PrimaryPinningMiddleware(read)(request)
+        self.assertEqual(response.content, b'default')
+        self.assertNotIn(PrimaryPinningMiddleware.cookie_name, response.cookies)
+
+    def test_async_middleware_sets_the_pin_cookie_after_a_write_in_a_thread(self):
+        async def write(_request):
+            await sync_to_async(self.router.db_for_write)(MODEL)
+            return HttpResponse()
+
+        middleware = PrimaryPinningMiddleware(write)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get('/'))
+        self.assertEqual(response.cookies[PrimaryPinningMiddleware.cookie_name]['max-age'], 5)
+        self.assertFalse(db_routers.has_written())
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, TypeVar
 
+from core.__seedwork.domain.converters import DictConverter
 from core.category.domain.entities import Category
 
 
@@ -12,6 +13,9 @@ class CategoryOutput:
     description: Optional[str]
     is_active: bool
     created_at: datetime
+    updated_at: datetime
+
+    to_dict = DictConverter()
 
 
 Output = TypeVar('Output', bound=CategoryOutput)
@@ -36,5 +40,6 @@ class CategoryOutputMapper:
             name=category.name,
             description=category.description,
             is_active=category.is_active,
-            created_at=category.created_at
+            created_at=category.created_at,
+            updated_at=category.updated_at
         )
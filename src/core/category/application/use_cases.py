@@ -1,5 +1,6 @@
 from dataclasses import asdict, dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from core.__seedwork.application.dto import PaginationOutput, PaginationOutputMapper, SearchInput
 from core.__seedwork.application.use_case import UseCase
 from core.category.application.dto import CategoryOutput, CategoryOutputMapper
@@ -14,13 +15,21 @@ class CreateCategoryUseCase(UseCase):
     category_repository: CategoryRepository
 
     def execute(self, input_param: 'Input') -> 'Output':
-        category = Category(  # pylint: disable=unexpected-keyword-arg
+        category = self.__to_entity(input_param)
+        self.category_repository.insert(category)
+        return CategoryOutputMapper.from_child(CreateCategoryUseCase.Output).to_output(category)
+
+    async def execute_async(self, input_param: 'Input') -> 'Output':
+        category = self.__to_entity(input_param)
+        await self.category_repository.ainsert(category)
+        return CategoryOutputMapper.from_child(CreateCategoryUseCase.Output).to_output(category)
+
+    def __to_entity(self, input_param: 'Input') -> Category:     # pylint: disable=no-self-use
+        return Category(  # pylint: disable=unexpected-keyword-arg
             name=input_param.name,
             description=input_param.description,
             is_active=input_param.is_active
         )
-        self.category_repository.insert(category)
-        return CategoryOutputMapper.from_child(CreateCategoryUseCase.Output).to_output(category)
 
     @dataclass(slots=True, frozen=True)
     class Input:
@@ -42,6 +51,10 @@ class GetCategoryUseCase(UseCase):
         category = self.category_repository.find_by_id(input_param.id)
         return CategoryOutputMapper.from_child(GetCategoryUseCase.Output).to_output(category)
 
+    async def execute_async(self, input_param: 'Input') -> 'Output':
+        category = await self.category_repository.afind_by_id(input_param.id)
+        return CategoryOutputMapper.from_child(GetCategoryUseCase.Output).to_output(category)
+
     @dataclass(slots=True, frozen=True)
     class Input:
         id: str         # pylint: disable=invalid-name
@@ -60,6 +73,20 @@ class ListCategoriesUseCase(UseCase):
         result = self.category_repository.search(search_params)
         return self.__to_output(result)
 
+    async def execute_async(self, input_param: 'Input') -> 'Output':
+        search_params = self.category_repository.SearchParams(**asdict(input_param))
+        result = await self.category_repository.asearch(search_params)
+        return self.__to_output(result)
+
+    def version(self, input_param: 'Input') -> Tuple[int, Optional[datetime]]:
+        # changes whenever the listed categories change, see CategoryRepository.search_version
+        search_params = self.category_repository.SearchParams(**asdict(input_param))
+        return self.category_repository.search_version(search_params)
+
+    async def version_async(self, input_param: 'Input') -> Tuple[int, Optional[datetime]]:
+        search_params = self.category_repository.SearchParams(**asdict(input_param))
+        return await self.category_repository.asearch_version(search_params)
+
     def __to_output(self, result: CategoryRepository.SearchResult):     # pylint: disable=no-self-use
         items = list(map(CategoryOutputMapper.without_child().to_output, result.items))
         return PaginationOutputMapper.from_child(ListCategoriesUseCase.Output).to_output(items, result)
@@ -81,6 +108,9 @@ class DeleteCategoryUseCase(UseCase):
     def execute(self, input_param: 'Input') -> None:
         self.category_repository.delete(input_param.id)
 
+    async def execute_async(self, input_param: 'Input') -> None:
+        await self.category_repository.adelete(input_param.id)
+
     @dataclass(slots=True, frozen=True)
     class Input:
         id: str         # pylint: disable=invalid-name
@@ -93,13 +123,22 @@ class UpdateCategoryUseCase(UseCase):
 
     def execute(self, input_param: 'Input') -> 'Output':
         entity = self.category_repository.find_by_id(input_param.id)
+        self.__apply(entity, input_param)
+        self.category_repository.update(entity)
+        return self.__to_output(entity)
+
+    async def execute_async(self, input_param: 'Input') -> 'Output':
+        entity = await self.category_repository.afind_by_id(input_param.id)
+        self.__apply(entity, input_param)
+        await self.category_repository.aupdate(entity)
+        return self.__to_output(entity)
+
+    def __apply(self, entity: Category, input_param: 'Input') -> None:     # pylint: disable=no-self-use
         entity.update(name=input_param.name, description=input_param.description)
         if input_param.is_active is True:
             entity.activate()
         if input_param.is_active is False:
             entity.deactivate()
-        self.category_repository.update(entity)
-        return self.__to_output(entity)
 
     def __to_output(self, category: Category) -> 'Output':     # pylint: disable=no-self-use
         return CategoryOutputMapper.from_child(UpdateCategoryUseCase.Output).to_output(category)
@@ -14,7 +14,7 @@ class Category(Entity):
     description: Optional[str] = None
     is_active: Optional[bool] = True
     created_at: Optional[datetime] = field(default_factory=datetime.now)
-    # update_at: Optional[datetime] = field(default_factory=lambda: datetime.now())
+    updated_at: Optional[datetime] = None
 
     # def __new__(cls, **kwargs):
     #     cls.validate(
@@ -28,18 +28,31 @@ class Category(Entity):
     def __post_init__(self):
         if not self.created_at:
             object.__setattr__(self, "created_at", datetime.now())
+        if not self.updated_at:
+            object.__setattr__(self, "updated_at", self.created_at)
         self.validate()
 
+    @classmethod
+    def restore(cls, **props):
+        # categories stored before updated_at existed last changed when created, as far as we know
+        category = super(Category, cls).restore(**props)
+        if not category.updated_at:
+            object.__setattr__(category, "updated_at", category.created_at)
+        return category
+
     def update(self, *, name: str, description: str) -> None:
         object.__setattr__(self, "name", name)
         object.__setattr__(self, "description", description)
+        object.__setattr__(self, "updated_at", datetime.now())
         self.validate()
 
     def activate(self):
         object.__setattr__(self, "is_active", True)
+        object.__setattr__(self, "updated_at", datetime.now())
 
     def deactivate(self):
         object.__setattr__(self, "is_active", False)
+        object.__setattr__(self, "updated_at", datetime.now())
 
     # @classmethod
     # def validate(cls, name: str, description: str, is_active: bool = None):
@@ -1,4 +1,6 @@
 from abc import ABC
+from datetime import datetime
+from typing import Optional, Tuple
 from core.__seedwork.domain.repositories import (
     SearchParams as DefaultSearchParams,
     SearchResult as DefaultSearchResult,
@@ -18,3 +20,16 @@ class _SearchResult(DefaultSearchResult):
 class CategoryRepository(SearchableRepositoryInterface[Category, _SearchParams, _SearchResult], ABC):
     SearchParams = _SearchParams
     SearchResult = _SearchResult
+
+    def search_version(self, input_params: _SearchParams) -> Tuple[int, Optional[datetime]]:
+        # a number that any write to the listed categories changes and, when the
+        # repository knows it, the latest updated_at of them, found without reading
+        # a page; by default how many categories match and when the latest changed
+        term = (input_params.filter or '').lower()
+        updated_ats = [
+            item.updated_at or item.created_at for item in self.iter_all() if term in item.name.lower()
+        ]
+        return len(updated_ats), max(updated_ats, default=None)
+
+    async def asearch_version(self, input_params: _SearchParams) -> Tuple[int, Optional[datetime]]:
+        return self.search_version(input_params)
@@ -0,0 +1,258 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Tuple
+import uuid
+
+import numpy as np
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_ID_DTYPE = np.dtype((np.void, 16))
+_NAME_SEPARATOR = '\x00'
+
+
+class CategoryColumnarRepository(CategoryRepository):  # pylint: disable=too-many-instance-attributes
+    # categories are stored column by column, rows appended as they come, and a
+    # Category is only built for the rows returned to the caller; deleted rows are
+    # masked out and compacted once they are the majority. _order holds the position
+    # of every row, as bulk_insert puts its categories before the others
+
+    sortable_fields: List[str] = ['name', 'created_at']
+    default_sort: str = 'created_at'
+    default_sort_dir: str = 'desc'
+
+    def __init__(self) -> None:
+        self._clear()
+
+    @property
+    def items(self) -> List[Category]:
+        return [self._to_entity(row) for row in self._ordered_rows()]
+
+    @items.setter
+    def items(self, entities: List[Category]) -> None:
+        self._clear()
+        self._append(entities, 0)
+        self._last_order = len(entities) - 1
+
+    def insert(self, entity: Category) -> None:
+        self._append([entity], self._last_order + 1)
+        self._last_order += 1
+
+    def bulk_insert(self, entities: List[Category]) -> None:
+        self._first_order -= len(entities)
+        self._append(entities, self._first_order)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return self._to_entity(self._get_row(str(entity_id)))
+
+    def find_all(self) -> List[Category]:
+        return self.items
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[Category]:
+        # categories are built one chunk of rows at a time
+        rows = self._ordered_rows()
+        for start in range(0, len(rows), chunk_size):
+            yield from [self._to_entity(row) for row in rows[start:start + chunk_size]]
+
+    def update(self, entity: Category) -> None:
+        row = self._get_row(entity.id)
+        self._write(row, entity)
+        self._name_buffer = None
+        self._name_ranks = None
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        id_str = str(entity_id)
+        row = self._get_row(id_str)
+        self._alive[row] = False
+        self._deleted += 1
+        id_bytes = self._ids[row].tobytes()
+        del self._rows[id_bytes]
+        if self._duplicates:
+            repeated = np.flatnonzero((self._ids[:self._size] == self._ids[row]) & self._alive[:self._size])
+            if len(repeated):
+                self._rows[id_bytes] = int(repeated[0])
+                self._duplicates -= 1
+        if self._deleted > self._size // 2:
+            self._compact()
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        size = self._size
+        mask = self._alive[:size].copy()
+        if input_params.filter:
+            mask &= self._match_names(input_params.filter)
+        rows = np.flatnonzero(mask)
+
+        sort, sort_dir = (input_params.sort, input_params.sort_dir) \
+            if input_params.sort \
+            else (self.default_sort, self.default_sort_dir)
+        start = (input_params.page - 1) * input_params.per_page
+        limit = start + input_params.per_page
+        if sort in self.sortable_fields:
+            rows = self._order_rows(rows, self._sort_values(sort)[rows], self._order[rows], sort_dir == 'desc', limit)
+        else:
+            rows = rows[np.argsort(self._order[rows], kind='stable')]
+
+        return CategoryRepository.SearchResult(
+            items=[self._to_entity(row) for row in rows[start:limit]],
+            total=int(mask.sum()),
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    @staticmethod
+    def _order_rows(
+        rows: np.ndarray, values: np.ndarray, orders: np.ndarray, is_reverse: bool, limit: int
+    ) -> np.ndarray:
+        keys = -values if is_reverse else values
+        if limit < len(rows):
+            # keeps every row tied with the limit-th value, so ties stay in insertion order
+            kth = np.partition(keys, limit - 1)[limit - 1]
+            candidates = np.flatnonzero(keys <= kth)
+            rows, keys, orders = rows[candidates], keys[candidates], orders[candidates]
+        return rows[np.lexsort((orders, keys))][:limit]
+
+    def _ordered_rows(self) -> np.ndarray:
+        rows = np.flatnonzero(self._alive[:self._size])
+        return rows[np.argsort(self._order[rows], kind='stable')]
+
+    def _sort_values(self, sort: str) -> np.ndarray:
+        if sort == 'created_at':
+            return self._created_at[:self._size]
+        if self._name_ranks is None:
+            # dense ranks, so equal names share a rank and keep insertion order; names
+            # compare case-sensitively, as in the in-memory and Django repositories
+            names = np.array(self._names, dtype=str)
+            order = np.argsort(names, kind='stable')
+            sorted_names = names[order]
+            is_new_name = np.ones(self._size, dtype=bool)
+            is_new_name[1:] = sorted_names[1:] != sorted_names[:-1]
+            ranks = np.empty(self._size, dtype=np.int64)
+            ranks[order] = np.cumsum(is_new_name)
+            self._name_ranks = ranks
+        return self._name_ranks
+
+    def _match_names(self, filter_param: str) -> np.ndarray:
+        buffer, offsets = self._get_name_buffer()
+        term = filter_param.lower()
+        mask = np.zeros(self._size, dtype=bool)
+        if _NAME_SEPARATOR in term:
+            return mask
+        position = buffer.find(term)
+        while position != -1:
+            row = int(np.searchsorted(offsets, position, side='right')) - 1
+            mask[row] = True
+            position = buffer.find(term, int(offsets[row + 1]))
+        return mask
+
+    def _get_name_buffer(self) -> Tuple[str, np.ndarray]:
+        if self._name_buffer is None:
+            names = [name.lower() for name in self._names]
+            lengths = np.fromiter((len(name) + 1 for name in names), dtype=np.int64, count=len(names))
+            offsets = np.zeros(len(names) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            self._name_buffer = (_NAME_SEPARATOR.join(names) + _NAME_SEPARATOR, offsets)
+        return self._name_buffer
+
+    def _get_row(self, entity_id: str) -> int:
+        try:
+            return self._rows[uuid.UUID(entity_id).bytes]
+        except (KeyError, ValueError) as exception:
+            raise NotFoundException(f"Entity not found using id '{entity_id}'") from exception
+
+    def _to_entity(self, row: int) -> Category:
+        micros = timedelta(microseconds=int(self._created_at[row]))
+        return Category.restore(
+            unique_entity_id=UniqueEntityId(str(uuid.UUID(bytes=self._ids[row].tobytes()))),
+            name=self._names[row],
+            description=self._descriptions[row],
+            is_active=bool(self._is_active[row]),
+            created_at=(_EPOCH_UTC if self._is_aware[row] else _EPOCH) + micros,
+            updated_at=self._updated_at[row],
+        )
+
+    def _append(self, entities: List[Category], first_order: int) -> None:
+        self._reserve(self._size + len(entities))
+        self._order[self._size:self._size + len(entities)] = np.arange(first_order, first_order + len(entities))
+        for entity in entities:
+            row = self._size
+            self._size += 1
+            self._names.append(None)
+            self._descriptions.append(None)
+            self._updated_at.append(None)
+            self._write(row, entity)
+            id_bytes = self._ids[row].tobytes()
+            if id_bytes in self._rows:
+                self._duplicates += 1
+            else:
+                self._rows[id_bytes] = row
+        self._alive[self._size - len(entities):self._size] = True
+        self._name_buffer = None
+        self._name_ranks = None
+
+    def _write(self, row: int, entity: Category) -> None:
+        created_at = entity.created_at
+        is_aware = created_at.utcoffset() is not None
+        self._ids[row] = np.void(uuid.UUID(entity.id).bytes)
+        self._names[row] = entity.name
+        self._descriptions[row] = entity.description
+        self._updated_at[row] = entity.updated_at
+        self._is_active[row] = entity.is_active
+        self._created_at[row] = (created_at - (_EPOCH_UTC if is_aware else _EPOCH)) // _MICROSECOND
+        self._is_aware[row] = is_aware
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= len(self._alive):
+            return
+        capacity = max(capacity, 2 * len(self._alive), 16)
+        for column in ('_ids', '_is_active', '_created_at', '_is_aware', '_order', '_alive'):
+            current = getattr(self, column)
+            grown = np.zeros(capacity, dtype=current.dtype)
+            grown[:len(current)] = current
+            setattr(self, column, grown)
+
+    def _compact(self) -> None:
+        alive = np.flatnonzero(self._alive[:self._size])
+        self._ids = self._ids[alive]
+        self._is_active = self._is_active[alive]
+        self._created_at = self._created_at[alive]
+        self._is_aware = self._is_aware[alive]
+        self._order = self._order[alive]
+        self._alive = np.ones(len(alive), dtype=bool)
+        self._names = [self._names[row] for row in alive]
+        self._descriptions = [self._descriptions[row] for row in alive]
+        self._updated_at = [self._updated_at[row] for row in alive]
+        self._size = len(alive)
+        self._deleted = 0
+        self._rows = {}
+        for row, id_bytes in enumerate(self._ids.tolist()):
+            self._rows.setdefault(id_bytes, row)
+        self._duplicates = self._size - len(self._rows)
+        self._name_buffer = None
+        self._name_ranks = None
+
+    def _clear(self) -> None:
+        self._size = 0
+        self._deleted = 0
+        self._duplicates = 0
+        self._rows: Dict[bytes, int] = {}
+        self._ids = np.zeros(0, dtype=_ID_DTYPE)
+        self._is_active = np.zeros(0, dtype=bool)
+        self._created_at = np.zeros(0, dtype=np.int64)
+        self._is_aware = np.zeros(0, dtype=bool)
+        self._order = np.zeros(0, dtype=np.int64)
+        self._first_order = 0
+        self._last_order = -1
+        self._alive = np.zeros(0, dtype=bool)
+        self._names: List[str] = []
+        self._descriptions: List[str | None] = []
+        self._updated_at: List[datetime] = []
+        self._name_buffer = None
+        self._name_ranks = None
@@ -1,5 +1,14 @@
-from typing import Callable
+from contextlib import contextmanager
+from datetime import datetime
+import hashlib
+import json
+from typing import Callable, ClassVar, Dict, Iterator, Optional
 from dataclasses import dataclass
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views import View
+from rest_framework.exceptions import APIException, ParseError, ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request as DrfRequest
@@ -16,6 +25,7 @@ from core.category.infra.django.serializers import (
     CategorySerializer
 )
 from core.category.application.dto import CategoryOutput
+from core.__seedwork.domain.exceptions import ValidationException
 from core.__seedwork.infra.django.serializers import UUIDSerializer
 
 
@@ -28,6 +38,10 @@ class CategoryResource(APIView):
     update_use_case: Callable[[], UpdateCategoryUseCase]
     delete_use_case: Callable[[], DeleteCategoryUseCase]
 
+    # most SQL queries per request with CategoryDjangoRepository, see QueryBudgetMiddleware;
+    # listing checks the version and counts the total, and updating reads the category first
+    query_budgets: ClassVar[Dict[str, int]] = {'create': 1, 'list': 3, 'retrieve': 1, 'update': 2, 'destroy': 1}
+
     def post(self, request: DrfRequest):
 
         serializer = CategorySerializer(data=request.data)
@@ -40,21 +54,31 @@ class CategoryResource(APIView):
 
     def get(self, request: DrfRequest, id: str = None):  # pylint: disable=redefined-builtin,invalid-name
         if id:
-            return self.get_object(id)
+            return CategoryResource.conditional_response(request, self.get_object(id))
 
         input_param = ListCategoriesUseCase.Input(
             **request.query_params.dict()
         )
-        output = self.list_use_case().execute(input_param)
+        with CategoryResource.search_errors_as_bad_request():
+            # the page is only read and serialized when the client's copy is stale;
+            # If-Modified-Since is not enough here, a deletion leaves the latest
+            # updated_at as it was, so only the ETag (which counts) is checked
+            version, updated_at = self.list_use_case().version(input_param)
+            etag = CategoryResource.make_etag(request.get_full_path(), version, updated_at)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+            output = self.list_use_case().execute(input_param)
         data = CategoryCollectionSerializer(instance=output).data
-        return Response(data)
+        return CategoryResource.with_validators(Response(data), etag, updated_at)
 
     def get_object(self, id: str):  # pylint: disable=redefined-builtin,invalid-name
         CategoryResource.validate_id(id)
         input_param = GetCategoryUseCase.Input(id)
         output = self.get_use_case().execute(input_param)
         body = CategoryResource.category_to_response(output)
-        return Response(body)
+        return CategoryResource.with_category_validators(Response(body), output)
 
     def put(self, request: DrfRequest, id: str):
         CategoryResource.validate_id(id)
@@ -86,4 +110,116 @@ class CategoryResource(APIView):
     @staticmethod
     def validate_id(id: str):  # pylint: disable=redefined-builtin,invalid-name
         serializer = UUIDSerializer(data={'id': id})
-        serializer.is_valid(raise_exception=True)
\ No newline at end of file
+        serializer.is_valid(raise_exception=True)
+
+    @staticmethod
+    @contextmanager
+    def search_errors_as_bad_request() -> Iterator[None]:
+        # a malformed cursor, or one made for another sort, is the client's error
+        try:
+            yield
+        except ValidationException as exception:
+            raise ValidationError({'cursor': [str(exception)]}) from exception
+
+    @staticmethod
+    def make_etag(*parts) -> str:
+        return quote_etag(hashlib.md5('|'.join(map(str, parts)).encode()).hexdigest())
+
+    @staticmethod
+    def with_validators(response: HttpResponse, etag: str, updated_at: Optional[datetime]) -> HttpResponse:
+        response['ETag'] = etag
+        if updated_at is not None:
+            response['Last-Modified'] = http_date(updated_at.timestamp())
+        return response
+
+    @staticmethod
+    def with_category_validators(response: HttpResponse, output: CategoryOutput) -> HttpResponse:
+        etag = CategoryResource.make_etag(output.id, output.updated_at)
+        return CategoryResource.with_validators(response, etag, output.updated_at)
+
+    @staticmethod
+    def conditional_response(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        # 304 Not Modified when the client's copy matches the validators of the response
+        return get_conditional_response(
+            request,
+            etag=response.get('ETag'),
+            last_modified=parse_http_date_safe(response.get('Last-Modified')),
+            response=response
+        )
+
+
+@dataclass(slots=True)
+class CategoryAsyncResource(View):
+    # the CategoryResource endpoints through the use cases' execute_async, to be
+    # served by ASGI; DRF views are sync only, so this is a plain async Django view
+
+    create_use_case: Callable[[], CreateCategoryUseCase]
+    list_use_case: Callable[[], ListCategoriesUseCase]
+    get_use_case: Callable[[], GetCategoryUseCase]
+    update_use_case: Callable[[], UpdateCategoryUseCase]
+    delete_use_case: Callable[[], DeleteCategoryUseCase]
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        try:
+            return await View.dispatch(self, request, *args, **kwargs)
+        except APIException as exception:
+            # shaped as DRF's exception handler does, so both resources answer the same bodies
+            detail = exception.detail if isinstance(exception.detail, (list, dict)) else {'detail': exception.detail}
+            return JsonResponse(detail, status=exception.status_code, safe=False)
+
+    async def post(self, request: HttpRequest):
+        serializer = CategorySerializer(data=CategoryAsyncResource.parse_body(request))
+        serializer.is_valid(raise_exception=True)
+
+        input_param = CreateCategoryUseCase.Input(**serializer.validated_data)
+        output = await self.create_use_case().execute_async(input_param)
+        body = CategoryResource.category_to_response(output)
+        return JsonResponse(body, status=http.HTTP_201_CREATED)
+
+    async def get(self, request: HttpRequest, id: str = None):  # pylint: disable=redefined-builtin,invalid-name
+        if id:
+            CategoryResource.validate_id(id)
+            output = await self.get_use_case().execute_async(GetCategoryUseCase.Input(id))
+            response = JsonResponse(CategoryResource.category_to_response(output))
+            return CategoryResource.conditional_response(
+                request, CategoryResource.with_category_validators(response, output)
+            )
+
+        # as in CategoryResource.get, the page is only read when the client's copy is stale
+        input_param = ListCategoriesUseCase.Input(**request.GET.dict())
+        with CategoryResource.search_errors_as_bad_request():
+            version, updated_at = await self.list_use_case().version_async(input_param)
+            etag = CategoryResource.make_etag(request.get_full_path(), version, updated_at)
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+            output = await self.list_use_case().execute_async(input_param)
+        response = JsonResponse(CategoryCollectionSerializer(instance=output).data)
+        return CategoryResource.with_validators(response, etag, updated_at)
+
+    async def put(self, request: HttpRequest, id: str):  # pylint: disable=redefined-builtin,invalid-name
+        CategoryResource.validate_id(id)
+
+        serializer = CategorySerializer(data=CategoryAsyncResource.parse_body(request))
+        serializer.is_valid(raise_exception=True)
+        input_param = UpdateCategoryUseCase.Input(
+            **{
+                'id': id,
+                **serializer.validated_data
+            }
+        )
+        output = await self.update_use_case().execute_async(input_param)
+        return JsonResponse(CategoryResource.category_to_response(output))
+
+    async def delete(self, _request: HttpRequest, id: str):  # pylint: disable=redefined-builtin,invalid-name
+        CategoryResource.validate_id(id)
+        await self.delete_use_case().execute_async(DeleteCategoryUseCase.Input(id=id))
+        return HttpResponse(status=http.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def parse_body(request: HttpRequest):
+        try:
+            return json.loads(request.body or b'{}')
+        except ValueError as exception:
+            raise ParseError(f'JSON parse error - {exception}') from exception
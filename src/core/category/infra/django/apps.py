@@ -1,4 +1,6 @@
 from django.apps import AppConfig
+from django.conf import settings
+from core.__seedwork.domain.entities import set_restore_validation_rate
 
 
 class CategoryConfig(AppConfig):
@@ -6,3 +8,6 @@ class CategoryConfig(AppConfig):
     name = 'core.category.infra.django'
     verbose_name = 'Categories'
     label = 'category'
+
+    def ready(self) -> None:
+        set_restore_validation_rate(getattr(settings, 'ENTITY_RESTORE_VALIDATION_RATE', 0.0))
@@ -0,0 +1,53 @@
+# full-text search on categories.name: a FULLTEXT index on MySQL and an FTS5
+# table kept in sync by triggers on SQLite, both created by migration 0003;
+# other databases keep icontains; the FTS5 table is keyed on the implicit
+# rowids of categories, which VACUUM and the table rebuilds of SQLite may
+# renumber, so run INSERT INTO categories_fts (categories_fts) VALUES ('rebuild')
+# after them (migration 0004 does it after its own)
+import re
+from typing import TYPE_CHECKING, Any, List, Tuple
+from django.db import NotSupportedError
+from django.db.models import F, Lookup
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+    from django.db.models import QuerySet
+    from django.db.models.sql.compiler import SQLCompiler
+
+SQLITE_TABLE = 'categories_fts'
+
+
+class NameMatch(Lookup):
+    # every word of the match expression must start a word of the column, see filter_by_name
+
+    lookup_name = 'fulltext'
+
+    def as_mysql(self, compiler: 'SQLCompiler', connection: 'BaseDatabaseWrapper') -> Tuple[str, List[Any]]:
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'MATCH ({lhs}) AGAINST ({rhs} IN BOOLEAN MODE)', [*lhs_params, *rhs_params]
+
+    def as_sqlite(self, compiler: 'SQLCompiler', connection: 'BaseDatabaseWrapper') -> Tuple[str, List[Any]]:
+        # the FTS5 table shares the rowids of the table of the column
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        table = compiler.quote_name_unless_alias(self.lhs.alias)
+        return f'{table}.rowid IN (SELECT rowid FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH {rhs})', rhs_params
+
+    def as_sql(self, compiler: 'SQLCompiler', connection: 'BaseDatabaseWrapper') -> Tuple[str, List[Any]]:
+        raise NotSupportedError(f'No full-text index on {connection.vendor}')
+
+
+def is_supported(vendor: str) -> bool:
+    return vendor in ('mysql', 'sqlite')
+
+
+def filter_by_name(query: 'QuerySet', term: str, vendor: str) -> 'QuerySet':
+    # every word of the term must start a word of the name, e.g. 'mov doc' matches 'Movie Documentary';
+    # a term without words is left to icontains
+    words = re.findall(r'\w+', term)
+    if not words or not is_supported(vendor):
+        return query.filter(name__icontains=term)
+    match = ' '.join(f'+{word}*' for word in words) \
+        if vendor == 'mysql' \
+        else ' '.join(f'"{word}"*' for word in words)
+    return query.filter(NameMatch(F('name'), match))
@@ -2,7 +2,7 @@
 from core.__seedwork.domain.exceptions import EntityValidationException, LoadEntityException
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.category.domain.entities import Category
-from typing import TYPE_CHECKING
+from typing import Any, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .models import CategoryModel
@@ -10,15 +10,27 @@ if TYPE_CHECKING:
 
 class CategoryModelMapper:
 
+    # the columns read by to_entity_from_row, in order
+    row_fields: Tuple[str, ...] = ('id', 'name', 'description', 'is_active', 'created_at', 'updated_at')
+
     @staticmethod
     def to_entity(model: 'CategoryModel') -> Category:
+        return CategoryModelMapper.to_entity_from_row(
+            (model.id, model.name, model.description, model.is_active, model.created_at, model.updated_at)
+        )
+
+    @staticmethod
+    def to_entity_from_row(row: Tuple[Any, ...]) -> Category:
+        # rows come from values_list(*row_fields), so no model instance is built
+        model_id, name, description, is_active, created_at, updated_at = row
         try:
-            return Category(
-                unique_entity_id=UniqueEntityId(str(model.id)),
-                name=model.name,
-                description=model.description,
-                is_active=model.is_active,
-                created_at=model.created_at,
+            return Category.restore(
+                unique_entity_id=UniqueEntityId(str(model_id)),
+                name=name,
+                description=description,
+                is_active=is_active,
+                created_at=created_at,
+                updated_at=updated_at,
             )
         except EntityValidationException as exception:
             raise LoadEntityException(exception.error) from exception
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['created_at', 'id'], name='categories_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['name', 'id'], name='categories_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# the DDL is kept here, as it was when the migration was written; see fulltext.py for its use
+CREATE_SQL = {
+    'mysql': [
+        'CREATE FULLTEXT INDEX categories_name_fulltext ON categories (name)',
+    ],
+    'sqlite': [
+        "CREATE VIRTUAL TABLE categories_fts USING fts5(name, content='categories', content_rowid='rowid')",
+        'CREATE TRIGGER categories_fts_insert AFTER INSERT ON categories BEGIN '
+        'INSERT INTO categories_fts (rowid, name) VALUES (new.rowid, new.name); END',
+        'CREATE TRIGGER categories_fts_delete AFTER DELETE ON categories BEGIN '
+        "INSERT INTO categories_fts (categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name); END",
+        'CREATE TRIGGER categories_fts_update AFTER UPDATE OF name ON categories BEGIN '
+        "INSERT INTO categories_fts (categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name); "
+        'INSERT INTO categories_fts (rowid, name) VALUES (new.rowid, new.name); END',
+        "INSERT INTO categories_fts (categories_fts) VALUES ('rebuild')",
+    ],
+}
+
+DROP_SQL = {
+    'mysql': [
+        'DROP INDEX categories_name_fulltext ON categories',
+    ],
+    'sqlite': [
+        'DROP TRIGGER IF EXISTS categories_fts_insert',
+        'DROP TRIGGER IF EXISTS categories_fts_delete',
+        'DROP TRIGGER IF EXISTS categories_fts_update',
+        'DROP TABLE IF EXISTS categories_fts',
+    ],
+}
+
+
+def create_name_fulltext_index(_apps, schema_editor):
+    _execute(schema_editor.connection, CREATE_SQL)
+
+
+def drop_name_fulltext_index(_apps, schema_editor):
+    _execute(schema_editor.connection, DROP_SQL)
+
+
+def _execute(connection, statements):
+    with connection.cursor() as cursor:
+        for sql in statements.get(connection.vendor, []):
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0002_categorymodel_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_name_fulltext_index, drop_name_fulltext_index),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations, models
+
+# SQLite rebuilds the categories table to alter a column, which drops its triggers and may renumber
+# its rowids; the FTS5 table of migration 0003 is made whole again around the rebuild
+SQLITE_FULLTEXT_SQL = [
+    'DROP TRIGGER IF EXISTS categories_fts_insert',
+    'DROP TRIGGER IF EXISTS categories_fts_delete',
+    'DROP TRIGGER IF EXISTS categories_fts_update',
+    'CREATE TRIGGER categories_fts_insert AFTER INSERT ON categories BEGIN '
+    'INSERT INTO categories_fts (rowid, name) VALUES (new.rowid, new.name); END',
+    'CREATE TRIGGER categories_fts_delete AFTER DELETE ON categories BEGIN '
+    "INSERT INTO categories_fts (categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name); END",
+    'CREATE TRIGGER categories_fts_update AFTER UPDATE OF name ON categories BEGIN '
+    "INSERT INTO categories_fts (categories_fts, rowid, name) VALUES ('delete', old.rowid, old.name); "
+    'INSERT INTO categories_fts (rowid, name) VALUES (new.rowid, new.name); END',
+    "INSERT INTO categories_fts (categories_fts) VALUES ('rebuild')",
+]
+
+
+def fill_updated_at(apps, schema_editor):
+    # existing categories were last changed when they were created, as far as we know
+    CategoryModel = apps.get_model('category', 'CategoryModel')  # pylint: disable=invalid-name
+    CategoryModel.objects.using(schema_editor.connection.alias).update(updated_at=models.F('created_at'))
+
+
+def restore_name_fulltext_index(_apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for sql in SQLITE_FULLTEXT_SQL:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0003_categorymodel_name_fulltext'),
+    ]
+
+    operations = [
+        # runs last when the migration is reversed, after the table is rebuilt back
+        migrations.RunPython(migrations.RunPython.noop, restore_name_fulltext_index),
+        migrations.AddField(
+            model_name='categorymodel',
+            name='updated_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='categorymodel',
+            name='updated_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['updated_at'], name='categories_updated_at_idx'),
+        ),
+        migrations.RunPython(restore_name_fulltext_index, migrations.RunPython.noop),
+    ]
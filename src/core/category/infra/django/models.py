@@ -7,9 +7,16 @@ class CategoryModel(models.Model):
     description = models.TextField(null=True)
     is_active = models.BooleanField()
     created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
 
     class Meta:
         db_table = 'categories'
+        # id completes the ordering used by the repository searches
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='categories_created_at_id_idx'),
+            models.Index(fields=['name', 'id'], name='categories_name_id_idx'),
+            models.Index(fields=['updated_at'], name='categories_updated_at_idx'),
+        ]
 
     def __str__(self):
         return self.name
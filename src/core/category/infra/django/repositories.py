@@ -1,87 +1,362 @@
 # pylint: disable=no-member,unexpected-keyword-arg
-from typing import List, Type, TYPE_CHECKING
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, Type, TYPE_CHECKING
+import uuid
+from asgiref.sync import sync_to_async
 from django.core import exceptions as django_exceptions
-from django.core.paginator import Paginator
-from core.__seedwork.domain.exceptions import NotFoundException
+from django.db import connections, router, transaction
+from django.db.models import Count, Max, Q
+from core.__seedwork.domain.exceptions import EntitiesNotFoundException, NotFoundException, ValidationException
+from core.__seedwork.domain.repositories import SearchCursor, TotalCache
 from core.__seedwork.domain.value_objects import UniqueEntityId
+from core.__seedwork.infra.django.cache import CachedRepository
 from core.category.domain.entities import Category
 from core.category.domain.repositories import CategoryRepository
+from core.category.infra.django import fulltext
 from core.category.infra.django.mappers import CategoryModelMapper
 
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
     from core.category.infra.django.models import CategoryModel
 
 
 class CategoryDjangoRepository(CategoryRepository):
 
     sortable_fields: List[str] = ['name', 'created_at']
+    update_fields: List[str] = ['name', 'description', 'is_active', 'created_at', 'updated_at']
     model: Type['CategoryModel']
+    total_cache: TotalCache
+    use_fulltext: bool
+    batch_size: int
 
-    def __init__(self) -> None:
+    def __init__(self, total_cache_ttl: float = 30.0, use_fulltext: bool = False, batch_size: int = 1000) -> None:
         from core.category.infra.django.models import CategoryModel  # pylint: disable=import-outside-toplevel
         self.model = CategoryModel
+        self.total_cache = TotalCache(ttl=total_cache_ttl)
+        self.use_fulltext = use_fulltext
+        self.batch_size = batch_size
 
     def insert(self, entity: Category) -> None:
         model = CategoryModelMapper.to_model(entity)
-        model.save()
+        # the id is already set, so a plain save() would try an UPDATE first
+        model.save(force_insert=True)
+        self.total_cache.clear()
 
-    def bulk_insert(self, entities: List[Category]) -> None:
-        self.model.objects.bulk_create(
-            list(
-                map(
-                    CategoryModelMapper.to_model, entities
+    # the bulk operations write batch_size rows per statement, and each batch
+    # is its own transaction (bulk_create, bulk_update and delete are atomic)
+    def bulk_insert(self, entities: List[Category], batch_size: Optional[int] = None) -> None:
+        for batch in self._batches(entities, batch_size):
+            self.model.objects.bulk_create(
+                list(
+                    map(
+                        CategoryModelMapper.to_model, batch
+                    )
                 )
             )
-        )
+        self.total_cache.clear()
+
+    def bulk_upsert(self, entities: List[Category], batch_size: Optional[int] = None) -> None:
+        database = router.db_for_write(self.model)
+        features = connections[database].features
+        for batch in self._batches(entities, batch_size):
+            models = list(map(CategoryModelMapper.to_model, batch))
+            if getattr(features, 'supports_update_conflicts', False):
+                # MySQL updates on any unique key and rejects a conflict target
+                target = {'unique_fields': ['id']} if features.supports_update_conflicts_with_target else {}
+                self.model.objects.bulk_create(
+                    models, update_conflicts=True, update_fields=self.update_fields, **target
+                )
+                continue
+            # databases (or Django versions) without ON CONFLICT updates split the batch
+            with transaction.atomic(using=database):
+                existing_ids = self._find_existing_ids([model.pk for model in models])
+                self.model.objects.bulk_update(
+                    [model for model in models if self._to_pk(model.pk) in existing_ids], self.update_fields
+                )
+                self.model.objects.bulk_create(
+                    [model for model in models if self._to_pk(model.pk) not in existing_ids]
+                )
+        self.total_cache.clear()
 
     def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
         id_str = str(entity_id)
-        model = self._get(id_str)
-        return CategoryModelMapper.to_entity(model)
+        row = self._filter_by_id(id_str).values_list(*CategoryModelMapper.row_fields).first()
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        return CategoryModelMapper.to_entity_from_row(row)
 
     def find_all(self) -> List[Category]:
-        return [CategoryModelMapper.to_entity(model) for model in self.model.objects.all()]
+        return list(map(CategoryModelMapper.to_entity_from_row, self._rows(self.model.objects.all())))
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[Category]:
+        # rows are streamed (a server-side cursor where the database has one),
+        # so only chunk_size models are held in memory at a time
+        return map(
+            CategoryModelMapper.to_entity_from_row,
+            self._rows(self.model.objects.all()).iterator(chunk_size=chunk_size)
+        )
 
     def update(self, entity: Category) -> None:
-        self._get(entity.id)
-        model = CategoryModelMapper.to_model(entity)
-        model.save()
+        # a single UPDATE, the affected row count tells whether the category exists
+        fields = entity.to_dict()
+        fields.pop('id')
+        if not self._filter_by_id(entity.id).update(**fields):
+            raise NotFoundException(f"Entity not found using ID '{entity.id}'")
+        self.total_cache.clear()
+
+    def bulk_update(self, entities: List[Category], batch_size: Optional[int] = None) -> None:
+        # every id is checked before anything changes, so a missing one is not half applied;
+        # a row deleted since is caught by the row count and rolls its batch back
+        self._check_ids([entity.id for entity in entities], batch_size)
+        database = router.db_for_write(self.model)
+        for batch in self._batches(entities, batch_size):
+            self._write_batch(
+                database,
+                [entity.id for entity in batch],
+                lambda batch=batch: self.model.objects.using(database).bulk_update(
+                    list(map(CategoryModelMapper.to_model, batch)), self.update_fields
+                )
+            )
+        self.total_cache.clear()
 
     def delete(self, entity_id: str | UniqueEntityId) -> None:
         id_str = str(entity_id)
-        model = self._get(id_str)
-        model.delete()
+        deleted, _ = self._filter_by_id(id_str).delete()
+        if not deleted:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        self.total_cache.clear()
+
+    def bulk_delete(self, entity_ids: List[str | UniqueEntityId], batch_size: Optional[int] = None) -> None:
+        id_strs = [str(entity_id) for entity_id in entity_ids]
+        self._check_ids(id_strs, batch_size)
+        database = router.db_for_write(self.model)
+        label = self.model._meta.label  # pylint: disable=protected-access
+        for batch in self._batches(id_strs, batch_size):
+            self._write_batch(
+                database,
+                batch,
+                lambda batch=batch: self.model.objects.using(database).filter(pk__in=batch).delete()[1].get(label, 0)
+            )
+        self.total_cache.clear()
+
+    # the async methods use the async ORM; it still runs every query through
+    # sync_to_async, but under ASGI each request gets its own thread for it,
+    # so one worker keeps the queries of many requests in flight
+    async def ainsert(self, entity: Category) -> None:
+        model = CategoryModelMapper.to_model(entity)
+        await model.asave(force_insert=True)
+        self.total_cache.clear()
+
+    async def abulk_insert(self, entities: List[Category], batch_size: Optional[int] = None) -> None:
+        for batch in self._batches(entities, batch_size):
+            await self.model.objects.abulk_create(list(map(CategoryModelMapper.to_model, batch)))
+        self.total_cache.clear()
+
+    async def afind_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        id_str = str(entity_id)
+        row = await self._filter_by_id(id_str).values_list(*CategoryModelMapper.row_fields).afirst()
+        if row is None:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        return CategoryModelMapper.to_entity_from_row(row)
+
+    async def afind_all(self) -> List[Category]:
+        return [CategoryModelMapper.to_entity_from_row(row) async for row in self._rows(self.model.objects.all())]
+
+    async def aupdate(self, entity: Category) -> None:
+        fields = entity.to_dict()
+        fields.pop('id')
+        if not await self._filter_by_id(entity.id).aupdate(**fields):
+            raise NotFoundException(f"Entity not found using ID '{entity.id}'")
+        self.total_cache.clear()
+
+    async def adelete(self, entity_id: str | UniqueEntityId) -> None:
+        id_str = str(entity_id)
+        deleted, _ = await self._filter_by_id(id_str).adelete()
+        if not deleted:
+            raise NotFoundException(f"Entity not found using ID '{id_str}'")
+        self.total_cache.clear()
+
+    async def asearch(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        # a search runs two queries, so it hops to the ORM thread once instead of twice
+        return await sync_to_async(self.search)(input_params)
+
+    def _batches(self, items: List[Any], batch_size: Optional[int]) -> Iterator[List[Any]]:
+        size = batch_size or self.batch_size
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
+    def _check_ids(self, entity_ids: List[str], batch_size: Optional[int]) -> None:
+        missing_ids = []
+        for batch in self._batches(list(dict.fromkeys(entity_ids)), batch_size):
+            existing_ids = self._find_existing_ids(batch)
+            missing_ids.extend(entity_id for entity_id in batch if self._to_pk(entity_id) not in existing_ids)
+        if missing_ids:
+            raise EntitiesNotFoundException(missing_ids)
 
-    def _get(self, entity_id: str) -> 'CategoryModel':
+    def _write_batch(self, database: str, entity_ids: List[str], write: Callable[[], int]) -> None:
+        # one transaction per batch; when write() affects fewer rows than there are
+        # ids, a row went missing since _check_ids, so the batch is rolled back and
+        # checked again, which reports the missing ids (or writes it again)
+        with transaction.atomic(using=database):
+            if write() == len(set(map(self._to_pk, entity_ids))):
+                return
+            transaction.set_rollback(True, using=database)
+        self._check_ids(entity_ids, None)
+        self._write_batch(database, entity_ids, write)
+
+    def _find_existing_ids(self, entity_ids: List[str]) -> Set[uuid.UUID]:
+        # read from the database about to be written, a replica may lag behind
+        pks = [pk for pk in map(self._to_pk, entity_ids) if pk is not None]
+        query = self.model.objects.using(router.db_for_write(self.model))
+        return set(query.filter(pk__in=pks).values_list('pk', flat=True))
+
+    def _to_pk(self, entity_id: str) -> Optional[uuid.UUID]:
         try:
-            return self.model.objects.get(pk=entity_id)
-        except (self.model.DoesNotExist, django_exceptions.ValidationError) as exception:
-            raise NotFoundException(
-                f"Entity not found using ID '{entity_id}'") from exception
+            return self.model._meta.pk.to_python(entity_id)  # pylint: disable=protected-access
+        except django_exceptions.ValidationError:
+            return None
 
-    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
-        query = self.model.objects.all()
+    @staticmethod
+    def _rows(query: 'QuerySet[CategoryModel]') -> 'QuerySet':
+        # plain tuples are read instead of models, skipping Model.__init__ and the post_init signal
+        return query.values_list(*CategoryModelMapper.row_fields)
 
-        if input_params.filter:
-            query = query.filter(name__icontains=input_params.filter)
+    def _filter_by_id(self, entity_id: str) -> 'QuerySet[CategoryModel]':
+        try:
+            pk = self.model._meta.pk.to_python(entity_id)  # pylint: disable=protected-access
+        except django_exceptions.ValidationError as exception:
+            raise NotFoundException(f"Entity not found using ID '{entity_id}'") from exception
+        return self.model.objects.filter(pk=pk)
+
+    def search(self, input_params: CategoryRepository.SearchParams) -> CategoryRepository.SearchResult:
+        query = self._filter(self.model.objects.all(), input_params)
         if input_params.sort and input_params.sort in self.sortable_fields:
-            query = query.order_by(
-                input_params.sort if input_params.sort_dir == 'asc' else f'-{input_params.sort}'
-            )
+            sort, sort_dir = input_params.sort, 'asc' if input_params.sort_dir == 'asc' else 'desc'
         else:
-            query = query.order_by('-created_at')
+            sort, sort_dir = 'created_at', 'desc'
 
-        paginator = Paginator(query, input_params.per_page)
-        page_obj = paginator.page(input_params.page)
+        if input_params.cursor:
+            items, has_next, next_cursor, prev_cursor = self._search_after_cursor(query, input_params, sort, sort_dir)
+        else:
+            items, has_next, next_cursor, prev_cursor = self._search_page(query, input_params, sort, sort_dir)
+        total, with_total = self._count(query, input_params)
 
         return CategoryRepository.SearchResult(
-            items=[CategoryModelMapper.to_entity(
-                model) for model in page_obj.object_list],
-            total=paginator.count,
+            items=items,
+            total=total,
             current_page=input_params.page,
             per_page=input_params.per_page,
             sort=input_params.sort,
             sort_dir=input_params.sort_dir,
-            filter=input_params.filter
-        )
\ No newline at end of file
+            filter=input_params.filter,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            has_next=has_next,
+            with_total=with_total
+        )
+
+    def search_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        # one aggregate, served by the updated_at index when there is no filter
+        version = self._filter(self.model.objects.all(), input_params).aggregate(
+            count=Count('id'), updated_at=Max('updated_at')
+        )
+        return version['count'], version['updated_at']
+
+    async def asearch_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        version = await self._filter(self.model.objects.all(), input_params).aaggregate(
+            count=Count('id'), updated_at=Max('updated_at')
+        )
+        return version['count'], version['updated_at']
+
+    def _filter(
+        self, query: 'QuerySet[CategoryModel]', input_params: CategoryRepository.SearchParams
+    ) -> 'QuerySet[CategoryModel]':
+        if input_params.filter and self.use_fulltext:
+            return fulltext.filter_by_name(query, input_params.filter, connections[query.db].vendor)
+        if input_params.filter:
+            return query.filter(name__icontains=input_params.filter)
+        return query
+
+    def _search_page(
+        self, query: 'QuerySet[CategoryModel]', input_params: CategoryRepository.SearchParams, sort: str, sort_dir: str
+    ) -> Tuple[List[Category], bool, Optional[str], Optional[str]]:
+        # one extra row tells whether there is a next page without counting;
+        # id breaks ties, so both pagination modes walk the same order
+        start = (input_params.page - 1) * input_params.per_page
+        query = query.order_by(*self._ordering(sort, sort_dir == 'asc'))
+        rows = list(self._rows(query)[start:start + input_params.per_page + 1])
+        has_next = len(rows) > input_params.per_page
+        items = list(map(CategoryModelMapper.to_entity_from_row, rows[:input_params.per_page]))
+        if not items:
+            return items, False, None, None
+
+        next_cursor = SearchCursor.from_entity(items[-1], sort, sort_dir).encode() if has_next else None
+        prev_cursor = SearchCursor.from_entity(items[0], sort, sort_dir, is_before=True).encode() \
+            if input_params.page > 1 \
+            else None
+        return items, has_next, next_cursor, prev_cursor
+
+    def _count(
+        self, query: 'QuerySet[CategoryModel]', input_params: CategoryRepository.SearchParams
+    ) -> Tuple[Optional[int], str]:
+        if input_params.with_total == 'none':
+            return None, 'none'
+        if input_params.with_total == 'exact':
+            return query.count(), 'exact'
+
+        # name__icontains ignores the case, so filters differing only in case share a total
+        key = (input_params.filter or '').lower()
+        total = self.total_cache.get(key)
+        if total is None:
+            total = query.count()
+            self.total_cache.put(key, total)
+        return total, 'cached'
+
+    def _search_after_cursor(
+        self, query: 'QuerySet[CategoryModel]', input_params: CategoryRepository.SearchParams, sort: str, sort_dir: str
+    ) -> Tuple[List[Category], bool, Optional[str], Optional[str]]:
+        # keyset pagination: the rows next to the cursor are found through the
+        # (sort, id) ordering, so every page costs the same as the first one
+        cursor = SearchCursor.decode(input_params.cursor)
+        if (cursor.sort, cursor.sort_dir) != (sort, sort_dir):
+            raise ValidationException(f"Cursor does not match the sort '{sort}' '{sort_dir}'")
+        try:
+            value = self.model._meta.get_field(sort).to_python(cursor.value)  # pylint: disable=protected-access
+        except django_exceptions.ValidationError as exception:
+            raise ValidationException(f"Invalid cursor '{input_params.cursor}'") from exception
+
+        # pages before the cursor are read walking backwards and reversed
+        is_ascending = (sort_dir == 'asc') != cursor.is_before
+        lookup = 'gt' if is_ascending else 'lt'
+        query = query.filter(Q(**{f'{sort}__{lookup}': value}) | Q(**{sort: value, f'id__{lookup}': cursor.id}))
+        rows = list(self._rows(query.order_by(*self._ordering(sort, is_ascending)))[:input_params.per_page + 1])
+        has_more = len(rows) > input_params.per_page
+        items = list(map(CategoryModelMapper.to_entity_from_row, rows[:input_params.per_page]))
+        if cursor.is_before:
+            items.reverse()
+        if not items:
+            return items, False, None, None
+
+        has_next, has_previous = (has_more, True) if not cursor.is_before else (True, has_more)
+        next_cursor = SearchCursor.from_entity(items[-1], sort, sort_dir).encode() if has_next else None
+        prev_cursor = SearchCursor.from_entity(items[0], sort, sort_dir, is_before=True).encode() \
+            if has_previous \
+            else None
+        return items, has_next, next_cursor, prev_cursor
+
+    @staticmethod
+    def _ordering(sort: str, is_ascending: bool) -> List[str]:
+        return [sort, 'id'] if is_ascending else [f'-{sort}', '-id']
+
+
+class CategoryCachedRepository(CachedRepository, CategoryRepository):
+
+    def __init__(self, repository: CategoryRepository, cache_alias: str = 'default', ttl: int = 300) -> None:
+        super().__init__(repository, 'category', cache_alias, ttl)
+
+    def search_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        return self._repository.search_version(input_params)
+
+    async def asearch_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        return await self._repository.asearch_version(input_params)
@@ -8,6 +8,7 @@ class CategorySerializer(ResourceSerializer):  # pylint: disable=abstract-method
     description = serializers.CharField(required=False, allow_null=True)
     is_active = serializers.BooleanField(required=False)
     created_at = serializers.DateTimeField(read_only=True, format=ISO_8601)
+    updated_at = serializers.DateTimeField(read_only=True, format=ISO_8601)
 
 
 class CategoryCollectionSerializer(CollectionSerializer):  # pylint: disable=abstract-method
@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from django_app.container import container
-from .api import CategoryResource
+from .api import CategoryAsyncResource, CategoryResource
+
+# the async views only pay off when served by ASGI
+_Resource = CategoryAsyncResource if settings.ASYNC_VIEWS else CategoryResource
 
 
 def __init_category_resource():
@@ -14,10 +18,10 @@ def __init_category_resource():
 
 
 urlpatterns = [
-    path('categories/', CategoryResource.as_view(
+    path('categories/', _Resource.as_view(
         **__init_category_resource()
     )),
-    path('categories/<uuid:id>/', CategoryResource.as_view(
+    path('categories/<uuid:id>/', _Resource.as_view(
         **__init_category_resource()
     ))
 ]
@@ -1,11 +1,21 @@
-from typing import List
-from core.__seedwork.domain.repositories import InMemorySearchableRepository
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+from core.__seedwork.domain.repositories import CopyOnWriteRepository, InMemorySearchableRepository, NGramIndex
+from core.__seedwork.infra.in_memory.persistence import DurableRepository
 from core.category.domain.entities import Category
 from core.category.domain.repositories import CategoryRepository
 
 
 class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    default_sort = "created_at"
+    default_sort_dir = "desc"
+    name_index: Optional[NGramIndex]
+
+    def __init__(self, use_name_index: bool = False) -> None:
+        super().__init__()
+        self.name_index = NGramIndex() if use_name_index else None
 
     def _apply_filter(self, items: List[Category], filter_param: str = None) -> List[Category]:
         if filter_param:
@@ -16,7 +26,62 @@ class CategoryInMemoryRepository(CategoryRepository, InMemorySearchableRepositor
             return list(filter_obj)
         return items
 
-    def _apply_sort(self, items: List[Category], sort: str = None, sort_dir: str = None) -> List[Category]:
-        return super()._apply_sort(items, sort, sort_dir) \
-            if sort \
-            else super()._apply_sort(items, "created_at", "desc")
+    def clone(self) -> 'CategoryInMemoryRepository':
+        repository = super().clone()
+        if self.name_index is not None:
+            repository.name_index = self.name_index.copy()
+        return repository
+
+    def search_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        # every write bumps _version, which is cheaper than scanning the categories
+        return self._version, None
+
+    def _find_filtered_keys(self, filter_param: str) -> Optional[Set[int]]:
+        if self.name_index is None:
+            return None
+        return self.name_index.search(filter_param)
+
+    def _on_add(self, key: int, entity: Category) -> None:
+        super()._on_add(key, entity)
+        if self.name_index is not None:
+            self.name_index.add(key, entity.name)
+
+    def _on_add_many(self, items: List[Tuple[int, Category]]) -> None:
+        super()._on_add_many(items)
+        if self.name_index is not None:
+            for key, entity in items:
+                self.name_index.add(key, entity.name)
+
+    def _on_remove(self, key: int, entity: Category) -> None:
+        super()._on_remove(key, entity)
+        if self.name_index is not None:
+            self.name_index.remove(key)
+
+    def _on_clear(self) -> None:
+        super()._on_clear()
+        if self.name_index is not None:
+            self.name_index.clear()
+
+
+class CategoryCopyOnWriteRepository(CopyOnWriteRepository, CategoryRepository):
+
+    def __init__(self, use_name_index: bool = False) -> None:
+        super().__init__(CategoryInMemoryRepository(use_name_index))
+
+    def search_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        return self.snapshot.search_version(input_params)
+
+
+class CategoryDurableRepository(DurableRepository, CategoryRepository):
+
+    def __init__(
+        self,
+        directory: str | Path,
+        sync_every: int = 1,
+        snapshot_every: int = 100_000,
+        use_name_index: bool = False
+    ) -> None:
+        super().__init__(CategoryInMemoryRepository(use_name_index), directory, sync_every, snapshot_every)
+
+    def search_version(self, input_params: CategoryRepository.SearchParams) -> Tuple[int, Optional[datetime]]:
+        return self._repository.search_version(input_params)
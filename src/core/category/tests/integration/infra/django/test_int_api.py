@@ -0,0 +1,258 @@
+import json
+import unittest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+import pytest
+from rest_framework.test import APIRequestFactory
+from core.__seedwork.infra.django.middlewares import QueryBudgetMiddleware
+from core.category.application.use_cases import (
+    CreateCategoryUseCase,
+    ListCategoriesUseCase,
+    GetCategoryUseCase,
+    UpdateCategoryUseCase,
+    DeleteCategoryUseCase
+)
+from core.category.domain.entities import Category
+from core.category.infra.django.api import CategoryAsyncResource, CategoryResource
+from core.category.infra.django.repositories import CategoryDjangoRepository
+
+
+@pytest.mark.django_db
+class TestCategoryResourceQueryBudgetsInt(unittest.TestCase):
+
+    @pytest.fixture(autouse=True)
+    def inject_query_budget(self, query_budget):
+        self.query_budget = query_budget  # pylint: disable=attribute-defined-outside-init
+
+    def setUp(self):
+        self.repo = CategoryDjangoRepository()
+        self.view = CategoryResource.as_view(
+            create_use_case=lambda: CreateCategoryUseCase(self.repo),
+            list_use_case=lambda: ListCategoriesUseCase(self.repo),
+            get_use_case=lambda: GetCategoryUseCase(self.repo),
+            update_use_case=lambda: UpdateCategoryUseCase(self.repo),
+            delete_use_case=lambda: DeleteCategoryUseCase(self.repo),
+        )
+        self.factory = APIRequestFactory()
+        self.category = Category(name='Movie')
+        self.repo.insert(self.category)
+
+    def test_endpoints_stay_within_their_budgets(self):
+        url = f'/categories/{self.category.id}/'
+        arrange = [
+            ('create', self.factory.post('/categories/', {'name': 'Series'}, format='json'), {}, 201),
+            ('list', self.factory.get('/categories/?filter=movie'), {}, 200),
+            ('retrieve', self.factory.get(url), {'id': self.category.id}, 200),
+            ('update', self.factory.put(url, {'name': 'Movie updated'}, format='json'), {'id': self.category.id}, 200),
+            ('destroy', self.factory.delete(url), {'id': self.category.id}, 204),
+        ]
+        for action, request, kwargs, status in arrange:
+            with self.subTest(action=action):
+                with self.query_budget(CategoryResource.query_budgets[action]):
+                    response = self.view(request, **kwargs)
+                self.assertEqual(response.status_code, status)
+
+    def test_middleware_reports_the_queries_of_a_request(self):
+        def view(_request):
+            self.repo.find_all()
+            self.repo.find_by_id(self.category.id)
+            return HttpResponse()
+        view.cls = CategoryResource
+        middleware = QueryBudgetMiddleware(lambda request: view(request))
+        request = RequestFactory().get('/1/')
+
+        middleware.process_view(request, view, (), {'id': '1'})
+        with self.assertLogs('core.__seedwork.infra.django.middlewares', 'WARNING') as logs:
+            with override_settings(QUERY_COUNT_HEADERS=True):
+                response = middleware(request)
+        self.assertEqual(response['X-Query-Count'], '2')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="2 queries"$')
+        self.assertIn('GET /1/ ran 2 queries, over its budget of 1', logs.output[0])
+
+    def test_middleware_hides_the_headers_by_default_and_budgets_lists_apart(self):
+        def view(_request):
+            self.repo.find_all()
+            self.repo.find_by_id(self.category.id)
+            return HttpResponse()
+        view.cls = CategoryResource
+        middleware = QueryBudgetMiddleware(lambda request: view(request))
+        request = RequestFactory().get('/')
+
+        middleware.process_view(request, view, (), {})
+        with self.assertNoLogs('core.__seedwork.infra.django.middlewares', 'WARNING'):
+            response = middleware(request)
+        self.assertNotIn('X-Query-Count', response)
+        self.assertNotIn('Server-Timing', response)
+
+    def test_async_middleware_reports_the_queries_run_in_the_orm_thread(self):
+        async def view(_request):
+            await sync_to_async(self.repo.find_all)()
+            await self.repo.afind_by_id(self.category.id)
+            return HttpResponse()
+        middleware = QueryBudgetMiddleware(view)
+        with override_settings(QUERY_COUNT_HEADERS=True):
+            response = async_to_sync(middleware)(RequestFactory().get('/'))
+        self.assertEqual(response['X-Query-Count'], '2')
+
+
+@pytest.mark.django_db
+class TestCategoryAsyncResourceInt(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = CategoryDjangoRepository()
+        self.view = CategoryAsyncResource.as_view(
+            create_use_case=lambda: CreateCategoryUseCase(self.repo),
+            list_use_case=lambda: ListCategoriesUseCase(self.repo),
+            get_use_case=lambda: GetCategoryUseCase(self.repo),
+            update_use_case=lambda: UpdateCategoryUseCase(self.repo),
+            delete_use_case=lambda: DeleteCategoryUseCase(self.repo),
+        )
+        self.factory = RequestFactory()
+
+    def request(self, request, **kwargs):
+        response = async_to_sync(self.view)(request, **kwargs)
+        return response.status_code, json.loads(response.content) if response.content else None
+
+    def test_endpoints(self):
+        status, body = self.request(
+            self.factory.post('/categories/', {'name': 'Movie'}, content_type='application/json')
+        )
+        self.assertEqual((status, body['data']['name']), (201, 'Movie'))
+        category_id = body['data']['id']
+        url = f'/categories/{category_id}/'
+
+        status, body = self.request(self.factory.get(url), id=category_id)
+        self.assertEqual((status, body['data']['id']), (200, category_id))
+
+        status, body = self.request(
+            self.factory.put(url, {'name': 'Movie updated', 'is_active': False}, content_type='application/json'),
+            id=category_id
+        )
+        self.assertEqual((status, body['data']['name'], body['data']['is_active']), (200, 'Movie updated', False))
+
+        status, body = self.request(self.factory.get('/categories/?filter=updated'))
+        self.assertEqual(
+            (status, [item['id'] for item in body['data']], body['meta']['total']), (200, [category_id], 1)
+        )
+
+        status, body = self.request(self.factory.delete(url), id=category_id)
+        self.assertEqual((status, body), (204, None))
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_validation_errors(self):
+        status, body = self.request(self.factory.post('/categories/', {}, content_type='application/json'))
+        self.assertEqual((status, body), (400, {'name': ['This field is required.']}))
+
+        status, body = self.request(self.factory.get('/categories/fake-id/'), id='fake-id')
+        self.assertEqual((status, body), (400, {'id': ['Must be a valid UUID.']}))
+
+        for content in ['{"name":', b'\xff']:
+            with self.subTest(content=content):
+                status, body = self.request(
+                    self.factory.post('/categories/', content, content_type='application/json')
+                )
+                self.assertEqual(status, 400)
+                self.assertTrue(body['detail'].startswith('JSON parse error - '))
+
+        status, body = self.request(self.factory.get('/categories/?cursor=fake-cursor'))
+        self.assertEqual((status, body), (400, {'cursor': ["Invalid cursor 'fake-cursor'"]}))
+
+    def test_get_answers_not_modified(self):
+        category = Category(name='Movie')
+        self.repo.insert(category)
+        url = f'/categories/{category.id}/'
+        response = async_to_sync(self.view)(self.factory.get(url), id=category.id)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+        response = async_to_sync(self.view)(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), id=category.id)
+        self.assertEqual((response.status_code, response['ETag']), (304, etag))
+        response = async_to_sync(self.view)(
+            self.factory.get(url, HTTP_IF_MODIFIED_SINCE=last_modified), id=category.id
+        )
+        self.assertEqual(response.status_code, 304)
+
+        url = '/categories/?filter=movie'
+        response = async_to_sync(self.view)(self.factory.get(url))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+        response = async_to_sync(self.view)(self.factory.get(url, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 304)
+
+        category.update(name='Movie updated', description=None)
+        self.repo.update(category)
+        response = async_to_sync(self.view)(self.factory.get(url, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@pytest.mark.django_db
+class TestCategoryResourceConditionalGetInt(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = CategoryDjangoRepository()
+        self.view = CategoryResource.as_view(
+            create_use_case=lambda: CreateCategoryUseCase(self.repo),
+            list_use_case=lambda: ListCategoriesUseCase(self.repo),
+            get_use_case=lambda: GetCategoryUseCase(self.repo),
+            update_use_case=lambda: UpdateCategoryUseCase(self.repo),
+            delete_use_case=lambda: DeleteCategoryUseCase(self.repo),
+        )
+        self.factory = APIRequestFactory()
+        self.categories = [Category(name='Movie'), Category(name='Series')]
+        self.repo.bulk_insert(self.categories)
+
+    def test_detail_answers_not_modified(self):
+        category = self.categories[0]
+        url = f'/categories/{category.id}/'
+        response = self.view(self.factory.get(url), id=category.id)
+        self.assertEqual(response.status_code, 200)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+
+        response = self.view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), id=category.id)
+        self.assertEqual((response.status_code, response['ETag']), (304, etag))
+        response = self.view(self.factory.get(url, HTTP_IF_MODIFIED_SINCE=last_modified), id=category.id)
+        self.assertEqual(response.status_code, 304)
+
+        category.update(name='Movie updated', description=None)
+        self.repo.update(category)
+        response = self.view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), id=category.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_answers_not_modified_without_reading_the_page(self):
+        url = '/categories/?filter=e&per_page=1'
+        response = self.view(self.factory.get(url))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual((response.status_code, len(context.captured_queries)), (304, 1))
+        response = self.view(self.factory.get('/categories/?filter=e&per_page=2', HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+
+        self.repo.delete(self.categories[0].id)
+        response = self.view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        self.categories[1].deactivate()
+        self.repo.update(self.categories[1])
+        response = self.view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_answers_bad_request_for_invalid_cursors(self):
+        response = self.view(self.factory.get('/categories/?sort=name&per_page=1'))
+        cursor = response.data['meta']['next_cursor']
+
+        response = self.view(self.factory.get('/categories/?cursor=fake-cursor'))
+        self.assertEqual((response.status_code, response.data), (400, {'cursor': ["Invalid cursor 'fake-cursor'"]}))
+        response = self.view(self.factory.get(f'/categories/?sort=created_at&per_page=1&cursor={cursor}'))
+        self.assertEqual(
+            (response.status_code, response.data),
+            (400, {'cursor': ["Cursor does not match the sort 'created_at' 'asc'"]})
+        )
@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+import os
+import tempfile
+import unittest
+import uuid
+
+from django.db import connection, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.migrations.executor import MigrationExecutor
+from django.test import override_settings
+import pytest
+
+from core.category.infra.django import fulltext
+from core.category.infra.django.models import CategoryModel
+
+FULLTEXT_TRIGGERS = ['categories_fts_delete', 'categories_fts_insert', 'categories_fts_update']
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'the migrations are run on a SQLite file')
+class TestCategoryMigrationsInt(unittest.TestCase):
+    # the tests run without migrations, so these run the real chain on a database of their own
+    database: BaseDatabaseWrapper
+
+    @pytest.fixture(autouse=True)
+    def unblock_database(self, django_db_blocker):
+        with django_db_blocker.unblock():
+            yield
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        # the test run turns the migrations off
+        migrations = override_settings(MIGRATION_MODULES={})
+        migrations.enable()
+        self.addCleanup(migrations.disable)
+        connections.settings['migrations'] = {
+            **connection.settings_dict, 'NAME': os.path.join(directory.name, 'db.sqlite3')
+        }
+        self.addCleanup(connections.settings.pop, 'migrations')
+        self.database = connections['migrations']
+        self.addCleanup(delattr, connections._connections, 'migrations')  # pylint: disable=protected-access
+        self.addCleanup(self.database.close)
+
+    def migrate(self, name: str) -> None:
+        executor = MigrationExecutor(self.database)
+        executor.migrate([('category', name)])
+
+    def fetch(self, sql: str, params=()) -> list:
+        with self.database.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def search(self, term: str) -> list:
+        query = CategoryModel.objects.using('migrations').order_by('name')
+        return list(fulltext.filter_by_name(query, term, 'sqlite').values_list('name', flat=True))
+
+    def triggers(self) -> list:
+        rows = self.fetch("SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name")
+        return [name for name, in rows]
+
+    def test_updated_at_migration_keeps_fulltext_triggers(self):
+        self.migrate('0003_categorymodel_name_fulltext')
+        self.assertEqual(self.triggers(), FULLTEXT_TRIGGERS)
+
+        self.migrate('0004_categorymodel_updated_at')
+        self.assertEqual(self.triggers(), FULLTEXT_TRIGGERS)
+
+        self.migrate('0003_categorymodel_name_fulltext')
+        self.assertEqual(self.triggers(), FULLTEXT_TRIGGERS)
+        self.migrate('0002_categorymodel_indexes')
+        self.assertEqual(self.triggers(), [])
+        self.assertEqual(self.fetch("SELECT name FROM sqlite_master WHERE name = 'categories_fts'"), [])
+
+    def test_search_through_the_migrated_fulltext_index(self):
+        created_at = datetime(2022, 7, 20, tzinfo=timezone.utc)
+        self.migrate('0003_categorymodel_name_fulltext')
+        self.fetch(
+            'INSERT INTO categories (id, name, description, is_active, created_at) VALUES (%s, %s, NULL, 1, %s)',
+            [uuid.uuid4().hex, 'Movie Documentary', created_at.isoformat()]
+        )
+        self.migrate('0004_categorymodel_updated_at')
+        models = CategoryModel.objects.using('migrations')
+        models.create(
+            id=uuid.uuid4(), name='Documentary', is_active=True, created_at=created_at, updated_at=created_at
+        )
+        series = models.create(
+            id=uuid.uuid4(), name='Series', is_active=True, created_at=created_at, updated_at=created_at
+        )
+
+        self.assertEqual(self.search('documentary'), ['Documentary', 'Movie Documentary'])
+        models.filter(id=series.id).update(name='Movie Series')
+        self.assertEqual(self.search('mov'), ['Movie Documentary', 'Movie Series'])
+        models.filter(name='Movie Documentary').delete()
+        self.assertEqual(self.search('mov'), ['Movie Series'])
+        self.assertEqual(self.search('documentary'), ['Documentary'])
@@ -0,0 +1,359 @@
+from datetime import datetime, timedelta, timezone
+from importlib import import_module
+import tempfile
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from core.__seedwork.domain.entities import set_restore_validation_rate
+from core.__seedwork.domain.exceptions import (
+    EntitiesNotFoundException,
+    LoadEntityException,
+    NotFoundException,
+    ValidationException
+)
+from core.category.domain.entities import Category
+from core.category.infra.django.repositories import CategoryCachedRepository, CategoryDjangoRepository
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoRepositoryInt(unittest.TestCase):
+    repo: CategoryDjangoRepository
+
+    def setUp(self):
+        self.repo = CategoryDjangoRepository()
+
+    def test_find_by_id_and_find_all_hydrate_entities_from_rows(self):
+        entity = Category(
+            name='Movie', description='some description', is_active=False,
+            created_at=datetime(2022, 7, 20, tzinfo=timezone.utc)
+        )
+        self.repo.insert(entity)
+
+        with CaptureQueriesContext(connection) as context:
+            found = self.repo.find_by_id(entity.unique_entity_id)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(found.to_dict(), entity.to_dict())
+        self.assertEqual(self.repo.find_all()[0].to_dict(), entity.to_dict())
+        self.assertEqual([item.to_dict() for item in self.repo.iter_all(chunk_size=1)], [entity.to_dict()])
+
+        for entity_id in [Category(name='Series').id, 'fake id']:
+            with self.assertRaises(NotFoundException) as assert_error:
+                self.repo.find_by_id(entity_id)
+            self.assertEqual(assert_error.exception.args[0], f"Entity not found using ID '{entity_id}'")
+
+    def test_entities_are_loaded_without_validation_unless_sampled(self):
+        entity = Category(name='Movie')
+        self.repo.insert(entity)
+        self.repo.model.objects.filter(id=entity.id).update(name='t' * 300)
+
+        with mock.patch.object(Category, 'validate') as mock_validate:
+            self.assertEqual(self.repo.find_by_id(entity.id).name, 't' * 300)
+        mock_validate.assert_not_called()
+
+        set_restore_validation_rate(1.0)
+        self.addCleanup(set_restore_validation_rate, 0.0)
+        with self.assertRaises(LoadEntityException) as assert_error:
+            self.repo.find_all()
+        self.assertEqual(
+            assert_error.exception.error, {'name': ['Ensure this field has no more than 255 characters.']}
+        )
+
+    def test_update_and_delete_in_one_query(self):
+        entity = Category(name='Movie')
+        self.repo.insert(entity)
+
+        entity.update(name='Movie updated', description='some description')
+        with CaptureQueriesContext(connection) as context:
+            self.repo.update(entity)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(self.repo.find_by_id(entity.id).name, 'Movie updated')
+
+        with CaptureQueriesContext(connection) as context:
+            self.repo.delete(entity.unique_entity_id)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(self.repo.find_all(), [])
+
+    def test_throw_not_found_exception_in_update_and_delete(self):
+        entity = Category(name='Movie')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.update(entity)
+        self.assertEqual(assert_error.exception.args[0], f"Entity not found using ID '{entity.id}'")
+
+        for entity_id in [entity.id, 'fake id']:
+            with self.assertRaises(NotFoundException) as assert_error:
+                self.repo.delete(entity_id)
+            self.assertEqual(assert_error.exception.args[0], f"Entity not found using ID '{entity_id}'")
+
+    def test_bulk_insert_in_batches(self):
+        entities = [Category(name=f'Movie {index}') for index in range(5)]
+        with CaptureQueriesContext(connection) as context:
+            self.repo.bulk_insert(entities, batch_size=2)
+        self.assertEqual(len([query for query in context.captured_queries if 'INSERT' in query['sql']]), 3)
+        self.assertEqual(len(self.repo.find_all()), 5)
+
+    def test_bulk_upsert(self):
+        entities = [Category(name=f'Movie {index}') for index in range(3)]
+        self.repo.bulk_insert(entities[:2])
+        entities[1].update(name='Movie updated', description='some description')
+
+        for supports_update_conflicts in [True, False]:
+            with mock.patch.object(connection.features, 'supports_update_conflicts', supports_update_conflicts):
+                self.repo.bulk_upsert(entities, batch_size=2)
+            self.assertEqual(
+                sorted((item.id, item.name, item.description) for item in self.repo.find_all()),
+                sorted((item.id, item.name, item.description) for item in entities)
+            )
+
+    def test_bulk_update_and_bulk_delete(self):
+        entities = [Category(name=f'Movie {index}') for index in range(4)]
+        self.repo.bulk_insert(entities)
+        for entity in entities[:3]:
+            entity.update(name=f'{entity.name} updated', description=None)
+
+        self.repo.bulk_update(entities[:3], batch_size=2)
+        self.assertEqual(
+            sorted(item.name for item in self.repo.find_all()),
+            ['Movie 0 updated', 'Movie 1 updated', 'Movie 2 updated', 'Movie 3']
+        )
+
+        self.repo.bulk_delete([entities[0].id, entities[2].unique_entity_id], batch_size=1)
+        self.assertEqual(sorted(item.id for item in self.repo.find_all()), sorted([entities[1].id, entities[3].id]))
+
+    def test_throw_entities_not_found_exception_in_bulk_update_and_bulk_delete(self):
+        entity = Category(name='Movie')
+        self.repo.insert(entity)
+        missing = Category(name='Series')
+
+        with self.assertRaises(EntitiesNotFoundException) as assert_error:
+            self.repo.bulk_update([entity, missing])
+        self.assertEqual(assert_error.exception.entity_ids, [missing.id])
+
+        with self.assertRaises(EntitiesNotFoundException) as assert_error:
+            self.repo.bulk_delete([missing.id, entity.id, 'fake id'], batch_size=1)
+        self.assertEqual(assert_error.exception.entity_ids, [missing.id, 'fake id'])
+        self.assertEqual(self.repo.find_all()[0].id, entity.id)
+
+    def test_rolls_back_a_batch_that_lost_a_row_after_the_check(self):
+        entities = [Category(name='Movie'), Category(name='Series')]
+        self.repo.bulk_insert(entities)
+        deleted = Category(name='Documentary')
+        find_existing_ids = self.repo._find_existing_ids  # pylint: disable=protected-access
+        deleted_pk = self.repo._to_pk(deleted.id)  # pylint: disable=protected-access
+        # the first check still sees the row that is gone by the time of the write
+        checks = iter([lambda ids: {*find_existing_ids(ids), deleted_pk}])
+        for entity in entities:
+            entity.update(name=f'{entity.name} updated', description=None)
+
+        with mock.patch.object(
+            self.repo, '_find_existing_ids', side_effect=lambda ids: next(checks, find_existing_ids)(ids)
+        ):
+            with self.assertRaises(EntitiesNotFoundException) as assert_error:
+                self.repo.bulk_update([*entities, deleted])
+            self.assertEqual(assert_error.exception.entity_ids, [deleted.id])
+            self.assertEqual(sorted(item.name for item in self.repo.find_all()), ['Movie', 'Series'])
+
+            checks = iter([lambda ids: {*find_existing_ids(ids), deleted_pk}])
+            with self.assertRaises(EntitiesNotFoundException) as assert_error:
+                self.repo.bulk_delete([entities[0].id, deleted.id])
+            self.assertEqual(assert_error.exception.entity_ids, [deleted.id])
+            self.assertEqual(len(self.repo.find_all()), 2)
+
+    def test_search_walks_pages_with_cursors(self):
+        created_at = datetime(2022, 7, 20, tzinfo=timezone.utc)
+        # equal names check that ties are broken by id
+        entities = [
+            Category(name=f'Movie {index // 2}', created_at=created_at + timedelta(seconds=index))
+            for index in range(7)
+        ]
+        self.repo.bulk_insert(entities)
+        for sort, sort_dir in [('name', 'asc'), ('name', 'desc'), (None, None)]:
+            first_page = self.repo.search(CategoryDjangoRepository.SearchParams(
+                per_page=3, sort=sort, sort_dir=sort_dir
+            ))
+            expected = [item.id for item in self.repo.search(CategoryDjangoRepository.SearchParams(
+                per_page=10, sort=sort, sort_dir=sort_dir
+            )).items]
+            self.assertIsNone(first_page.prev_cursor)
+
+            pages = [first_page]
+            while pages[-1].next_cursor:
+                pages.append(self.repo.search(CategoryDjangoRepository.SearchParams(
+                    per_page=3, sort=sort, sort_dir=sort_dir, cursor=pages[-1].next_cursor
+                )))
+            self.assertEqual([item.id for page in pages for item in page.items], expected)
+            self.assertEqual([len(page.items) for page in pages], [3, 3, 1])
+            self.assertEqual(pages[-1].total, 7)
+
+            previous_page = self.repo.search(CategoryDjangoRepository.SearchParams(
+                per_page=3, sort=sort, sort_dir=sort_dir, cursor=pages[-1].prev_cursor
+            ))
+            self.assertEqual(previous_page.items, pages[1].items)
+            previous_page = self.repo.search(CategoryDjangoRepository.SearchParams(
+                per_page=3, sort=sort, sort_dir=sort_dir, cursor=previous_page.prev_cursor
+            ))
+            self.assertEqual(previous_page.items, first_page.items)
+            self.assertIsNone(previous_page.prev_cursor)
+
+    def test_page_mode_returns_cursors(self):
+        entities = [Category(name=f'Movie {index}') for index in range(5)]
+        self.repo.bulk_insert(entities)
+        ids = [entity.id for entity in entities]
+
+        second_page = self.repo.search(CategoryDjangoRepository.SearchParams(page=2, per_page=2, sort='name'))
+        next_page = self.repo.search(CategoryDjangoRepository.SearchParams(
+            per_page=2, sort='name', cursor=second_page.next_cursor
+        ))
+        self.assertEqual([item.id for item in next_page.items], ids[4:])
+        self.assertIsNone(next_page.next_cursor)
+        previous_page = self.repo.search(CategoryDjangoRepository.SearchParams(
+            per_page=2, sort='name', cursor=second_page.prev_cursor
+        ))
+        self.assertEqual([item.id for item in previous_page.items], ids[:2])
+
+    def test_throw_validation_exception_when_cursor_does_not_match_the_sort(self):
+        self.repo.bulk_insert([Category(name='Movie'), Category(name='Series')])
+        first_page = self.repo.search(CategoryDjangoRepository.SearchParams(per_page=1, sort='name'))
+
+        with self.assertRaises(ValidationException):
+            self.repo.search(CategoryDjangoRepository.SearchParams(per_page=1, cursor=first_page.next_cursor))
+
+    def test_search_with_total_modes(self):
+        self.repo.bulk_insert([Category(name=f'Movie {index}') for index in range(5)])
+
+        result = self.repo.search(CategoryDjangoRepository.SearchParams(per_page=2, filter='movie'))
+        self.assertEqual((result.total, result.last_page, result.has_next, result.with_total), (5, 3, True, 'exact'))
+
+        result = self.repo.search(CategoryDjangoRepository.SearchParams(page=3, per_page=2, with_total='none'))
+        self.assertEqual(len(result.items), 1)
+        self.assertEqual(
+            (result.total, result.last_page, result.has_next, result.with_total), (None, None, False, 'none')
+        )
+
+        result = self.repo.search(
+            CategoryDjangoRepository.SearchParams(per_page=2, filter='Movie', with_total='cached')
+        )
+        self.assertEqual((result.total, result.with_total), (5, 'cached'))
+        self.assertEqual(self.repo.total_cache.get('movie'), 5)
+
+        self.repo.insert(Category(name='Movie 5'))
+        self.assertIsNone(self.repo.total_cache.get('movie'))
+        result = self.repo.search(
+            CategoryDjangoRepository.SearchParams(per_page=2, filter='movie', with_total='cached')
+        )
+        self.assertEqual(result.total, 6)
+
+    def test_search_using_fulltext_index(self):
+        # the tests run without migrations, so the index is made by the one that adds it
+        migration = import_module('core.category.infra.django.migrations.0003_categorymodel_name_fulltext')
+        schema_editor = SimpleNamespace(connection=connection)
+        migration.create_name_fulltext_index(None, schema_editor)
+        self.addCleanup(migration.drop_name_fulltext_index, None, schema_editor)
+        repo = CategoryDjangoRepository(use_fulltext=True)
+        entities = [Category(name='Movie Documentary'), Category(name='Documentary'), Category(name='Series')]
+        repo.bulk_insert(entities)
+        entities[2].update(name='Movie Series', description=None)
+        repo.update(entities[2])
+
+        result = repo.search(CategoryDjangoRepository.SearchParams(filter='mov', sort='name', sort_dir='asc'))
+        self.assertEqual([item.id for item in result.items], [entities[0].id, entities[2].id])
+        result = repo.search(CategoryDjangoRepository.SearchParams(filter='documentary MOVIE'))
+        self.assertEqual([item.id for item in result.items], [entities[0].id])
+        self.assertEqual(result.total, 1)
+        result = repo.search(CategoryDjangoRepository.SearchParams(filter='!'))
+        self.assertEqual(result.total, 0)
+
+    def test_async_methods(self):
+        entities = [Category(name='Movie'), Category(name='Series')]
+        async_to_sync(self.repo.ainsert)(entities[0])
+        async_to_sync(self.repo.abulk_insert)(entities[1:])
+        self.assertEqual(
+            sorted(item.id for item in async_to_sync(self.repo.afind_all)()), sorted(item.id for item in entities)
+        )
+
+        entities[0].update(name='Movie updated', description=None)
+        async_to_sync(self.repo.aupdate)(entities[0])
+        self.assertEqual(async_to_sync(self.repo.afind_by_id)(entities[0].id).name, 'Movie updated')
+        result = async_to_sync(self.repo.asearch)(CategoryDjangoRepository.SearchParams(filter='updated'))
+        self.assertEqual(([item.id for item in result.items], result.total), ([entities[0].id], 1))
+
+        async_to_sync(self.repo.adelete)(entities[0].unique_entity_id)
+        for method, argument in [(self.repo.afind_by_id, entities[0].id), (self.repo.adelete, 'fake id')]:
+            with self.assertRaises(NotFoundException):
+                async_to_sync(method)(argument)
+        with self.assertRaises(NotFoundException):
+            async_to_sync(self.repo.aupdate)(entities[0])
+
+
+@pytest.mark.django_db
+class TestCategoryCachedRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        backends = override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'file': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory.name},
+        })
+        backends.enable()
+        self.addCleanup(backends.disable)
+        self.django_repo = CategoryDjangoRepository()
+
+    def test_find_by_id_reads_through_the_cache(self):
+        for cache_alias in ['default', 'file']:
+            with self.subTest(cache_alias=cache_alias):
+                repo = CategoryCachedRepository(self.django_repo, cache_alias=cache_alias, ttl=60)
+                entity = Category(name='Movie')
+                repo.insert(entity)
+
+                self.assertEqual(repo.find_by_id(entity.id).name, 'Movie')
+                with CaptureQueriesContext(connection) as context:
+                    self.assertEqual(repo.find_by_id(entity.unique_entity_id).name, 'Movie')
+                self.assertEqual(len(context.captured_queries), 0)
+                self.assertEqual((repo.stats.hits, repo.stats.misses, repo.stats.hit_rate), (1, 1, 0.5))
+                self.assertIsNotNone(caches[cache_alias].get(f'category:{entity.id}'))
+
+    def test_writes_invalidate_the_cached_entities(self):
+        repo = CategoryCachedRepository(self.django_repo)
+        entities = [Category(name=f'Movie {index}') for index in range(3)]
+        repo.bulk_insert(entities)
+        for entity in entities:
+            repo.find_by_id(entity.id)
+
+        entities[0].update(name='Movie updated', description=None)
+        repo.update(entities[0])
+        self.assertEqual(repo.find_by_id(entities[0].id).name, 'Movie updated')
+        entities[1].update(name='Movie bulk updated', description=None)
+        repo.bulk_update([entities[1]])
+        self.assertEqual(repo.find_by_id(entities[1].id).name, 'Movie bulk updated')
+
+        repo.delete(entities[0].id)
+        repo.bulk_delete([entities[2].id])
+        for entity in [entities[0], entities[2]]:
+            with self.assertRaises(NotFoundException):
+                repo.find_by_id(entity.id)
+        self.assertEqual(repo.stats.hits, 0)
+
+    def test_async_methods_use_the_cache(self):
+        repo = CategoryCachedRepository(self.django_repo)
+        entity = Category(name='Movie')
+        async_to_sync(repo.ainsert)(entity)
+
+        async_to_sync(repo.afind_by_id)(entity.id)
+        self.assertEqual(async_to_sync(repo.afind_by_id)(entity.id).name, 'Movie')
+        self.assertEqual((repo.stats.hits, repo.stats.misses), (1, 1))
+
+        entity.update(name='Movie updated', description=None)
+        async_to_sync(repo.aupdate)(entity)
+        self.assertEqual(async_to_sync(repo.afind_by_id)(entity.id).name, 'Movie updated')
+        async_to_sync(repo.adelete)(entity.id)
+        with self.assertRaises(NotFoundException):
+            async_to_sync(repo.afind_by_id)(entity.id)
+
@@ -13,7 +13,8 @@ class TestCategoryOutput(unittest.TestCase):
             'name': str,
             'description': Optional[str],
             'is_active': bool,
-            'created_at': datetime
+            'created_at': datetime,
+            'updated_at': datetime
         })
 
 
@@ -36,5 +37,6 @@ class TestCategoryOutputMapper(unittest.TestCase):
             name=category.name,
             description=category.description,
             is_active=category.is_active,
-            created_at=category.created_at
+            created_at=category.created_at,
+            updated_at=category.updated_at
         ))
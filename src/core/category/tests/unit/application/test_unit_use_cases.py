@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Optional
 import unittest
@@ -75,7 +76,8 @@ class TestCreateCategoryUseCaseUnit(unittest.TestCase):
                 name="Movie 2",
                 description=None,
                 is_active=False,
-                created_at=self.category_repository.items[1].created_at
+                created_at=self.category_repository.items[1].created_at,
+                updated_at=self.category_repository.items[1].updated_at
             ))
 
             input_param = CreateCategoryUseCase.Input(
@@ -88,7 +90,8 @@ class TestCreateCategoryUseCaseUnit(unittest.TestCase):
                 name="Movie 3",
                 description=None,
                 is_active=True,
-                created_at=self.category_repository.items[2].created_at
+                created_at=self.category_repository.items[2].created_at,
+                updated_at=self.category_repository.items[2].updated_at
             ))
 
 
@@ -138,7 +141,8 @@ class TestGetCategoryUseCaseUnit(unittest.TestCase):
                 name='Movie',
                 description='Movie description',
                 is_active=True,
-                created_at=self.category_repository.items[0].created_at
+                created_at=self.category_repository.items[0].created_at,
+                updated_at=self.category_repository.items[0].updated_at
             ))
 
 
@@ -177,7 +181,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
             total=1,
             current_page=1,
             per_page=2,
-            last_page=1
+            last_page=1,
+            has_next=False
         ))
 
         result = CategoryRepository.SearchResult(items=[entity], **default_props)
@@ -188,12 +193,14 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
                 name=entity.name,
                 description=entity.description,
                 is_active=entity.is_active,
-                created_at=entity.created_at
+                created_at=entity.created_at,
+                updated_at=entity.updated_at
             )],
             total=1,
             current_page=1,
             per_page=2,
-            last_page=1
+            last_page=1,
+            has_next=False
         ))
 
     def test_execute_using_empty_search_params(self):
@@ -211,7 +218,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
                 total=2,
                 current_page=1,
                 per_page=15,
-                last_page=1
+                last_page=1,
+                has_next=False
             ))
 
     def test_execute_using_pagination_and_sort_and_filter(self):
@@ -237,7 +245,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
             total=3,
             current_page=1,
             per_page=2,
-            last_page=2
+            last_page=2,
+            has_next=True
         ))
 
         input_param = ListCategoriesUseCase.Input(
@@ -253,7 +262,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
             total=3,
             current_page=2,
             per_page=2,
-            last_page=2
+            last_page=2,
+            has_next=False
         ))
 
         input_param = ListCategoriesUseCase.Input(
@@ -269,7 +279,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
             total=3,
             current_page=1,
             per_page=2,
-            last_page=2
+            last_page=2,
+            has_next=True
         ))
 
         input_param = ListCategoriesUseCase.Input(
@@ -285,7 +296,8 @@ class TestListCategoryUseCaseUnit(unittest.TestCase):
             total=3,
             current_page=2,
             per_page=2,
-            last_page=2
+            last_page=2,
+            has_next=False
         ))
 
 
@@ -416,3 +428,34 @@ class TestUpdateCategoryUseCaseUnit(unittest.TestCase):
             #     is_active=True,
             #     created_at=self.category_repository.items[2].created_at
             # ))
+
+
+class TestCategoryUseCasesExecuteAsyncUnit(unittest.IsolatedAsyncioTestCase):
+
+    category_repository: CategoryInMemoryRepository
+
+    def setUp(self) -> None:
+        self.category_repository = CategoryInMemoryRepository()
+
+    async def test_execute_async(self):
+        created = await CreateCategoryUseCase(self.category_repository).execute_async(
+            CreateCategoryUseCase.Input(name='Movie')
+        )
+        self.assertEqual(self.category_repository.find_by_id(created.id).name, 'Movie')
+
+        found = await GetCategoryUseCase(self.category_repository).execute_async(GetCategoryUseCase.Input(created.id))
+        self.assertEqual(found, GetCategoryUseCase.Output(**asdict(created)))
+
+        updated = await UpdateCategoryUseCase(self.category_repository).execute_async(
+            UpdateCategoryUseCase.Input(id=created.id, name='Movie updated', is_active=False)
+        )
+        self.assertEqual((updated.name, updated.is_active), ('Movie updated', False))
+
+        listed = await ListCategoriesUseCase(self.category_repository).execute_async(
+            ListCategoriesUseCase.Input(filter='updated')
+        )
+        self.assertEqual([item.id for item in listed.items], [created.id])
+
+        await DeleteCategoryUseCase(self.category_repository).execute_async(DeleteCategoryUseCase.Input(created.id))
+        with self.assertRaises(NotFoundException):
+            await GetCategoryUseCase(self.category_repository).execute_async(GetCategoryUseCase.Input(created.id))
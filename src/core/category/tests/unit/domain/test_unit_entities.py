@@ -15,7 +15,8 @@ class TestCategoryUnit(unittest.TestCase):
             'name': str,
             'description': typing.Optional[str],
             'is_active': typing.Optional[bool],
-            'created_at': typing.Optional[datetime]})
+            'created_at': typing.Optional[datetime],
+            'updated_at': typing.Optional[datetime]})
 
     def test_constructor(self):  # sourcery skip: extract-duplicate-method
         with patch.object(Category, "validate") as mock_validate_method:
@@ -44,6 +45,29 @@ class TestCategoryUnit(unittest.TestCase):
             category2 = Category(name="Movie 2")
             self.assertNotEqual(category1.created_at, category2.created_at)
 
+    def test_if_updated_at_starts_at_created_at_and_moves_on_changes(self):
+        with patch.object(Category, "validate"):
+            created_at = datetime(2022, 7, 20)
+            category = Category(name="Movie", created_at=created_at)
+            self.assertEqual(category.updated_at, created_at)
+
+            for change in [
+                lambda: category.update(name="Movie updated", description=None),
+                category.deactivate,
+                category.activate,
+            ]:
+                previous = category.updated_at
+                change()
+                self.assertGreater(category.updated_at, previous)
+
+    def test_restore_without_updated_at_starts_it_at_created_at(self):
+        created_at = datetime(2022, 7, 20)
+        for updated_at in [{}, {"updated_at": None}]:
+            category = Category.restore(name="Movie", created_at=created_at, **updated_at)
+            self.assertEqual(category.updated_at, created_at)
+        category = Category.restore(name="Movie", created_at=created_at, updated_at=datetime(2022, 7, 21))
+        self.assertEqual(category.updated_at, datetime(2022, 7, 21))
+
     def test_if_is_immutable(self):
         with self.assertRaises(FrozenInstanceError):
             with patch.object(Category, "validate"):
@@ -1,15 +1,19 @@
+import threading
+import time
 import unittest
+from unittest import mock
 import typing
 from typing import Optional, List
 from dataclasses import dataclass
 
 from core.__seedwork.domain.value_objects import UniqueEntityId
 from core.__seedwork.domain.entities import Entity
-from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.exceptions import EntitiesNotFoundException, NotFoundException, ValidationException
 
 from core.__seedwork.domain.repositories import (T, Filter, InMemoryRepository, InMemorySearchableRepository,
                                                  RepositoryInterface, SearchParams, SearchResult,
-                                                 SearchableRepositoryInterface)
+                                                 SearchableRepositoryInterface, SortedIndex, NGramIndex, SearchCache,
+                                                 CopyOnWriteRepository, SearchCursor, TotalCache)
 
 
 class TestRepositoryInterfaceUnit(unittest.TestCase):
@@ -113,6 +117,106 @@ class TestInMemoryRepositoryUnit(unittest.TestCase):
         self.repo.delete(entity.unique_entity_id)
         self.assertEqual(self.repo.items, [])
 
+    def test_bulk_insert(self):
+        entity = StubEntity(name='test', price=10)
+        self.repo.insert(entity)
+
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2)]
+        self.repo.bulk_insert(entities)
+        self.assertListEqual(self.repo.items, [*entities, entity])
+        self.assertEqual(self.repo.find_by_id(entities[1].id), entities[1])
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+
+    def test_items_setter_rebuilds_index(self):
+        entity = StubEntity(name='test', price=10)
+        self.repo.insert(entity)
+
+        other = StubEntity(name='other', price=5)
+        self.repo.items = [other]
+        self.assertListEqual(self.repo.items, [other])
+        self.assertEqual(self.repo.find_by_id(other.id), other)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entity.id)
+
+    def test_update_keeps_position(self):
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2), StubEntity(name='c', price=3)]
+        self.repo.items = entities
+
+        entity_updated = StubEntity(unique_entity_id=entities[1].unique_entity_id, name='updated', price=5)
+        self.repo.update(entity_updated)
+        self.assertListEqual(self.repo.items, [entities[0], entity_updated, entities[2]])
+        self.assertEqual(self.repo.find_by_id(entity_updated.id), entity_updated)
+
+    def test_delete_when_entity_is_repeated(self):
+        entity = StubEntity(name='test', price=10)
+        other = StubEntity(name='other', price=5)
+        self.repo.items = [entity, other, entity]
+
+        self.repo.delete(entity.id)
+        self.assertListEqual(self.repo.items, [other, entity])
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+
+        self.repo.delete(entity.id)
+        self.assertListEqual(self.repo.items, [other])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entity.id)
+
+    def test_iter_all(self):
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2)]
+        self.repo.items = entities
+
+        iterator = self.repo.iter_all(chunk_size=1)
+        self.assertEqual(next(iterator), entities[0])
+        self.repo.delete(entities[1].id)
+        self.assertListEqual(list(iterator), [entities[1]])
+
+    def test_bulk_insert_when_entities_are_repeated(self):
+        entity = StubEntity(name='test', price=10)
+        other = StubEntity(name='other', price=5)
+        self.repo.insert(entity)
+        self.repo.bulk_insert([other, entity])
+        self.repo.insert(other)
+        self.assertListEqual(self.repo.items, [other, entity, entity, other])
+
+        self.repo.bulk_delete([entity.id, other.id])
+        self.assertListEqual(self.repo.items, [entity, other])
+
+    def test_bulk_update(self):
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2), StubEntity(name='c', price=3)]
+        self.repo.items = entities
+
+        updated = [
+            StubEntity(unique_entity_id=entities[2].unique_entity_id, name='c2', price=4),
+            StubEntity(unique_entity_id=entities[0].unique_entity_id, name='a2', price=5),
+        ]
+        self.repo.bulk_update(updated)
+        self.assertListEqual(self.repo.items, [updated[1], entities[1], updated[0]])
+
+    def test_bulk_delete(self):
+        entities = [StubEntity(name='a', price=1), StubEntity(name='b', price=2), StubEntity(name='c', price=3)]
+        self.repo.items = entities
+
+        self.repo.bulk_delete([entities[0].id, entities[2].unique_entity_id])
+        self.assertListEqual(self.repo.items, [entities[1]])
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(entities[0].id)
+
+    def test_throw_entities_not_found_exception_in_bulk_update_and_bulk_delete(self):
+        entity = StubEntity(name='a', price=1)
+        self.repo.insert(entity)
+        missing = [StubEntity(name='b', price=2), StubEntity(name='c', price=3)]
+
+        with self.assertRaises(EntitiesNotFoundException) as assert_error:
+            self.repo.bulk_update([entity, *missing])
+        self.assertEqual(assert_error.exception.entity_ids, [missing[0].id, missing[1].id])
+        self.assertEqual(assert_error.exception.args[0],
+                         f"Entities not found using ids '{missing[0].id}', '{missing[1].id}'")
+
+        with self.assertRaises(EntitiesNotFoundException) as assert_error:
+            self.repo.bulk_delete([entity.id, entity.id, missing[0].id])
+        self.assertEqual(assert_error.exception.entity_ids, [entity.id, missing[0].id])
+        self.assertListEqual(self.repo.items, [entity])
+
 
 class TestSearchableRepositoryInterfaceUnit(unittest.TestCase):
     def test_throw_error_when_methods_not_implemented(self):
@@ -130,7 +234,9 @@ class TestSearchParamsUnit(unittest.TestCase):
             'per_page': typing.Optional[int],
             'sort': typing.Optional[str],
             'sort_dir': typing.Optional[str],
-            'filter': typing.Optional[Filter]})
+            'filter': typing.Optional[Filter],
+            'cursor': typing.Optional[str],
+            'with_total': typing.Optional[str]})
 
     def test_page_prop(self):
         params = SearchParams()
@@ -242,18 +348,74 @@ class TestSearchParamsUnit(unittest.TestCase):
             params = SearchParams(filter=item['filter'])
             self.assertEqual(params.filter, item['expected'])
 
+    def test_with_total_prop(self):
+        params = SearchParams()
+
+        self.assertEqual(params.with_total, 'exact')
+
+        arrange = [
+            {'with_total': None, 'expected': 'exact'},
+            {'with_total': '', 'expected': 'exact'},
+            {'with_total': 'fake', 'expected': 'exact'},
+            {'with_total': 'exact', 'expected': 'exact'},
+            {'with_total': 'CACHED', 'expected': 'cached'},
+            {'with_total': 'none', 'expected': 'none'},
+        ]
+
+        for item in arrange:
+            params = SearchParams(with_total=item['with_total'])
+            self.assertEqual(params.with_total, item['expected'])
+
+
+class TestTotalCacheUnit(unittest.TestCase):
+
+    def test_get_until_the_ttl_runs_out(self):
+        cache = TotalCache(ttl=60)
+        cache.put('movie', 10)
+        self.assertEqual(cache.get('movie'), 10)
+        self.assertIsNone(cache.get('series'))
+
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61):
+            self.assertIsNone(cache.get('movie'))
+
+    def test_clear(self):
+        cache = TotalCache(max_size=1)
+        cache.put('movie', 10)
+        cache.put('series', 5)
+        self.assertIsNone(cache.get('movie'))
+        cache.clear()
+        self.assertIsNone(cache.get('series'))
+
+
+class TestSearchCursorUnit(unittest.TestCase):
+    def test_encode_and_decode(self):
+        entity = StubEntity(name='fake', price=5)
+        cursor = SearchCursor.from_entity(entity, 'name', 'desc', is_before=True)
+        self.assertEqual(cursor, SearchCursor('name', 'desc', 'fake', entity.id, True))
+        self.assertEqual(SearchCursor.decode(cursor.encode()), cursor)
+
+    def test_throw_validation_exception_when_cursor_is_invalid(self):
+        for cursor in ['fake', 'W10=', 'NQ==']:
+            with self.assertRaises(ValidationException) as assert_error:
+                SearchCursor.decode(cursor)
+            self.assertEqual(assert_error.exception.args[0], f"Invalid cursor '{cursor}'")
+
 
 class TestSearchResultUnit(unittest.TestCase):
     def test_props_annotations(self):
         self.assertEqual(SearchResult.__annotations__, {
             'items': List[T],
-            'total': int,
+            'total': Optional[int],
             'current_page': int,
             'per_page': int,
-            'last_page': int,
+            'last_page': Optional[int],
             'sort': Optional[str],
             'sort_dir': Optional[str],
             'filter': Optional[Filter],
+            'next_cursor': Optional[str],
+            'prev_cursor': Optional[str],
+            'has_next': Optional[bool],
+            'with_total': str,
         })
 
     def test_constructor(self):
@@ -268,6 +430,10 @@ class TestSearchResultUnit(unittest.TestCase):
             'sort': None,
             'sort_dir': None,
             'filter': None,
+            'next_cursor': None,
+            'prev_cursor': None,
+            'has_next': True,
+            'with_total': 'exact',
         })
 
         result = SearchResult(
@@ -277,7 +443,9 @@ class TestSearchResultUnit(unittest.TestCase):
             per_page=2,
             sort='name',
             sort_dir='asc',
-            filter='test'
+            filter='test',
+            next_cursor='next',
+            prev_cursor='prev'
         )
         self.assertDictEqual(result.to_dict(), {
             'items': [entity, entity],
@@ -288,8 +456,17 @@ class TestSearchResultUnit(unittest.TestCase):
             'sort': 'name',
             'sort_dir': 'asc',
             'filter': 'test',
+            'next_cursor': 'next',
+            'prev_cursor': 'prev',
+            'has_next': True,
+            'with_total': 'exact',
         })
 
+    def test_without_total(self):
+        result = SearchResult(items=[], total=None, current_page=2, per_page=15, has_next=False, with_total='none')
+        self.assertIsNone(result.last_page)
+        self.assertFalse(result.has_next)
+
     def test_when_per_page_is_greater_than_total(self):
         result = SearchResult(
             items=[],
@@ -491,3 +668,279 @@ class TestInMemorySearchableRepositoryUnit(unittest.TestCase):
             sort='name',
             filter=None
         ))
+
+    def test_search_sorted_index_matches_full_sort(self):
+        items = [StubEntity(name=name, price=price) for name, price in [
+            ('b', 1), ('a', 2), ('b', 3), ('c', 4), ('a', 5), ('b', 6), ('d', 7),
+        ]]
+        self.repo.items = items
+
+        for sort_dir in ['asc', 'desc']:
+            expected = sorted(items, key=lambda item: item.name, reverse=sort_dir == 'desc')
+            for page in range(1, 5):
+                result = self.repo.search(SearchParams(page=page, per_page=2, sort='name', sort_dir=sort_dir))
+                self.assertEqual(result.items, expected[(page - 1) * 2:page * 2])
+                self.assertEqual(result.total, 7)
+
+    def test_search_sorted_index_is_kept_after_changes(self):
+        items = [StubEntity(name='b', price=1), StubEntity(name='a', price=2), StubEntity(name='c', price=3)]
+        self.repo.items = items
+        self.repo.search(SearchParams(sort='name'))
+
+        new_entity = StubEntity(name='aa', price=4)
+        self.repo.insert(new_entity)
+        self.repo.delete(items[2].id)
+        entity_updated = StubEntity(unique_entity_id=items[1].unique_entity_id, name='z', price=2)
+        self.repo.update(entity_updated)
+
+        result = self.repo.search(SearchParams(sort='name'))
+        self.assertEqual(result.items, [new_entity, items[0], entity_updated])
+
+        result = self.repo.search(SearchParams(sort='name', sort_dir='desc', filter='a'))
+        self.assertEqual(result.items, [new_entity])
+        self.assertEqual(result.total, 1)
+
+    def test_search_selecting_top_k_matches_full_sort(self):
+        class KeysFilterRepository(StubInMemorySearchableRepository):
+            def _find_filtered_keys(self, filter_param: str):
+                return {key for key, item in self._entries.items() if filter_param in item.name}
+
+        items = [StubEntity(name=name, price=price) for name, price in [
+            ('ba', 1), ('ab', 2), ('ba', 3), ('ca', 4), ('ab', 5), ('b', 6), ('da', 7),
+        ]]
+        full_sort_repo = KeysFilterRepository()
+        full_sort_repo.top_k_max_ratio = 0
+        full_sort_repo.items = items
+        top_k_repo = KeysFilterRepository()
+        top_k_repo.top_k_max_ratio = 1
+        top_k_repo.items = items
+
+        for sort, sort_dir in [(None, None), ('name', 'asc'), ('name', 'desc')]:
+            for page in range(1, 5):
+                params = SearchParams(page=page, per_page=2, sort=sort, sort_dir=sort_dir, filter='a')
+                self.assertEqual(top_k_repo.search(params), full_sort_repo.search(params))
+
+        result = top_k_repo.search(SearchParams(per_page=3, sort='name', sort_dir='desc', filter='a'))
+        self.assertEqual(result.items, [items[6], items[3], items[0]])
+        self.assertEqual(result.total, 6)
+
+    def test_search_uses_cache_until_a_write(self):
+        entity = StubEntity(name='a', price=1)
+        self.repo.insert(entity)
+
+        result = self.repo.search(SearchParams(sort='name'))
+        self.assertIs(self.repo.search(SearchParams(sort='name')), result)
+        self.assertEqual((self.repo.search_cache.hits, self.repo.search_cache.misses), (1, 1))
+
+        other = StubEntity(name='b', price=2)
+        self.repo.insert(other)
+        result = self.repo.search(SearchParams(sort='name'))
+        self.assertEqual(result.items, [entity, other])
+        self.assertEqual((self.repo.search_cache.hits, self.repo.search_cache.misses), (1, 2))
+
+        self.repo.update(StubEntity(unique_entity_id=other.unique_entity_id, name='0', price=2))
+        self.assertEqual(self.repo.search(SearchParams(sort='name')).items[1], entity)
+
+        self.repo.delete(entity.id)
+        self.assertEqual(self.repo.search(SearchParams(sort='name')).total, 1)
+
+        self.repo.items = []
+        self.assertEqual(self.repo.search(SearchParams(sort='name')).total, 0)
+        self.assertEqual(self.repo.search_cache.hits, 1)
+
+
+class TestSortedIndexUnit(unittest.TestCase):
+
+    def test_slice(self):
+        items = {key: StubEntity(name=name, price=key) for key, name in enumerate(['b', 'a', 'b', 'c', 'b'])}
+        index = SortedIndex.build('name', items)
+
+        self.assertEqual(index.slice(0, 5), [1, 0, 2, 4, 3])
+        self.assertEqual(index.slice(1, 3), [0, 2])
+        self.assertEqual(index.slice(0, 5, reverse=True), [3, 0, 2, 4, 1])
+        self.assertEqual(index.slice(1, 3, reverse=True), [0, 2])
+        self.assertEqual(index.slice(3, 10, reverse=True), [4, 1])
+        self.assertEqual(index.slice(5, 10, reverse=True), [])
+
+    def test_add_and_remove(self):
+        index = SortedIndex('name')
+        entity = StubEntity(name='b', price=1)
+        index.add(0, entity)
+        index.add(1, StubEntity(name='a', price=1))
+        self.assertEqual(index.slice(0, 2), [1, 0])
+
+        object.__setattr__(entity, 'name', 'z')
+        index.remove(0)
+        index.add(0, entity)
+        self.assertEqual(index.slice(0, 2), [1, 0])
+        self.assertEqual(index.values, {0: 'z', 1: 'a'})
+
+    def test_add_many(self):
+        index = SortedIndex.build('name', {0: StubEntity(name='b', price=1)})
+        index.add_many([(-2, StubEntity(name='c', price=1)), (-1, StubEntity(name='a', price=1))])
+        self.assertEqual(index.entries, [('a', -1), ('b', 0), ('c', -2)])
+        self.assertEqual(index.values, {0: 'b', -2: 'c', -1: 'a'})
+
+
+class TestNGramIndexUnit(unittest.TestCase):
+
+    def test_search(self):
+        index = NGramIndex()
+        index.add(0, 'Movie')
+        index.add(1, 'Documentary')
+        index.add(2, 'MOVIES')
+
+        self.assertEqual(index.texts, {0: 'movie', 1: 'documentary', 2: 'movies'})
+        self.assertEqual(index.search('mov'), {0, 2})
+        self.assertEqual(index.search('VIES'), {2})
+        self.assertEqual(index.search('o'), {0, 1, 2})
+        self.assertEqual(index.search('fake'), set())
+
+    def test_remove_and_clear(self):
+        index = NGramIndex()
+        index.add(0, 'Movie')
+        index.add(1, 'Movies')
+
+        index.remove(1)
+        self.assertEqual(index.search('movie'), {0})
+        self.assertNotIn('ies', index.postings)
+
+        index.clear()
+        self.assertEqual(index.search('movie'), set())
+        self.assertEqual(index.postings, {})
+
+    def test_copy_shares_the_unchanged_postings(self):
+        index = NGramIndex()
+        index.add(0, 'Movie')
+        index.add(1, 'Series')
+        index.add(2, 'Documentary')
+
+        index_copy = index.copy()
+        index_copy.add(3, 'Movies')
+        index_copy.remove(1)
+        self.assertIsNot(index_copy.postings['mov'], index.postings['mov'])
+        self.assertIs(index_copy.postings['doc'], index.postings['doc'])
+        self.assertEqual((index.search('movie'), index.search('series')), ({0}, {1}))
+        self.assertEqual((index_copy.search('movie'), index_copy.search('series')), ({0, 3}, set()))
+
+        index.add(4, 'Documentary')
+        self.assertEqual((index.search('doc'), index_copy.search('doc')), ({2, 4}, {2}))
+
+
+class TestSearchCacheUnit(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = SearchCache(max_size=2)
+        results = [SearchResult(items=[], total=0, current_page=page, per_page=15) for page in range(3)]
+        cache.put((0,), 0, results[0])
+        cache.put((1,), 0, results[1])
+        self.assertIs(cache.get((0,), 0), results[0])
+
+        cache.put((2,), 0, results[2])
+        self.assertIsNone(cache.get((1,), 0))
+        self.assertIs(cache.get((0,), 0), results[0])
+        self.assertIs(cache.get((2,), 0), results[2])
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (3, 1, 1))
+
+    def test_invalidate_on_new_version(self):
+        cache = SearchCache()
+        result = SearchResult(items=[], total=0, current_page=1, per_page=15)
+        cache.put((1,), 0, result)
+        self.assertIsNone(cache.get((1,), 1))
+
+        cache.put((1,), 0, result)
+        self.assertIsNone(cache.get((1,), 1))
+
+    def test_disabled_when_max_size_is_zero(self):
+        cache = SearchCache(max_size=0)
+        cache.put((1,), 0, SearchResult(items=[], total=0, current_page=1, per_page=15))
+        self.assertIsNone(cache.get((1,), 0))
+
+
+class StubCopyOnWriteRepository(CopyOnWriteRepository[StubEntity, SearchParams, SearchResult]):
+    pass
+
+
+class TestCopyOnWriteRepositoryUnit(unittest.TestCase):
+
+    repo: StubCopyOnWriteRepository
+
+    def setUp(self) -> None:
+        self.repo = StubCopyOnWriteRepository(StubInMemorySearchableRepository())
+
+    def test_writes_publish_a_new_snapshot(self):
+        entity = StubEntity(name='a', price=1)
+        snapshot = self.repo.snapshot
+        self.repo.insert(entity)
+        self.assertIsNot(self.repo.snapshot, snapshot)
+        self.assertEqual(snapshot.items, [])
+        self.assertEqual(self.repo.items, [entity])
+
+        snapshot = self.repo.snapshot
+        self.assertEqual(snapshot.search(SearchParams(sort='name')).items, [entity])
+        entity_updated = StubEntity(unique_entity_id=entity.unique_entity_id, name='b', price=2)
+        self.repo.update(entity_updated)
+        self.assertEqual(snapshot.search(SearchParams(sort='name')).items, [entity])
+        self.assertEqual(self.repo.search(SearchParams(sort='name')).items, [entity_updated])
+
+        self.repo.bulk_insert([entity])
+        self.repo.delete(entity.id)
+        self.assertEqual(self.repo.find_all(), [entity_updated])
+
+    def test_readers_do_not_change_the_published_snapshot(self):
+        self.repo.bulk_insert([StubEntity(name='b', price=1)])
+        self.repo.bulk_insert([StubEntity(name='a', price=2)])
+        snapshot = self.repo.snapshot
+        sorted_indexes, entries = dict(snapshot._sorted_indexes), snapshot._entries  # pylint: disable=protected-access
+        self.assertEqual(list(sorted_indexes), snapshot.sortable_fields)
+
+        self.assertEqual([item.name for item in self.repo.search(SearchParams(sort='name')).items], ['a', 'b'])
+        self.assertEqual([item.name for item in self.repo.find_all()], ['a', 'b'])
+        self.assertEqual(snapshot._sorted_indexes, sorted_indexes)  # pylint: disable=protected-access
+        self.assertIs(snapshot._entries, entries)  # pylint: disable=protected-access
+
+    def test_failed_write_keeps_the_snapshot(self):
+        snapshot = self.repo.snapshot
+        with self.assertRaises(NotFoundException):
+            self.repo.delete('fake_id')
+        self.assertIs(self.repo.snapshot, snapshot)
+
+    def test_find_by_id_returns_a_copy(self):
+        entity = StubEntity(name='a', price=1)
+        self.repo.items = [entity]
+
+        entity_found = self.repo.find_by_id(entity.id)
+        self.assertEqual(entity_found, entity)
+        self.assertIsNot(entity_found, entity)
+
+    def test_concurrent_readers_and_writers(self):
+        self.repo.items = [StubEntity(name=str(i), price=i) for i in range(50)]
+        errors = []
+
+        def read():
+            try:
+                for _ in range(200):
+                    result = self.repo.search(SearchParams(sort='name', sort_dir='desc'))
+                    self.assertEqual(len(result.items), 15)
+            except Exception as exception:  # pylint: disable=broad-except
+                errors.append(exception)
+
+        def write():
+            try:
+                for i in range(50):
+                    entity = StubEntity(name=f'new {i}', price=i)
+                    self.repo.insert(entity)
+                    self.repo.delete(entity.id)
+            except Exception as exception:  # pylint: disable=broad-except
+                errors.append(exception)
+
+        threads = [
+            *(threading.Thread(target=read) for _ in range(4)),
+            *(threading.Thread(target=write) for _ in range(2))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.repo.items), 50)
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+
+import pytest
+
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
+from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+from core.category.tests.unit.application import test_unit_use_cases
+
+pytest.importorskip('numpy')
+
+from core.category.infra.columnar.repositories import (  # pylint: disable=wrong-import-position
+    CategoryColumnarRepository
+)
+
+
+class TestCategoryColumnarRepository(unittest.TestCase):
+    repo: CategoryColumnarRepository
+
+    def setUp(self):
+        self.repo = CategoryColumnarRepository()
+
+    def test_items_prop_is_empty_on_init(self):
+        self.assertEqual(self.repo.items, [])
+
+    def test_insert_find_update_and_delete(self):
+        entity = Category(name='Movie', description='Movie description')
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.find_by_id(entity.id), entity)
+        self.assertEqual(self.repo.find_by_id(entity.unique_entity_id), entity)
+
+        entity_updated = Category(
+            unique_entity_id=entity.unique_entity_id,
+            name='Movie updated',
+            is_active=False,
+            created_at=entity.created_at
+        )
+        self.repo.update(entity_updated)
+        self.assertEqual(self.repo.find_all(), [entity_updated])
+
+        self.repo.delete(entity.id)
+        self.assertEqual(self.repo.items, [])
+
+    def test_iter_all(self):
+        entities = [Category(name=f'Movie {index}') for index in range(5)]
+        self.repo.items = entities
+        self.repo.delete(entities[1].id)
+
+        self.assertEqual(list(self.repo.iter_all(chunk_size=2)), [entities[0], *entities[2:]])
+
+    def test_throw_not_found_exception(self):
+        entity = Category(name='Movie')
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake_id')
+        self.assertEqual(assert_error.exception.args[0], "Entity not found using id 'fake_id'")
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.update(entity)
+        self.assertEqual(assert_error.exception.args[0], f"Entity not found using id '{entity.id}'")
+
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.delete(entity.unique_entity_id)
+        self.assertEqual(assert_error.exception.args[0], f"Entity not found using id '{entity.id}'")
+
+    def test_keeps_timezone_aware_created_at(self):
+        entity = Category(name='Movie', created_at=datetime(2022, 7, 20, 18, 7, 1, 5, tzinfo=timezone.utc))
+        self.repo.insert(entity)
+        self.assertEqual(self.repo.find_by_id(entity.id).created_at, entity.created_at)
+
+    def test_bulk_insert_and_compact_after_deletes(self):
+        entities = [Category(name=f'Movie {i}') for i in range(10)]
+        self.repo.insert(entities[9])
+        self.repo.bulk_insert(entities[:9])
+        self.assertEqual(self.repo.items, entities)
+
+        for entity in entities[:6]:
+            self.repo.delete(entity.id)
+        self.assertEqual(self.repo.items, entities[6:])
+        self.assertEqual(self.repo.find_by_id(entities[8].id), entities[8])
+        self.assertEqual(len(self.repo._alive), 4)  # pylint: disable=protected-access
+
+    def test_bulk_insert_puts_the_categories_first_without_rewriting_the_others(self):
+        entities = [Category(name='Movie'), Category(name='Series'), Category(name='Anime')]
+        self.repo.insert(entities[2])
+        ids = self.repo._ids  # pylint: disable=protected-access
+        self.repo.bulk_insert(entities[:2])
+        self.repo.insert(Category(name='Anime', created_at=entities[2].created_at))
+
+        self.assertIs(self.repo._ids, ids)  # pylint: disable=protected-access
+        self.assertEqual(self.repo.items[:3], entities)
+        params = CategoryRepository.SearchParams(sort='name', sort_dir='asc', per_page=2)
+        self.assertEqual(self.repo.search(params).items, [entities[2], self.repo.items[3]])
+
+    def test_compact_counts_the_duplicates_left(self):
+        movie = Category(name='Movie')
+        self.repo.items = [movie, movie, *[Category(name=f'Series {i}') for i in range(3)]]
+        for entity in self.repo.items[2:]:
+            self.repo.delete(entity.id)
+        self.assertEqual((len(self.repo._alive), self.repo._duplicates), (2, 1))  # pylint: disable=protected-access
+
+        self.repo.delete(movie.id)
+        self.repo.delete(movie.id)
+        self.assertEqual(self.repo.items, [])
+
+    def test_search_matches_in_memory_repository(self):
+        now = datetime.now()
+        items = [
+            Category(name=name, created_at=now + timedelta(seconds=seconds))
+            for name, seconds in [
+                ('Movie', 2), ('documentary', 1), ('MOVIES', 2), ('Anime', 0), ('movie', 3), ('Doc', 1), ('Movie', 0),
+            ]
+        ]
+        in_memory_repo = CategoryInMemoryRepository()
+        in_memory_repo.items = items
+        self.repo.items = items
+
+        for filter_param in [None, 'mov', 'DOC', 'fake']:
+            for sort, sort_dir in [(None, None), ('name', 'asc'), ('name', 'desc'), ('created_at', 'asc')]:
+                for page in range(1, 4):
+                    params = CategoryRepository.SearchParams(
+                        page=page, per_page=3, sort=sort, sort_dir=sort_dir, filter=filter_param
+                    )
+                    self.assertEqual(self.repo.search(params).to_dict(), in_memory_repo.search(params).to_dict())
+
+
+class TestCreateCategoryUseCaseColumnar(test_unit_use_cases.TestCreateCategoryUseCaseUnit):
+    def setUp(self) -> None:
+        super().setUp()
+        self.category_repository = CategoryColumnarRepository()
+        self.use_case = test_unit_use_cases.CreateCategoryUseCase(self.category_repository)
+
+
+class TestGetCategoryUseCaseColumnar(test_unit_use_cases.TestGetCategoryUseCaseUnit):
+    def setUp(self) -> None:
+        super().setUp()
+        self.category_repository = CategoryColumnarRepository()
+        self.use_case = test_unit_use_cases.GetCategoryUseCase(self.category_repository)
+
+
+class TestListCategoryUseCaseColumnar(test_unit_use_cases.TestListCategoryUseCaseUnit):
+    def setUp(self) -> None:
+        super().setUp()
+        self.category_repository = CategoryColumnarRepository()
+        self.use_case = test_unit_use_cases.ListCategoriesUseCase(self.category_repository)
+
+
+class TestDeleteCategoryUseCaseColumnar(test_unit_use_cases.TestDeleteCategoryUseCaseUnit):
+    def setUp(self) -> None:
+        super().setUp()
+        self.category_repository = CategoryColumnarRepository()
+        self.use_case = test_unit_use_cases.DeleteCategoryUseCase(self.category_repository)
+
+
+class TestUpdateCategoryUseCaseColumnar(test_unit_use_cases.TestUpdateCategoryUseCaseUnit):
+    def setUp(self) -> None:
+        super().setUp()
+        self.category_repository = CategoryColumnarRepository()
+        self.use_case = test_unit_use_cases.UpdateCategoryUseCase(self.category_repository)
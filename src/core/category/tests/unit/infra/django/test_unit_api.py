@@ -5,6 +5,7 @@ from unittest import mock
 from core.__seedwork.infra.django.serializers import UUIDSerializer
 from rest_framework.test import APIRequestFactory
 from rest_framework.request import Request as DrfRequest
+from rest_framework.response import Response
 from core.category.infra.django.api import CategoryResource
 from core.category.infra.django.serializers import CategorySerializer
 from core.category.application.dto import CategoryOutput
@@ -69,7 +70,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
             'name': 'Movie',
             'description': None,
             'is_active': True,
-            'created_at': datetime.now()
+            'created_at': datetime.now(),
+            'updated_at': datetime.now()
         }
         with mock.patch.object(
             CategorySerializer,
@@ -108,12 +110,14 @@ class TestCategoryResourceUnit(unittest.TestCase):
                 'name': 'Movie',
                 'description': None,
                 'is_active': True,
-                'created_at': expected_response['created_at']
+                'created_at': expected_response['created_at'],
+                'updated_at': expected_response['updated_at']
             })
         mock_serializer.assert_called_with(CategorySerializer, data=send_data)
 
     def test_get_method(self):
-        mock_list_use_case = mock.Mock(CreateCategoryUseCase)
+        mock_list_use_case = mock.Mock(ListCategoriesUseCase)
+        mock_list_use_case.version.return_value = (1, datetime.now())
 
         mock_list_use_case.execute.return_value = ListCategoriesUseCase.Output(
             items=[
@@ -122,7 +126,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
                     name='Movie',
                     description=None,
                     is_active=True,
-                    created_at=datetime.now()
+                    created_at=datetime.now(),
+                    updated_at=datetime.now()
                 )
             ],
             total=1,
@@ -165,8 +170,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
 
     def test_if_get_invoke_get_object(self):
         resource = CategoryResource(**init_category_resource_all_none())
-        resource.get_object = mock.Mock()
-        resource.get(None, 'af46842e-027d-4c91-b259-3a3642144ba4')
+        resource.get_object = mock.Mock(return_value=Response())
+        resource.get(make_request('get'), 'af46842e-027d-4c91-b259-3a3642144ba4')
         resource.get_object.assert_called_with(
             'af46842e-027d-4c91-b259-3a3642144ba4')
         # mock_list_use_case = mock.Mock(ListCategoriesUseCase)
@@ -209,7 +214,8 @@ class TestCategoryResourceUnit(unittest.TestCase):
             'name': 'Movie',
             'description': None,
             'is_active': True,
-            'created_at': datetime.now()
+            'created_at': datetime.now(),
+            'updated_at': datetime.now()
         }
         mock_get_use_case = mock.Mock(GetCategoryUseCase)
         mock_get_use_case.execute.return_value = GetCategoryUseCase.Output(
@@ -250,14 +256,16 @@ class TestCategoryResourceUnit(unittest.TestCase):
             name=send_data['name'],
             description=None,
             is_active=True,
-            created_at=datetime.now()
+            created_at=datetime.now(),
+            updated_at=datetime.now()
         )
         expected_response = {
             'id': send_data['id'],
             'name': send_data['name'],
             'description': None,
             'is_active': True,
-            'created_at': mock_update_use_case.execute.return_value.created_at
+            'created_at': mock_update_use_case.execute.return_value.created_at,
+            'updated_at': mock_update_use_case.execute.return_value.updated_at
         }
 
         mock_category_to_response.return_value = expected_response
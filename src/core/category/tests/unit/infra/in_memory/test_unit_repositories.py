@@ -1,9 +1,19 @@
 from datetime import datetime, timedelta
+from functools import partial
+import os
+from pathlib import Path
+import pickle
+import tempfile
 import unittest
 
+from core.__seedwork.domain.exceptions import NotFoundException
+from core.__seedwork.domain.repositories import SearchParams
+from core.__seedwork.infra.in_memory.persistence import INSERT, EntityCodec, OperationLog
 from core.category.domain.entities import Category
+from core.category.domain.repositories import CategoryRepository
 
-from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+from core.category.infra.in_memory.repositories import (CategoryCopyOnWriteRepository, CategoryDurableRepository,
+                                                        CategoryInMemoryRepository)
 
 
 class TestCategoryInMemoryRepository(unittest.TestCase):
@@ -48,3 +58,191 @@ class TestCategoryInMemoryRepository(unittest.TestCase):
 
         sorted_items = self.repo._apply_sort(items, 'name', 'asc')       # pylint: disable=protected-access
         self.assertListEqual(sorted_items, [items[1], items[2], items[0]])
+
+    def test_search_using_name_index(self):
+        repo = CategoryInMemoryRepository(use_name_index=True)
+        items = [
+            Category(name='Movie'),
+            Category(name='Documentary', created_at=datetime.now() + timedelta(seconds=100)),
+            Category(name='movies', created_at=datetime.now() + timedelta(seconds=200)),
+            Category(name='Mo'),
+        ]
+        repo.items = items
+
+        result = repo.search(SearchParams(filter='MOV'))
+        self.assertEqual(result.items, [items[2], items[0]])
+        self.assertEqual(result.total, 2)
+
+        result = repo.search(SearchParams(filter='mo', sort='name', sort_dir='asc', per_page=2))
+        self.assertEqual(result.items, [items[3], items[0]])
+        self.assertEqual(result.total, 3)
+
+        repo.update(Category(unique_entity_id=items[0].unique_entity_id, name='Anime'))
+        repo.delete(items[2].id)
+        new_item = Category(name='Movie 2')
+        repo.insert(new_item)
+
+        result = repo.search(SearchParams(filter='movie'))
+        self.assertEqual(result.items, [new_item])
+        self.assertEqual(repo.name_index.search('ANI'), {0})
+
+    def test_search_version_follows_the_writes(self):
+        items = [Category(name='Movie'), Category(name='Series')]
+        self.repo.items = items
+        version = self.repo.search_version(SearchParams(filter='movie'))
+        self.repo.search(SearchParams(filter='movie'))
+        self.assertEqual(self.repo.search_version(SearchParams(filter='movie')), version)
+
+        items[0].deactivate()
+        self.repo.update(items[0])
+        self.assertNotEqual(self.repo.search_version(SearchParams(filter='movie')), version)
+        self.assertIsNone(self.repo.search_version(SearchParams())[1])
+
+    def test_default_search_version_scans_the_categories(self):
+        items = [
+            Category(name='Movie', created_at=datetime(2022, 7, 20)),
+            Category(name='Series', created_at=datetime(2022, 7, 21)),
+        ]
+        self.repo.items = items
+        search_version = partial(CategoryRepository.search_version, self.repo)
+        self.assertEqual(search_version(SearchParams()), (2, datetime(2022, 7, 21)))
+        self.assertEqual(search_version(SearchParams(filter='MOVIE')), (1, datetime(2022, 7, 20)))
+        self.assertEqual(search_version(SearchParams(filter='fake')), (0, None))
+
+        object.__setattr__(items[1], 'updated_at', None)
+        self.assertEqual(search_version(SearchParams()), (2, datetime(2022, 7, 21)))
+
+
+class TestCategoryCopyOnWriteRepository(unittest.TestCase):
+
+    def test_name_index_is_copied_on_write(self):
+        repo = CategoryCopyOnWriteRepository(use_name_index=True)
+        movie = Category(name='Movie')
+        repo.insert(movie)
+        snapshot = repo.snapshot
+
+        repo.insert(Category(name='Movies'))
+        self.assertEqual(snapshot.search(CategoryCopyOnWriteRepository.SearchParams(filter='movie')).total, 1)
+        self.assertEqual(repo.search(CategoryCopyOnWriteRepository.SearchParams(filter='movie')).total, 2)
+        self.assertIsNot(repo.snapshot.name_index, snapshot.name_index)
+
+
+class TestCategoryDurableRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.directory.cleanup)
+
+    def reopen(self, repo: CategoryDurableRepository, **kwargs) -> CategoryDurableRepository:
+        repo.close()
+        return CategoryDurableRepository(self.directory.name, **kwargs)
+
+    def test_replays_the_operation_log(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        movie = Category(name='Movie')
+        documentary = Category(name='Documentary', description='some description')
+        repo.insert(movie)
+        repo.bulk_insert([documentary, Category(name='Series')])
+        movie.update(name='Movies', description=None)
+        repo.update(movie)
+        repo.delete(repo.items[1].id)
+
+        restored = self.reopen(repo)
+        self.assertEqual(restored.items, [documentary, movie])
+        self.assertEqual(restored.find_by_id(movie.id).name, 'Movies')
+
+    def test_replays_bulk_updates_and_deletes(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        items = [Category(name='Movie'), Category(name='Series'), Category(name='Documentary')]
+        repo.items = items
+        items[0].update(name='Movies', description=None)
+        items[2].update(name='Documentaries', description=None)
+        repo.bulk_update([items[0], items[2]])
+        repo.bulk_delete([items[1].unique_entity_id])
+
+        restored = self.reopen(repo)
+        self.assertEqual(restored.items, [items[0], items[2]])
+        self.assertEqual(restored.find_by_id(items[2].id).name, 'Documentaries')
+
+    def test_restores_from_snapshot_and_newer_log_records(self):
+        repo = CategoryDurableRepository(self.directory.name, snapshot_every=2)
+        items = [Category(name=f'Movie {index}', is_active=index % 2 == 0) for index in range(5)]
+        for item in items:
+            repo.insert(item)
+
+        self.assertTrue((Path(self.directory.name) / 'snapshot').exists())
+        self.assertEqual(len(list(OperationLog.read(Path(self.directory.name) / 'operations.log'))), 1)
+        restored = self.reopen(repo, use_name_index=True)
+        self.assertEqual(restored.items, items)
+        self.assertEqual(type(restored.items[0].unique_entity_id), type(items[0].unique_entity_id))
+        self.assertEqual(
+            restored.search(CategoryDurableRepository.SearchParams(filter='movie 3')).items,
+            [items[3]]
+        )
+
+    def test_restores_a_snapshot_written_before_a_field_was_added(self):
+        entity_class, columns = EntityCodec(Category).encode([Category(name='Movie')])
+
+        restored = EntityCodec(entity_class).decode(columns[:-1])
+        self.assertEqual(restored[0].name, 'Movie')
+        self.assertEqual(restored[0].updated_at, restored[0].created_at)
+
+        repo = CategoryInMemoryRepository()
+        repo.items = [*restored, Category(name='Movie 2')]
+        self.assertEqual(CategoryRepository.search_version(repo, SearchParams())[0], 2)
+
+    def test_decodes_the_columns_by_their_field_names(self):
+        movie = Category(name='Movie', description='some description')
+        _, columns = EntityCodec(Category).encode([movie])
+        names = ['unique_entity_id', 'name', 'description', 'is_active', 'created_at', 'updated_at']
+
+        restored = EntityCodec(Category).decode(
+            [columns[0], ['legacy'], *reversed(columns[1:])], [names[0], 'legacy', *reversed(names[1:])]
+        )
+        self.assertEqual(restored, [movie])
+        self.assertEqual((restored[0].name, restored[0].description), ('Movie', 'some description'))
+
+    def test_a_failed_write_is_logged_and_skipped_on_replay(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        movie = Category(name='Movie')
+        with self.assertRaises(NotFoundException):
+            repo.update(movie)
+        repo.insert(movie)
+
+        log_path = Path(self.directory.name) / 'operations.log'
+        self.assertEqual(len(list(OperationLog.read(log_path))), 2)
+        self.assertEqual(self.reopen(repo).items, [movie])
+
+    def test_refuses_to_load_other_globals_from_the_log(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        repo.close()
+        log = OperationLog(Path(self.directory.name) / 'operations.log')
+        log.append(1, INSERT, pickle.dumps(os.getcwd))
+        log.close()
+
+        with self.assertRaises(pickle.UnpicklingError):
+            CategoryDurableRepository(self.directory.name)
+
+    def test_items_setter_writes_a_snapshot(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        repo.insert(Category(name='Old'))
+        items = [Category(name='Movie'), Category(name='Series')]
+        repo.items = items
+
+        self.assertEqual(self.reopen(repo).items, items)
+
+    def test_ignores_a_torn_record_at_the_end_of_the_log(self):
+        repo = CategoryDurableRepository(self.directory.name)
+        movie = Category(name='Movie')
+        repo.insert(movie)
+        repo.close()
+        log_path = Path(self.directory.name) / 'operations.log'
+        with open(log_path, 'ab') as file:
+            file.write(b'\x02\x00\x00')
+
+        restored = CategoryDurableRepository(self.directory.name)
+        self.assertEqual(restored.items, [movie])
+        series = Category(name='Series')
+        restored.insert(series)
+        self.assertEqual([record[0:2] for record in OperationLog.read(log_path)], [(1, INSERT), (2, INSERT)])
+        self.assertEqual(self.reopen(restored).items, [movie, series])
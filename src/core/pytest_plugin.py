@@ -1,4 +1,5 @@
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 import pytest
 import os
 from colorama import Fore, Style
@@ -19,6 +20,13 @@ def pytest_addoption(parser: pytest.Parser):
     )
 
 
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries): default budget of the query_budget fixture",
+    )
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_load_initial_conftests(
     early_config: pytest.Config,
@@ -41,4 +49,27 @@ def pytest_runtest_setup(item: pytest.Item):
 
     if group_option:
         if group_mark is None or group_option not in group_mark.args:
-            pytest.skip("test requires group {group_option}")
\ No newline at end of file
+            pytest.skip("test requires group {group_option}")
+
+
+@pytest.fixture
+def query_budget(request: pytest.FixtureRequest):
+    # with query_budget(2): ... fails the test when the block runs more than
+    # 2 SQL queries; without an argument the query_budget marker gives the budget
+    marker = request.node.get_closest_marker("query_budget")
+    default_budget = marker.args[0] if marker else None
+
+    @contextmanager
+    def within_budget(max_queries: Optional[int] = default_budget) -> Iterator:
+        from core.__seedwork.infra.django.query_budget import record_queries  # pylint: disable=import-outside-toplevel
+        with record_queries() as stats:
+            yield stats
+        if max_queries is not None and stats.count > max_queries:
+            queries = "\n".join(stats.sqls)
+            pytest.fail(
+                f"{stats.count} queries ran ({stats.seconds * 1000:.2f} ms), "
+                f"over the budget of {max_queries}:\n{queries}",
+                pytrace=False
+            )
+
+    return within_budget
@@ -1,11 +1,12 @@
 from pathlib import Path
 from typing import Dict, List
-from pydantic import BaseSettings, validator, Field
+from pydantic import BaseSettings, root_validator, validator, Field
 import os
 import dj_database_url
 
 _ENV_FOLDER = Path(__file__).resolve().parent.parent.parent / 'envs'
 _LIST_TYPE_VARIABLES = (
+    'database_replica_dsns',
     'installed_apps',
     'middlewares_additional'
 )
@@ -15,7 +16,32 @@ APP_ENV = os.getenv('APP_ENV')
 class ConfigService(BaseSettings):
 
     database_dsn: str
+    # seconds a connection is reused across requests, 0 closes it after each request
+    database_conn_max_age: int = 60
+    database_conn_health_checks: bool = True
     database_conn: Dict = Field(init=False, default=None)
+    database_replica_dsns: List[str] = []
+    database_replicas: Dict[str, Dict] = Field(init=False, default=None)
+    database_replica_pin_seconds: int = 5
+    # share the in-memory categories between threads through copy-on-write snapshots
+    in_memory_copy_on_write: bool = False
+    # send X-Query-Count and Server-Timing with DEBUG off too
+    query_count_headers: bool = False
+    # serve the categories endpoints with async views, for ASGI deployments
+    async_views: bool = False
+    # serve the categories from the database through CategoryCachedRepository
+    # instead of the in-memory repository
+    category_cache: bool = False
+    # seconds a category stays in the cache of CategoryCachedRepository
+    category_cache_ttl: int = 300
+    # CachedRepository drops the entries a write touches from the cache of the
+    # process that wrote; locmem is per process, so with CATEGORY_CACHE on and
+    # DEBUG off a shared backend (Redis, Memcached, database) is required
+    cache_backend: str = 'django.core.cache.backends.locmem.LocMemCache'
+    cache_location: str = ''
+    # share (0 to 1) of entities loaded by the repositories that are validated again;
+    # invalid ones are logged, or raise LoadEntityException at 1
+    entity_restore_validation_rate: float = 0.0
     debug: bool = True
     installed_apps: List[str]
     language_code: str = 'en-us'
@@ -33,7 +59,32 @@ class ConfigService(BaseSettings):
         
     @validator('database_conn', pre=True, allow_reuse=True)
     def make_database_conn(cls, v, values, **kwargs):  # pylint: disable=no-self-argument
-        return dj_database_url.config(default=values['database_dsn'])
+        return _with_connection_options(dj_database_url.config(default=values['database_dsn']), values)
+
+    @validator('database_replicas', pre=True, always=True, allow_reuse=True)
+    def make_database_replicas(cls, v, values, **kwargs):  # pylint: disable=no-self-argument
+        return {
+            f'replica_{index}': _with_connection_options(dj_database_url.parse(dsn), values)
+            for index, dsn in enumerate(values.get('database_replica_dsns', []))
+        }
+
+    @root_validator(skip_on_failure=True, allow_reuse=True)
+    def check_cache_backend(cls, values):  # pylint: disable=no-self-argument
+        is_local = values['cache_backend'].endswith('.LocMemCache')
+        if values['category_cache'] and not values['debug'] and is_local:
+            raise ValueError(
+                'CACHE_BACKEND LocMemCache is local to each process, so the other workers would keep '
+                'serving entries a write invalidated; set a shared backend for CATEGORY_CACHE when DEBUG is off'
+            )
+        return values
+
+
+def _with_connection_options(conn: Dict, values: Dict) -> Dict:
+    return {
+        **conn,
+        'CONN_MAX_AGE': values.get('database_conn_max_age', 0),
+        'CONN_HEALTH_CHECKS': values.get('database_conn_health_checks', False),
+    }
 
 
 config_service = ConfigService()
\ No newline at end of file
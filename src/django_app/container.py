@@ -1,5 +1,5 @@
 from dependency_injector import containers, providers
-from core.category.infra.in_memory.repositories import CategoryInMemoryRepository
+from core.category.infra.in_memory.repositories import CategoryCopyOnWriteRepository, CategoryInMemoryRepository
 from core.category.application.use_cases import (
     CreateCategoryUseCase,
     ListCategoriesUseCase,
@@ -7,33 +7,46 @@ from core.category.application.use_cases import (
     UpdateCategoryUseCase,
     DeleteCategoryUseCase,
 )
-from core.category.infra.django.repositories import CategoryDjangoRepository
+from core.category.infra.django.repositories import CategoryCachedRepository, CategoryDjangoRepository
+from django_app.config import config_service
 
 
 class Container(containers.DeclarativeContainer):
 
-    repository_category_in_memory = providers.Singleton(CategoryInMemoryRepository)
+    repository_category_in_memory = providers.Singleton(
+        CategoryCopyOnWriteRepository if config_service.in_memory_copy_on_write else CategoryInMemoryRepository,
+        use_name_index=True
+    )
 
     repository_category_django_orm = providers.Singleton(CategoryDjangoRepository)
 
+    repository_category_django_orm_cached = providers.Singleton(
+        CategoryCachedRepository, repository=repository_category_django_orm, ttl=config_service.category_cache_ttl
+    )
+
+    # every use case shares one repository, so the writes drop what the lookups cached
+    repository_category = repository_category_django_orm_cached \
+        if config_service.category_cache \
+        else repository_category_in_memory
+
     use_case_category_create_category = providers.Singleton(
-        CreateCategoryUseCase, category_repository=repository_category_in_memory
+        CreateCategoryUseCase, category_repository=repository_category
     )
 
     use_case_category_list_categories = providers.Singleton(
-        ListCategoriesUseCase, category_repository=repository_category_in_memory
+        ListCategoriesUseCase, category_repository=repository_category
     )
 
     use_case_category_get_category = providers.Singleton(
-        GetCategoryUseCase, category_repository=repository_category_in_memory
+        GetCategoryUseCase, category_repository=repository_category
     )
 
     use_case_category_update_category = providers.Singleton(
-        UpdateCategoryUseCase, category_repository=repository_category_in_memory
+        UpdateCategoryUseCase, category_repository=repository_category
     )
 
     use_case_category_delete_category = providers.Singleton(
-        DeleteCategoryUseCase, category_repository=repository_category_in_memory
+        DeleteCategoryUseCase, category_repository=repository_category
     )
 
 container = Container()
\ No newline at end of file
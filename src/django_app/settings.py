@@ -33,6 +33,7 @@ ALLOWED_HOSTS = []
 INSTALLED_APPS = config_service.installed_apps
 
 MIDDLEWARE = [
+    "core.__seedwork.infra.django.middlewares.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -40,9 +41,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.__seedwork.infra.django.middlewares.PrimaryPinningMiddleware",
     *config_service.middlewares_additional,
 ]
 
+# X-Query-Count and Server-Timing are sent with DEBUG on or when this is set,
+# see QueryBudgetMiddleware; they tell clients how much SQL a request ran
+QUERY_COUNT_HEADERS = config_service.query_count_headers
+
 ROOT_URLCONF = "django_app.urls"
 
 TEMPLATES = [
@@ -63,6 +69,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "django_app.wsgi.application"
 
+ASGI_APPLICATION = "django_app.asgi.application"
+
+ASYNC_VIEWS = config_service.async_views
+
 
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
@@ -71,10 +81,40 @@ DATABASES = {
     "default": {
         **config_service.database_conn,
         "TEST": config_service.database_conn,
+    },
+    # read-only copies of default; tests read them through default
+    **{
+        alias: {**conn, "TEST": {"MIRROR": "default"}}
+        for alias, conn in config_service.database_replicas.items()
+    },
+}
+
+DATABASE_REPLICAS = list(config_service.database_replicas)
+
+# apps whose reads PrimaryReplicaRouter sends to the replicas
+DATABASE_REPLICA_APP_LABELS = ["category"]
+
+# how long a client reads from default after a write, see PrimaryPinningMiddleware
+DATABASE_REPLICA_PIN_SECONDS = config_service.database_replica_pin_seconds
+
+DATABASE_ROUTERS = ["core.__seedwork.infra.django.db_routers.PrimaryReplicaRouter"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": config_service.cache_backend,
+        "LOCATION": config_service.cache_location,
     }
 }
 
 
+# entities are loaded without validation; a share of them is checked for corrupt data
+ENTITY_RESTORE_VALIDATION_RATE = config_service.entity_restore_validation_rate
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 